@@ -0,0 +1,133 @@
+"""
+Benchmark the columnar CSV conversion against the previous row-by-row loop.
+
+Builds a synthetic event results CSV (50,000 rows by default) by tiling the
+sample files in data/event_results/, then times converting and validating it
+with:
+
+- the previous pipeline: ``df.iterrows()``, a dict per row, recursive NaN
+  cleaning and one ``EventResultCreate`` validation per row
+- the columnar pipeline: ``build_event_result_records`` followed by a single
+  ``TypeAdapter(list[EventResultCreate])`` validation
+
+No HTTP requests are made; only the conversion and validation steps are timed.
+
+Usage:
+    python -m data.benchmark_csv_conversion [rows]
+"""
+
+import math
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+from icecream import ic
+from pydantic import ValidationError
+
+from data.round_processing import (
+    assign_points,
+    build_event_result_records,
+    validate_event_results,
+)
+from src.schemas.event_results import EventResultCreate
+
+DEFAULT_ROWS = 50_000
+DATE_VAL = "2025-04-30T18:00:00"
+
+
+def build_sample_csv(path: Path, rows: int, source_folder="data/event_results/"):
+    """
+    Write a CSV of the requested size by tiling the sample event result files.
+    """
+    frames = [pd.read_csv(csv_file) for csv_file in Path(source_folder).glob("*.csv")]
+    base = pd.concat(frames, ignore_index=True)
+    repeats = math.ceil(rows / len(base))
+    df = pd.concat([base] * repeats, ignore_index=True).head(rows)
+    df["username"] = df["username"].astype(str) + "_" + df.index.astype(str)
+    df.to_csv(path, index=False)
+
+
+def row_loop_conversion(df: pd.DataFrame) -> list[dict]:
+    """
+    The previous per-row conversion, kept here as the benchmark baseline.
+    """
+
+    def clean_nans(obj):
+        if isinstance(obj, dict):
+            return {k: clean_nans(v) for k, v in obj.items()}
+        if isinstance(obj, float) and (math.isnan(obj) or math.isinf(obj)):
+            return None
+        return obj
+
+    df.insert(0, "date", DATE_VAL)
+    df = df.loc[:, ~df.columns.str.startswith("hole_")]
+    df.loc[:, "position_raw"] = pd.to_numeric(
+        df["position_raw"], errors="coerce", downcast="float"
+    )
+    valid = []
+    for _, row in df.iterrows():
+        position_raw = row.get("position_raw")
+        has_position = not (
+            isinstance(position_raw, float) and math.isnan(position_raw)
+        )
+        event_result = {
+            "date": row.get("date"),
+            "division": row.get("division"),
+            "position": str(position_raw) if has_position else "",
+            "position_raw": float(position_raw) if has_position else None,
+            "name": row.get("name"),
+            "event_relative_score": row.get("event_relative_score"),
+            "event_total_score": row.get("event_total_score"),
+            "pdga_number": row.get("pdga_number"),
+            "username": row.get("username"),
+            "round_relative_score": row.get("round_relative_score"),
+            "round_total_score": row.get("round_total_score"),
+            "course_layout_id": 1,
+            "round_points": row.get("adjusted_points", 0.0),
+            "disc_event_id": 1,
+        }
+        event_result = clean_nans(event_result)
+        try:
+            EventResultCreate(**event_result)
+        except ValidationError:
+            continue
+        valid.append(event_result)
+    return valid
+
+
+def columnar_conversion(df: pd.DataFrame) -> list[EventResultCreate]:
+    """
+    The columnar conversion used by import_and_process_csv.
+    """
+    records = build_event_result_records(df, DATE_VAL, disc_event_id=1)
+    return validate_event_results(records)
+
+
+def run(rows: int = DEFAULT_ROWS) -> dict[str, float]:
+    """
+    Build the sample CSV and time both pipelines, returning seconds per
+    pipeline.
+    """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_path = Path(tmp_dir) / "benchmark.csv"
+        build_sample_csv(csv_path, rows)
+        df = assign_points(pd.read_csv(csv_path))
+
+    timings = {}
+    for label, convert in (
+        ("row_loop", row_loop_conversion),
+        ("columnar", columnar_conversion),
+    ):
+        start = time.perf_counter()
+        converted = convert(df.copy())
+        timings[label] = time.perf_counter() - start
+        ic(f"{label}: {len(converted)} rows in {timings[label]:.3f}s")
+    speedup = timings["row_loop"] / timings["columnar"]
+    ic(f"Speedup: {speedup:.1f}x")
+    return timings
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROWS)
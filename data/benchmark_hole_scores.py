@@ -0,0 +1,154 @@
+"""
+Benchmark packed hole score storage against a normalized hole_scores table.
+
+Generates synthetic 18-hole rounds (200,000 by default) and stores them in two
+SQLite database files:
+
+- normalized: one (event_result_id, hole_number, strokes) row per hole, the
+  layout used before scores were packed
+- packed: one int8 blob per round in the event_results.hole_scores column
+
+For each it reports the file size and the time to compute the scoring
+average of every hole: a GROUP BY over the normalized rows, and a
+``hole_score_matrix`` column mean over the packed blobs.
+
+Usage:
+    python -m data.benchmark_hole_scores [rounds]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+from icecream import ic
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    SmallInteger,
+    Table,
+    create_engine,
+    func,
+    insert,
+    select,
+    type_coerce,
+)
+
+from src.models.hole_score import HoleScores, hole_score_matrix
+
+DEFAULT_ROUNDS = 200_000
+HOLES = 18
+BATCH_SIZE = 10_000
+
+metadata = MetaData()
+normalized_table = Table(
+    "hole_scores",
+    metadata,
+    Column("event_result_id", Integer, primary_key=True),
+    Column("hole_number", SmallInteger, primary_key=True),
+    Column("strokes", SmallInteger, nullable=False),
+)
+packed_table = Table(
+    "event_results",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("hole_scores", HoleScores),
+)
+
+
+def build_rounds(rounds: int, seed: int = 0) -> np.ndarray:
+    """
+    Random strokes around par 3 for the requested number of rounds.
+    """
+    rng = np.random.default_rng(seed)
+    return rng.choice(
+        [2, 3, 4, 5, 6], size=(rounds, HOLES), p=[0.1, 0.5, 0.3, 0.08, 0.02]
+    ).astype(np.int8)
+
+
+def load_normalized(engine, strokes: np.ndarray) -> None:
+    """
+    Write one row per hole.
+    """
+    rows = [
+        {"event_result_id": i, "hole_number": hole + 1, "strokes": int(value)}
+        for i, round_strokes in enumerate(strokes, start=1)
+        for hole, value in enumerate(round_strokes)
+    ]
+    with engine.begin() as conn:
+        for start in range(0, len(rows), BATCH_SIZE):
+            conn.execute(insert(normalized_table), rows[start : start + BATCH_SIZE])
+
+
+def load_packed(engine, strokes: np.ndarray) -> None:
+    """
+    Write one packed row per round.
+    """
+    rows = [
+        {"id": i, "hole_scores": round_strokes}
+        for i, round_strokes in enumerate(strokes, start=1)
+    ]
+    with engine.begin() as conn:
+        for start in range(0, len(rows), BATCH_SIZE):
+            conn.execute(insert(packed_table), rows[start : start + BATCH_SIZE])
+
+
+def normalized_averages(engine) -> np.ndarray:
+    """
+    Per-hole scoring average with GROUP BY over the normalized rows.
+    """
+    with engine.connect() as conn:
+        rows = conn.execute(
+            select(normalized_table.c.hole_number, func.avg(normalized_table.c.strokes))
+            .group_by(normalized_table.c.hole_number)
+            .order_by(normalized_table.c.hole_number)
+        ).all()
+    return np.array([average for _, average in rows])
+
+
+def packed_averages(engine) -> np.ndarray:
+    """
+    Per-hole scoring average as a column mean over the packed rounds.
+    """
+    with engine.connect() as conn:
+        packed = type_coerce(packed_table.c.hole_scores, HoleScores(raw=True))
+        matrix = hole_score_matrix(conn.scalars(select(packed)))
+    return matrix.mean(axis=0)
+
+
+def run(rounds: int = DEFAULT_ROUNDS) -> dict[str, dict[str, float]]:
+    """
+    Store the same rounds both ways and compare size and aggregation time.
+    :return: File size in bytes and aggregation seconds per layout.
+    """
+    strokes = build_rounds(rounds)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for label, load, aggregate in (
+            ("normalized", load_normalized, normalized_averages),
+            ("packed", load_packed, packed_averages),
+        ):
+            path = Path(tmp_dir) / f"{label}.db"
+            engine = create_engine(f"sqlite:///{path}")
+            metadata.create_all(engine)
+            load(engine, strokes)
+            start = time.perf_counter()
+            averages = aggregate(engine)
+            seconds = time.perf_counter() - start
+            engine.dispose()
+            np.testing.assert_allclose(averages, strokes.mean(axis=0))
+            results[label] = {"bytes": path.stat().st_size, "seconds": seconds}
+            ic(
+                f"{label}: {path.stat().st_size / 1e6:.1f} MB, "
+                f"hole averages in {seconds * 1000:.0f} ms"
+            )
+    smaller = results["normalized"]["bytes"] / results["packed"]["bytes"]
+    faster = results["normalized"]["seconds"] / results["packed"]["seconds"]
+    ic(f"packed is {smaller:.1f}x smaller and {faster:.1f}x faster to aggregate")
+    return results
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_ROUNDS)
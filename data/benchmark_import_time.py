@@ -0,0 +1,62 @@
+"""
+Profile the import time of the API with ``python -X importtime``.
+
+Imports a module (src.main by default) in a fresh interpreter and reports
+its total import time and the modules that took longest, counting what each
+imported in turn. A first import writes the bytecode caches so that
+compiling is not timed.
+
+Usage:
+    python -m data.benchmark_import_time [module] [top]
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from icecream import ic
+
+DEFAULT_MODULE = "src.main"
+DEFAULT_TOP = 15
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def import_profile(module: str = DEFAULT_MODULE) -> dict[str, tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter with -X importtime.
+    :return: Self and cumulative microseconds of every module imported.
+    """
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    subprocess.run(command, cwd=ROOT, check=True, capture_output=True)
+    output = subprocess.run(
+        command, cwd=ROOT, check=True, capture_output=True, text=True
+    ).stderr
+    profile = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if self_us.strip().isdigit():
+            profile[name.strip()] = (int(self_us), int(cumulative_us))
+    return profile
+
+
+def run(module: str = DEFAULT_MODULE, top: int = DEFAULT_TOP) -> float:
+    """
+    Print a module's import time and its slowest imports.
+    :return: Import time of the module in seconds.
+    """
+    profile = import_profile(module)
+    seconds = profile[module][1] / 1e6
+    ic(f"import {module}: {seconds * 1000:.0f} ms, {len(profile)} modules")
+    slowest = sorted(profile.items(), key=lambda item: item[1][1], reverse=True)
+    for name, (self_us, cumulative_us) in slowest[1 : top + 1]:
+        ic(f"{name}: {cumulative_us / 1000:.0f} ms ({self_us / 1000:.0f} ms self)")
+    return seconds
+
+
+if __name__ == "__main__":
+    run(
+        sys.argv[1] if len(sys.argv) > 1 else DEFAULT_MODULE,
+        int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_TOP,
+    )
@@ -0,0 +1,491 @@
+"""
+Direct-to-database bulk loader for backfills.
+
+Instead of pushing every course, disc event and result through the REST API
+one request at a time, this loader writes straight through
+``src.core.db.engine`` in a single transaction:
+
+1. Files are read and validated with the same Pydantic schemas the API uses
+   (``CourseCreate``, ``DiscEventCreate``, ``EventResultCreate``).
+2. Rows are written into temporary staging tables, using ``COPY`` on Postgres
+   and batched ``insert().values()`` statements elsewhere (SQLite).
+3. One set-based ``INSERT ... SELECT`` per table merges the staged rows into
+   the real tables, skipping rows that already exist under the same natural
+   key the API uses for its 409 checks (course name, disc event name,
+   result date + username). Layouts and holes are matched to their parents by
+   course name and layout name, and the derived metrics of the merged
+   layouts are recomputed from their holes, as are the leaderboards of the
+   disc events that received results.
+
+Usage:
+    python -m data.bulk_load [--courses DIR] [--disc-events DIR]
+                             [--event-results DIR] [--batch-size N]
+"""
+
+import argparse
+import json
+import os
+
+import pandas as pd
+from icecream import ic
+from pydantic import ValidationError
+from sqlalchemy import (
+    Column,
+    Connection,
+    Engine,
+    MetaData,
+    String,
+    Table,
+    and_,
+    bindparam,
+    exists,
+    insert,
+    select,
+    update,
+)
+
+from data.course_processing import load_course
+from data.disc_event_index import DiscEventIndex
+from data.parallel_ingest import discover_result_files
+from data.round_processing import load_event_results
+from src.core.db import engine
+from src.crud.course_layout import layout_metrics
+from src.crud.leaderboard import refresh_leaderboard
+from src.models import Course, CourseLayout, DiscEvent, EventResult, Hole
+from src.models.hole_score import encode_hole_scores
+from src.schemas import CourseCreate, DiscEventCreate, EventResultCreate
+
+BATCH_SIZE = 1000
+
+courses_table = Course.__table__
+layouts_table = CourseLayout.__table__
+holes_table = Hole.__table__
+disc_events_table = DiscEvent.__table__
+event_results_table = EventResult.__table__
+
+
+def _staging_table(
+    metadata: MetaData, target: Table, exclude: set[str], *extra: Column
+) -> Table:
+    """
+    Build a temporary, constraint-free copy of target's columns (minus the
+    excluded ones) plus any extra key columns needed for the merge.
+    """
+    columns = [
+        Column(column.name, column.type)
+        for column in target.columns
+        if column.name not in exclude
+    ]
+    return Table(
+        f"bulk_stage_{target.name}",
+        metadata,
+        *columns,
+        *extra,
+        prefixes=["TEMPORARY"],
+    )
+
+
+def _copy_rows(conn: Connection, table: Table, rows: list[dict]) -> None:
+    """
+    Stream rows into a staging table with Postgres COPY.
+    """
+    columns = [column.name for column in table.columns]
+    column_list = ", ".join(columns)
+    cursor = conn.connection.dbapi_connection.cursor()
+    with cursor.copy(f"COPY {table.name} ({column_list}) FROM STDIN") as copy:
+        for row in rows:
+            copy.write_row([row.get(column) for column in columns])
+
+
+def write_rows(
+    conn: Connection, table: Table, rows: list[dict], batch_size: int = BATCH_SIZE
+) -> None:
+    """
+    Write rows to a staging table: COPY on Postgres, multi-row
+    insert().values() batches on other dialects.
+    """
+    if not rows:
+        return
+    if conn.dialect.name == "postgresql":
+        _copy_rows(conn, table, rows)
+        return
+    for start in range(0, len(rows), batch_size):
+        conn.execute(insert(table).values(rows[start : start + batch_size]))
+
+
+def _dedupe(rows: list[dict], *keys: str) -> list[dict]:
+    """
+    Keep the last row for each natural key so staging holds unique keys.
+    """
+    return list({tuple(row[key] for key in keys): row for row in rows}.values())
+
+
+def merge_courses(
+    conn: Connection,
+    metadata: MetaData,
+    courses: list[CourseCreate],
+    batch_size: int = BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Stage courses, layouts and holes and merge them into the real tables.
+    """
+    stage_courses = _staging_table(metadata, courses_table, {"id"})
+    stage_layouts = _staging_table(
+        metadata,
+        layouts_table,
+        {"id", "course_id"},
+        Column("course_name", String),
+    )
+    stage_holes = _staging_table(
+        metadata,
+        holes_table,
+        {"id", "layout_id"},
+        Column("course_name", String),
+        Column("layout_name", String),
+    )
+    metadata.create_all(conn, tables=[stage_courses, stage_layouts, stage_holes])
+
+    course_rows, layout_rows, hole_rows = [], [], []
+    for course in courses:
+        course_rows.append(course.model_dump(exclude={"layouts"}))
+        for layout in course.layouts:
+            layout_rows.append(
+                {**layout.model_dump(exclude={"holes"}), "course_name": course.name}
+            )
+            for hole in layout.holes:
+                hole_rows.append(
+                    {
+                        **hole.model_dump(),
+                        "course_name": course.name,
+                        "layout_name": layout.name,
+                    }
+                )
+    write_rows(conn, stage_courses, _dedupe(course_rows, "name"), batch_size)
+    write_rows(
+        conn, stage_layouts, _dedupe(layout_rows, "course_name", "name"), batch_size
+    )
+    write_rows(
+        conn,
+        stage_holes,
+        _dedupe(hole_rows, "course_name", "layout_name", "hole_name"),
+        batch_size,
+    )
+
+    course_columns = [column.name for column in stage_courses.columns]
+    courses_result = conn.execute(
+        insert(courses_table).from_select(
+            course_columns,
+            select(*stage_courses.columns).where(
+                ~exists().where(courses_table.c.name == stage_courses.c.name)
+            ),
+        )
+    )
+
+    layouts_result = conn.execute(
+        insert(layouts_table).from_select(
+            ["name", "par", "length", "difficulty", "course_id"],
+            select(
+                stage_layouts.c.name,
+                stage_layouts.c.par,
+                stage_layouts.c.length,
+                stage_layouts.c.difficulty,
+                courses_table.c.id,
+            )
+            .select_from(
+                stage_layouts.join(
+                    courses_table,
+                    courses_table.c.name == stage_layouts.c.course_name,
+                )
+            )
+            .where(
+                ~exists().where(
+                    and_(
+                        layouts_table.c.course_id == courses_table.c.id,
+                        layouts_table.c.name == stage_layouts.c.name,
+                    )
+                )
+            ),
+        )
+    )
+
+    holes_result = conn.execute(
+        insert(holes_table).from_select(
+            ["hole_name", "par", "distance", "layout_id"],
+            select(
+                stage_holes.c.hole_name,
+                stage_holes.c.par,
+                stage_holes.c.distance,
+                layouts_table.c.id,
+            )
+            .select_from(
+                stage_holes.join(
+                    courses_table,
+                    courses_table.c.name == stage_holes.c.course_name,
+                ).join(
+                    layouts_table,
+                    and_(
+                        layouts_table.c.course_id == courses_table.c.id,
+                        layouts_table.c.name == stage_holes.c.layout_name,
+                    ),
+                )
+            )
+            .where(
+                ~exists().where(
+                    and_(
+                        holes_table.c.layout_id == layouts_table.c.id,
+                        holes_table.c.hole_name == stage_holes.c.hole_name,
+                    )
+                )
+            ),
+        )
+    )
+    refresh_layout_metrics(conn, stage_layouts)
+    return {
+        "courses": courses_result.rowcount,
+        "course_layouts": layouts_result.rowcount,
+        "holes": holes_result.rowcount,
+    }
+
+
+def refresh_layout_metrics(conn: Connection, stage_layouts: Table) -> None:
+    """
+    Recompute the stored metrics of every staged layout from its holes.
+    """
+    layout_ids = (
+        select(layouts_table.c.id)
+        .join(courses_table, courses_table.c.id == layouts_table.c.course_id)
+        .join(
+            stage_layouts,
+            and_(
+                stage_layouts.c.course_name == courses_table.c.name,
+                stage_layouts.c.name == layouts_table.c.name,
+            ),
+        )
+    )
+    holes: dict[int, list[tuple]] = {
+        layout_id: [] for layout_id in conn.scalars(layout_ids)
+    }
+    rows = conn.execute(
+        select(holes_table.c.layout_id, holes_table.c.par, holes_table.c.distance)
+        .where(holes_table.c.layout_id.in_(layout_ids))
+        .order_by(holes_table.c.id)
+    )
+    for layout_id, par, distance in rows:
+        holes[layout_id].append((par, distance))
+    if not holes:
+        return
+    conn.execute(
+        update(layouts_table).where(layouts_table.c.id == bindparam("layout_id")),
+        [
+            {"layout_id": layout_id, **layout_metrics(layout_holes)}
+            for layout_id, layout_holes in holes.items()
+        ],
+    )
+
+
+def merge_disc_events(
+    conn: Connection,
+    metadata: MetaData,
+    disc_events: list[DiscEventCreate],
+    batch_size: int = BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Stage disc events and merge the ones whose name is not taken yet.
+    """
+    stage = _staging_table(metadata, disc_events_table, {"id"})
+    metadata.create_all(conn, tables=[stage])
+    rows = [disc_event.model_dump() for disc_event in disc_events]
+    write_rows(conn, stage, _dedupe(rows, "name"), batch_size)
+    result = conn.execute(
+        insert(disc_events_table).from_select(
+            [column.name for column in stage.columns],
+            select(*stage.columns).where(
+                ~exists().where(disc_events_table.c.name == stage.c.name)
+            ),
+        )
+    )
+    return {"disc_events": result.rowcount}
+
+
+def merge_event_results(
+    conn: Connection,
+    metadata: MetaData,
+    event_results: list[EventResultCreate],
+    batch_size: int = BATCH_SIZE,
+) -> dict[str, int]:
+    """
+    Stage event results and merge the ones not already recorded for the same
+    date and username. Rows referencing a missing disc event or course
+    layout are left out, as the API would reject them.
+    """
+    stage = _staging_table(metadata, event_results_table, {"id"})
+    metadata.create_all(conn, tables=[stage])
+    rows = []
+    for event_result in event_results:
+        row = event_result.model_dump()
+        # Packed with 0 for unscored holes, which COPY can write as an array.
+        row["hole_scores"] = encode_hole_scores(row["hole_scores"]).tolist() or None
+        rows.append(row)
+    write_rows(conn, stage, _dedupe(rows, "date", "username"), batch_size)
+    result = conn.execute(
+        insert(event_results_table).from_select(
+            [column.name for column in stage.columns],
+            select(*stage.columns).where(
+                ~exists().where(
+                    and_(
+                        event_results_table.c.date == stage.c.date,
+                        event_results_table.c.username == stage.c.username,
+                    )
+                ),
+                exists().where(disc_events_table.c.id == stage.c.disc_event_id),
+                exists().where(layouts_table.c.id == stage.c.course_layout_id),
+            ),
+        )
+    )
+    for disc_event_id in conn.scalars(select(stage.c.disc_event_id).distinct()):
+        refresh_leaderboard(conn, disc_event_id)
+    return {"event_results": result.rowcount}
+
+
+def read_courses(data_directory: str) -> list[CourseCreate]:
+    """
+    Read and validate every course JSON file in a directory.
+    """
+    courses = []
+    for filename in sorted(os.listdir(data_directory)):
+        if filename.endswith(".json"):
+            try:
+                courses.append(load_course(os.path.join(data_directory, filename)))
+            except (KeyError, ValidationError) as e:
+                ic(f"Skipping {filename}: {e}")
+    return courses
+
+
+def read_disc_events(data_directory: str) -> list[DiscEventCreate]:
+    """
+    Read and validate every disc event JSON file in a directory.
+    """
+    disc_events = []
+    for filename in sorted(os.listdir(data_directory)):
+        if filename.endswith(".json"):
+            with open(os.path.join(data_directory, filename), encoding="utf-8") as f:
+                try:
+                    disc_events.append(DiscEventCreate.model_validate(json.load(f)))
+                except ValidationError as e:
+                    ic(f"Skipping {filename}: {e}")
+    return disc_events
+
+
+def read_event_results(
+    folder_path: str, disc_event_index: DiscEventIndex
+) -> list[EventResultCreate]:
+    """
+    Read, score and validate every CSV/XLSX results file in a folder.
+    """
+    event_results = []
+    for path in discover_result_files(folder_path):
+        try:
+            if path.suffix == ".xlsx":
+                df = pd.read_excel(path)
+            else:
+                df = pd.read_csv(path)
+            event_results.extend(load_event_results(df, path, disc_event_index))
+        except (
+            pd.errors.EmptyDataError,
+            pd.errors.ParserError,
+            OSError,
+            ValueError,
+            KeyError,
+        ) as e:
+            ic(f"Skipping {path}: {e}")
+    return event_results
+
+
+def load_disc_event_index_from_db(conn: Connection) -> DiscEventIndex:
+    """
+    Build the date-range index from the disc_events table.
+    """
+    rows = conn.execute(
+        select(
+            disc_events_table.c.id,
+            disc_events_table.c.start_date,
+            disc_events_table.c.end_date,
+        )
+    ).all()
+    return DiscEventIndex(
+        [
+            {
+                "id": row.id,
+                "start_date": row.start_date.isoformat(),
+                "end_date": row.end_date.isoformat(),
+            }
+            for row in rows
+        ]
+    )
+
+
+def bulk_load(
+    courses_dir: str | None = "data/courses/",
+    disc_events_dir: str | None = "data/disc_events/",
+    event_results_dir: str | None = "data/event_results/",
+    batch_size: int = BATCH_SIZE,
+    db_engine: Engine = engine,
+) -> dict[str, int]:
+    """
+    Load courses, disc events and event results in one transaction.
+    Passing None for a directory skips that step.
+    :return: Number of rows inserted per table.
+    """
+    counts: dict[str, int] = {}
+    metadata = MetaData()
+    with db_engine.begin() as conn:
+        if courses_dir:
+            counts.update(
+                merge_courses(conn, metadata, read_courses(courses_dir), batch_size)
+            )
+        if disc_events_dir:
+            counts.update(
+                merge_disc_events(
+                    conn, metadata, read_disc_events(disc_events_dir), batch_size
+                )
+            )
+        if event_results_dir:
+            disc_event_index = load_disc_event_index_from_db(conn)
+            event_results = read_event_results(event_results_dir, disc_event_index)
+            counts.update(
+                merge_event_results(conn, metadata, event_results, batch_size)
+            )
+        metadata.drop_all(conn)
+    ic(counts)
+    return counts
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line options for the bulk loader.
+    """
+    parser = argparse.ArgumentParser(
+        description="Bulk load data files directly into the database."
+    )
+    parser.add_argument("--courses", default="data/courses/")
+    parser.add_argument("--disc-events", default="data/disc_events/")
+    parser.add_argument("--event-results", default="data/event_results/")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """
+    Run the bulk loader against the configured database engine.
+    """
+    args = parse_args(argv)
+    bulk_load(
+        courses_dir=args.courses,
+        disc_events_dir=args.disc_events,
+        event_results_dir=args.event_results,
+        batch_size=args.batch_size,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 """
 Shared HTTP client and centralized request/exception handling for
-data modules. Provides get_json and post_json helpers using a common
-base URL and consistent error handling.
+data modules. Provides get_json, post_json, put_json and patch_json helpers
+using a common base URL and consistent error handling.
 """
 
 import httpx
@@ -23,6 +23,10 @@ def _request_json(method, url, *, params=None, json=None, headers=None):
                 response = client.get(url, params=params, headers=headers)
             elif method == "POST":
                 response = client.post(url, json=json, headers=headers)
+            elif method == "PUT":
+                response = client.put(url, json=json, headers=headers)
+            elif method == "PATCH":
+                response = client.patch(url, json=json, headers=headers)
             else:
                 return None, f"Unsupported HTTP method: {method}"
             response.raise_for_status()
@@ -50,3 +54,19 @@ def post_json(url, json=None, headers=None):
     Returns (response, error) tuple. Only one will be non-None.
     """
     return _request_json("POST", url, json=json, headers=headers)
+
+
+def put_json(url, json=None, headers=None):
+    """
+    Helper to PUT JSON using the shared client, with centralized exception handling.
+    Returns (response, error) tuple. Only one will be non-None.
+    """
+    return _request_json("PUT", url, json=json, headers=headers)
+
+
+def patch_json(url, json=None, headers=None):
+    """
+    Helper to PATCH JSON using the shared client, with centralized exception handling.
+    Returns (response, error) tuple. Only one will be non-None.
+    """
+    return _request_json("PATCH", url, json=json, headers=headers)
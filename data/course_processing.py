@@ -5,58 +5,183 @@ This script reads course data from a JSON file, validates it using Pydantic sche
 and sends it to the API endpoint for course creation. It includes error handling for
 common issues such as missing keys, validation errors, and HTTP request failures.
 
-Intended for use in development and testing of the course creation API.
+Intended for use in development and testing of the course creation API. Courses
+are sent to the bulk endpoint in batches; courses that already exist are updated
+in place through PATCH /courses/id/{id}, layouts and holes included. When an
+ImportManifest is given, files unchanged since their last successful import are
+skipped without parsing, and a file is only recorded as done once its course,
+layouts and holes are written.
 """
 
 import json
 import os
+from urllib.parse import quote
 
 from icecream import ic
 from pydantic import ValidationError
 
-from data.client import post_json
+from data.client import get_json, patch_json, post_json
+from data.import_manifest import ImportManifest, file_digest
 from src.schemas.courses import CourseCreate
 
 
-def create_courses(data_directory: str = "data/courses/") -> None:
+def load_course(file_path: str) -> CourseCreate:
     """
-    Test creating a course.
+    Read a course JSON file and validate it as a CourseCreate, keeping only
+    the layout and hole fields the API accepts.
     """
+    with open(file_path, encoding="utf-8") as f:
+        course_data = json.load(f)
+    try:
+        course_data["layouts"] = [
+            {
+                "name": layout["name"],
+                "par": layout["par"],
+                "length": layout["length"],
+                "difficulty": layout["difficulty"],
+                "holes": [
+                    {
+                        "hole_name": hole["hole_name"],
+                        "par": hole["par"],
+                        "distance": hole["distance"],
+                    }
+                    for hole in layout["holes"]
+                ],
+            }
+            for layout in course_data["layouts"]
+        ]
+    except KeyError as e:
+        ic(f"KeyError: {e}")
+        raise
+    try:
+        return CourseCreate.model_validate(course_data)
+    except ValidationError as e:
+        ic(f"ValidationError: {e}")
+        raise
+
+
+BULK_BATCH_SIZE = 100
+
+
+def _take_by_name(stored: dict[str, list[dict]], name: str) -> dict | None:
+    """
+    Take the first stored row with the name, so that each row is matched once.
+    """
+    rows = stored.get(name)
+    return rows.pop(0) if rows else None
+
+
+def build_course_patch(course: CourseCreate, existing: dict) -> dict:
+    """
+    Build the PATCH /courses/id/{id} body that makes a stored course match
+    the course read from file. Layouts are matched to the stored ones by
+    name and holes by hole_name, and sent with their ids so they are updated
+    in place; unmatched ones are created and stored ones left out are
+    deleted.
+    :param course: The course read from file.
+    :param existing: The stored course, as returned by the API.
+    :return: The patch body.
+    """
+    stored_layouts: dict[str, list[dict]] = {}
+    for layout in existing.get("layouts", []):
+        stored_layouts.setdefault(layout["name"], []).append(layout)
+    layouts = []
+    for layout in course.layouts:
+        layout_patch = layout.model_dump(mode="json", exclude={"holes"})
+        stored_layout = _take_by_name(stored_layouts, layout.name)
+        stored_holes: dict[str, list[dict]] = {}
+        if stored_layout:
+            layout_patch["id"] = stored_layout["id"]
+            for hole in stored_layout.get("holes", []):
+                stored_holes.setdefault(hole["hole_name"], []).append(hole)
+        layout_patch["holes"] = []
+        for hole in layout.holes:
+            hole_patch = hole.model_dump(mode="json")
+            stored_hole = _take_by_name(stored_holes, hole.hole_name)
+            if stored_hole:
+                hole_patch["id"] = stored_hole["id"]
+            layout_patch["holes"].append(hole_patch)
+        layouts.append(layout_patch)
+    return {**course.model_dump(mode="json", exclude={"layouts"}), "layouts": layouts}
+
+
+def update_course(course: CourseCreate) -> bool:
+    """
+    Update the existing course with the same name, including its layouts
+    and holes, in one transaction.
+    """
+    existing, error = get_json(f"/courses/name/{quote(course.name)}")
+    if error:
+        ic(f"Could not find course {course.name}: {error}")
+        return False
+    existing = existing.json()
+    _, error = patch_json(
+        f"/courses/id/{existing["id"]}", json=build_course_patch(course, existing)
+    )
+    if error:
+        ic(f"Could not update course {course.name}: {error}")
+        return False
+    return True
+
+
+def upsert_course(course: CourseCreate) -> bool:
+    """
+    Create a course, or update the existing course with the same name.
+    """
+    _, error = post_json(url="/courses/", json=course.model_dump(mode="json"))
+    return not error or update_course(course)
+
+
+def upsert_courses(courses: list[CourseCreate]) -> dict[str, bool]:
+    """
+    Create courses through the bulk endpoint, then update the ones that
+    already exist.
+    :param courses: Courses to import.
+    :return: Whether each course, by name, was imported.
+    """
+    imported = {}
+    for start in range(0, len(courses), BULK_BATCH_SIZE):
+        batch = courses[start : start + BULK_BATCH_SIZE]
+        payload = {"courses": [course.model_dump(mode="json") for course in batch]}
+        response, error = post_json(url="/courses/bulk", json=payload)
+        if error:
+            ic(f"Bulk course import failed, importing one by one: {error}")
+            imported.update((course.name, upsert_course(course)) for course in batch)
+            continue
+        result = response.json()
+        conflicts = set(result["conflicts"])
+        ic(f"Created {result["created"]} courses")
+        for course in batch:
+            imported[course.name] = (
+                update_course(course) if course.name in conflicts else True
+            )
+    return imported
+
+
+def create_courses(
+    data_directory: str = "data/courses/", manifest: ImportManifest | None = None
+) -> None:
+    """
+    Create or update a course for every JSON file in the directory.
+    """
+    loaded = []
     for filename in os.listdir(data_directory):
         if filename.endswith(".json"):
-            with open(os.path.join(data_directory, filename), encoding="utf-8") as f:
-                course_data = json.load(f)
-                try:
-                    course_data["layouts"] = [
-                        {
-                            "name": layout["name"],
-                            "par": layout["par"],
-                            "length": layout["length"],
-                            "difficulty": layout["difficulty"],
-                            "holes": [
-                                {
-                                    "hole_name": hole["hole_name"],
-                                    "par": hole["par"],
-                                    "distance": hole["distance"],
-                                }
-                                for hole in layout["holes"]
-                            ],
-                        }
-                        for layout in course_data["layouts"]
-                    ]
-                except KeyError as e:
-                    ic(f"KeyError: {e}")
-                    raise
-                try:
-                    course_data_model = CourseCreate.model_validate(course_data)
-                    ic(course_data_model)
-                except ValidationError as e:
-                    ic(f"ValidationError: {e}")
-                    raise
-                post_json(
-                    url="/courses/",
-                    json=course_data_model.model_dump(mode="json"),
-                )
+            file_path = os.path.join(data_directory, filename)
+            digest = file_digest(file_path)
+            if manifest and manifest.is_unchanged(file_path, digest):
+                ic(f"Skipping unchanged file: {file_path}")
+                continue
+            loaded.append((file_path, digest, load_course(file_path)))
+    imported = upsert_courses([course for _, _, course in loaded])
+    if manifest:
+        for file_path, digest, course in loaded:
+            manifest.record(
+                file_path,
+                digest,
+                "done" if imported[course.name] else "failed",
+                {course.name: course.model_dump(mode="json")},
+            )
 
 
 if __name__ == "__main__":
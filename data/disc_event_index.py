@@ -0,0 +1,124 @@
+"""
+In-memory interval index of disc event date ranges.
+
+The CSV importer needs to map every round date to the disc event whose
+start/end range contains it. Rather than downloading the disc event list for
+every file, the index is loaded once per import run (paging through
+/disc-events/ so it is not capped by the default limit) and shared across all
+files. Lookups bisect the events sorted by start date, so resolving a date is
+O(log n) when event ranges do not overlap.
+"""
+
+import bisect
+import datetime
+
+from icecream import ic
+
+from data.client import get_json
+
+PAGE_SIZE = 100
+
+
+def _parse_datetime(value: str) -> datetime.datetime:
+    """
+    Parse an ISO datetime string into a naive UTC datetime.
+    """
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+class DiscEventIndex:
+    """
+    Sorted interval index over disc event (start_date, end_date) ranges.
+
+    Events are kept sorted by start date alongside a running maximum of end
+    dates, so a lookup bisects to the last event starting on or before the
+    date and only walks backwards while an earlier event could still contain
+    it.
+    """
+
+    def __init__(self, disc_events: list[dict]):
+        events = sorted(
+            (
+                (
+                    _parse_datetime(event["start_date"]),
+                    _parse_datetime(event["end_date"]),
+                    event["id"],
+                )
+                for event in disc_events
+            ),
+            key=lambda item: (item[0], item[2]),
+        )
+        self._starts = [start for start, _, _ in events]
+        self._ends = [end for _, end, _ in events]
+        self._ids = [event_id for _, _, event_id in events]
+        self._max_ends: list[datetime.datetime] = []
+        for end in self._ends:
+            self._max_ends.append(
+                max(end, self._max_ends[-1]) if self._max_ends else end
+            )
+        self.fallback_id = (
+            min(event["id"] for event in disc_events) if disc_events else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def find(self, date: datetime.datetime) -> int | None:
+        """
+        Return the ID of the latest-starting disc event containing date.
+        """
+        if date.tzinfo is not None:
+            date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+        i = bisect.bisect_right(self._starts, date) - 1
+        while i >= 0 and self._max_ends[i] >= date:
+            if self._ends[i] >= date:
+                return self._ids[i]
+            i -= 1
+        return None
+
+    def resolve(self, event_date: str) -> int:
+        """
+        Resolve an ISO date string to a disc event ID, falling back to the
+        first available disc event, or 1 when no events are loaded.
+        """
+        try:
+            event_id = self.find(_parse_datetime(event_date))
+        except ValueError as e:
+            ic(f"Invalid event date {event_date}: {e}")
+            event_id = None
+        if event_id is not None:
+            return event_id
+        if self.fallback_id is not None:
+            ic(
+                f"No matching disc event found for {event_date}, using first "
+                f"available disc event ID: {self.fallback_id}"
+            )
+            return self.fallback_id
+        ic(f"Falling back to event session ID 1 for date {event_date}")
+        return 1
+
+
+def load_disc_event_index(page_size: int = PAGE_SIZE) -> DiscEventIndex:
+    """
+    Page through /disc-events/ and build a DiscEventIndex from every event.
+    An empty index is returned if the API cannot be reached.
+    """
+    disc_events: list[dict] = []
+    skip = 0
+    while True:
+        response, error = get_json(
+            "/disc-events/", params={"skip": skip, "limit": page_size}
+        )
+        if error:
+            ic(f"Error loading disc events: {error}")
+            break
+        page = response.json()
+        disc_events.extend(page)
+        if len(page) < page_size:
+            break
+        skip += page_size
+    ic(f"Loaded {len(disc_events)} disc events into the date index")
+    return DiscEventIndex(disc_events)
@@ -4,23 +4,56 @@ Functions for processing and posting disc golf event session data to the API.
 This module reads event session data from JSON files in a specified directory,
 validates the data using Pydantic schemas, and posts valid event sessions to the API.
 It provides comprehensive error handling for validation and HTTP request failures,
-and processes all JSON files in the directory.
+and processes all JSON files in the directory. When an ImportManifest is given,
+files unchanged since their last successful import are skipped without parsing,
+and events that already exist are updated in place.
 """
 
 import json
 import os
+from urllib.parse import quote
 
 from icecream import ic
 from pydantic import ValidationError
 
-from data.client import post_json
+from data.client import get_json, post_json, put_json
+from data.import_manifest import ImportManifest, file_digest
 from src.schemas.disc_events import DiscEventCreate
 
 
-def create_disc_event(data_directory: str = "data/disc_events/") -> None:
+def upsert_disc_event(disc_event: DiscEventCreate) -> bool:
+    """
+    Create a disc event, or update the existing event with the same name.
+
+    Args:
+        disc_event (DiscEventCreate): The validated disc event.
+
+    Returns:
+        bool: True if the event was created or updated.
+    """
+    payload = disc_event.model_dump(mode="json")
+    _, error = post_json(url="/disc-events/", json=payload)
+    if not error:
+        return True
+    existing, lookup_error = get_json(f"/disc-events/name/{quote(disc_event.name)}")
+    if lookup_error:
+        ic(f"Could not create or find disc event {disc_event.name}: {error}")
+        return False
+    disc_event_id = existing.json()["id"]
+    _, error = put_json(f"/disc-events/id/{disc_event_id}", json=payload)
+    if error:
+        ic(f"Could not update disc event {disc_event.name}: {error}")
+        return False
+    return True
+
+
+def create_disc_event(
+    data_directory: str = "data/disc_events/",
+    manifest: ImportManifest | None = None,
+) -> None:
     """
     Reads all JSON files in the specified directory, validates each as a
-    DiscEventCreate object, and posts valid disc events to the API endpoint.
+    DiscEventCreate object, and creates or updates each valid disc event.
 
     The function processes all JSON files in the directory sequentially. If a file
     fails validation, it logs the error and continues with the next file. If an HTTP
@@ -29,12 +62,16 @@ def create_disc_event(data_directory: str = "data/disc_events/") -> None:
     Args:
         data_directory (str): Path to the directory containing disc event JSON files.
                              Defaults to "data/disc_events/".
+        manifest (ImportManifest | None): Import manifest used to skip unchanged
+                             files and record each file's import status.
 
     Returns:
         None
 
     Side Effects:
-        - Posts each valid disc event to the API at /api/v1/disc-events/
+        - Posts each valid disc event to the API at /api/v1/disc-events/, or
+          updates the existing event with the same name
+        - Records content hashes and import status in the manifest, if given
         - Logs validation errors, HTTP errors, and successful operations using icecream
         - Continues processing all files even if individual files fail
 
@@ -44,17 +81,28 @@ def create_disc_event(data_directory: str = "data/disc_events/") -> None:
     """
     for filename in os.listdir(data_directory):
         if filename.endswith(".json"):
-            with open(os.path.join(data_directory, filename), encoding="utf-8") as f:
+            file_path = os.path.join(data_directory, filename)
+            digest = file_digest(file_path)
+            if manifest and manifest.is_unchanged(file_path, digest):
+                ic(f"Skipping unchanged file: {file_path}")
+                continue
+            with open(file_path, encoding="utf-8") as f:
                 disc_event_data = json.load(f)
-                try:
-                    disc_event = DiscEventCreate.model_validate(disc_event_data)
-                    ic(disc_event)
-                except ValidationError as e:
-                    ic(e)
-                    continue
-                post_json(
-                    url="/disc-events/",
-                    json=disc_event.model_dump(mode="json"),
+            try:
+                disc_event = DiscEventCreate.model_validate(disc_event_data)
+                ic(disc_event)
+            except ValidationError as e:
+                ic(e)
+                if manifest:
+                    manifest.record(file_path, digest, "failed")
+                continue
+            imported = upsert_disc_event(disc_event)
+            if manifest:
+                manifest.record(
+                    file_path,
+                    digest,
+                    "done" if imported else "failed",
+                    {disc_event.name: disc_event.model_dump(mode="json")},
                 )
 
 
@@ -0,0 +1,112 @@
+"""
+Import manifest for incremental, checksum-based re-imports.
+
+The manifest records, for every file under data/courses, data/disc_events and
+data/event_results, the SHA-256 of its contents, the status of its last
+import and a digest per imported row keyed by the row's natural key (course
+name, disc event name, or result date + username).
+
+On the next run a file whose hash matches a successful import is skipped
+without being parsed. A changed (or previously failed) file is parsed and
+diffed against the stored row digests so that only new or changed rows are
+sent to the API. Rows removed from a file are not deleted.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+
+MANIFEST_PATH = "data/.import_manifest.json"
+
+
+def file_digest(file_path) -> str:
+    """
+    SHA-256 of a file's contents, read in chunks.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def record_digest(record: dict) -> str:
+    """
+    Stable SHA-256 of a JSON-serializable row.
+    """
+    payload = json.dumps(record, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ImportManifest:
+    """
+    Per-file content hashes, import status and row digests persisted as JSON.
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH, entries: dict | None = None):
+        self.path = path
+        self.entries: dict[str, dict] = entries or {}
+
+    @classmethod
+    def load(cls, path: str = MANIFEST_PATH) -> "ImportManifest":
+        """
+        Load the manifest from disk, or start an empty one.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(path, json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+
+    def save(self) -> None:
+        """
+        Atomically write the manifest so a crash never leaves it half-written.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def is_unchanged(self, file_path, digest: str) -> bool:
+        """
+        True if the file was imported successfully with the same contents.
+        """
+        entry = self.entries.get(str(file_path), {})
+        return entry.get("sha256") == digest and entry.get("status") == "done"
+
+    def changed_records(self, file_path, records: dict[str, dict]) -> dict[str, dict]:
+        """
+        Return the records (keyed by natural key) that are new or differ from
+        what was last imported from this file.
+        """
+        imported = self.entries.get(str(file_path), {}).get("rows", {})
+        return {
+            key: record
+            for key, record in records.items()
+            if imported.get(key) != record_digest(record)
+        }
+
+    def record(
+        self,
+        file_path,
+        digest: str,
+        status: str,
+        imported: dict[str, dict] | None = None,
+    ) -> None:
+        """
+        Record the outcome of importing a file and persist the manifest.
+        :param file_path: The imported file.
+        :param digest: Content hash of the file that was imported.
+        :param status: "done" if every changed row was imported, else "failed".
+        :param imported: Records (keyed by natural key) that were imported
+            successfully; failed rows are left out so they are retried.
+        """
+        entry = self.entries.setdefault(str(file_path), {})
+        rows = entry.setdefault("rows", {})
+        for key, row in (imported or {}).items():
+            rows[key] = record_digest(row)
+        entry["sha256"] = digest
+        entry["status"] = status
+        entry["imported_at"] = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        self.save()
@@ -0,0 +1,102 @@
+"""
+Background job worker, with the data processing tasks.
+
+Registers the data tasks below alongside the API's (src.jobs), then runs jobs
+from the Redis job queue (JOB_BACKEND=redis) until interrupted. Jobs of the
+in-process queue only run inside the API, so the worker refuses to start
+without Redis.
+
+Tasks:
+- recompute_disc_event: recompute a disc event's round points and leaderboard
+- convert_xlsx: convert the .xlsx files of a folder to .csv
+- bulk_load: load courses, disc events and event results into the database
+- ingest_event_results: parse and upload new or changed result files
+- scrape_courses: scrape UDisc courses and sync them to the API
+
+Usage:
+    python -m data.jobs                  # one worker process
+    python -m data.jobs --processes 4
+"""
+
+import argparse
+import importlib
+import multiprocessing
+
+from icecream import ic
+
+from src.core import job_queue, settings
+from src.core.jobs import Task
+
+# Task functions as "module:function", imported when a job first runs them,
+# so a worker only loads pandas or playwright for the jobs that use them.
+TASKS = {
+    "recompute_disc_event": "src.jobs:recompute_disc_event",
+    "convert_xlsx": "data.round_processing:convert_xlsx_to_csv",
+    "bulk_load": "data.bulk_load:bulk_load",
+    "ingest_event_results": "data.parallel_ingest:ingest_event_results",
+    "scrape_courses": "scraping.scrape_udisc:scrape_courses",
+}
+
+
+def deferred_task(path: str) -> Task:
+    """
+    A task that imports its function from a "module:function" path on run.
+    """
+    module_name, function_name = path.split(":")
+
+    def run(**payload):
+        function = getattr(importlib.import_module(module_name), function_name)
+        return function(**payload)
+
+    return run
+
+
+for name, task_path in TASKS.items():
+    job_queue.task(name)(deferred_task(task_path))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line options for the job worker.
+    """
+    parser = argparse.ArgumentParser(description="Run background jobs.")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        help="Worker processes to run jobs in.",
+    )
+    return parser.parse_args(argv)
+
+
+def work() -> None:
+    names = ", ".join(sorted(job_queue.tasks))
+    ic(f"Running {names} jobs")
+    try:
+        job_queue.work()
+    except KeyboardInterrupt:
+        pass
+
+
+def main(argv=None):
+    """
+    Run job worker processes until interrupted.
+    """
+    args = parse_args(argv)
+    if settings.JOB_BACKEND != "redis":
+        ic("Set JOB_BACKEND=redis: in-process jobs run inside the API")
+        return
+    if args.processes == 1:
+        work()
+        return
+    # Spawned, so no process shares the parent's Redis connection.
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=work) for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
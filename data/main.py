@@ -1,24 +1,62 @@
 """
 Run all data processing tasks for the Disc Golf API.
+
+Usage:
+    python -m data.main                 # incremental sequential import
+    python -m data.main --parallel      # parse result files in a process pool
+    python -m data.main --parallel --workers 4 --restart
 """
 
+import argparse
+
 from icecream import ic
 
 from data.course_processing import create_courses
 from data.disc_event_processing import create_disc_event
+from data.import_manifest import MANIFEST_PATH, ImportManifest
+from data.parallel_ingest import ingest_event_results
 from data.round_processing import create_event_rounds
 from src.core.config import settings
 
 
-def main():
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line options for the data import.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Parse event result files in a process pool before uploading.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Process pool size for --parallel (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help=f"Ignore {MANIFEST_PATH} and re-import every file.",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
     """
     Main function to run all data processing tasks.
     """
+    args = parse_args(argv)
     ic()
     ic(settings.api_base_url)
-    create_courses()
-    create_disc_event()
-    create_event_rounds()
+    manifest = ImportManifest() if args.restart else ImportManifest.load()
+    create_courses(manifest=manifest)
+    create_disc_event(manifest=manifest)
+    if args.parallel:
+        ingest_event_results(workers=args.workers, manifest=manifest)
+    else:
+        create_event_rounds(manifest)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+"""
+Parallel ingestion of event result files.
+
+Parsing is the expensive part of an import: ``pd.read_excel`` in particular is
+slow and CPU-bound. This module fans the files in data/event_results/ out over
+a process pool, where each worker converts XLSX to CSV if needed, assigns
+points and validates the rows. Results are funnelled back to a single upload
+stage in the parent process that upserts them in batches through one shared
+HTTP client (POST /event-results/sync, one transaction per batch).
+
+Every file gets its own report (rows parsed, created, updated, failures or
+the parse error). Progress is recorded in the import manifest after each file,
+so a re-run skips files whose contents are unchanged and only upserts the rows
+of a changed file that are new or differ from the last import.
+"""
+
+import contextlib
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import httpx
+import pandas as pd
+from icecream import ic
+
+from data.disc_event_index import DiscEventIndex, load_disc_event_index
+from data.import_manifest import ImportManifest, file_digest
+from data.round_processing import (
+    event_result_key,
+    load_event_results,
+    upload_event_results,
+)
+from src.core.config import settings
+
+# A worker that crashes, or raises what parse_result_file does not catch,
+# fails only its own file; the other files are still imported and reported.
+WORKER_ERRORS = (Exception,)
+
+
+def discover_result_files(folder_path: str) -> list[Path]:
+    """
+    List the result files to ingest, one per round. An XLSX file is preferred
+    over a CSV with the same name, since the CSV is derived from it.
+    """
+    files: dict[str, Path] = {}
+    for path in sorted(Path(folder_path).glob("*.csv")):
+        files[path.stem] = path
+    for path in sorted(Path(folder_path).glob("*.xlsx")):
+        files[path.stem] = path
+    return [files[stem] for stem in sorted(files)]
+
+
+def parse_result_file(file_path: str, disc_event_index: DiscEventIndex) -> dict:
+    """
+    Worker entry point: read one results file (converting XLSX to CSV),
+    assign points and validate rows. Returns JSON-ready payloads so only
+    plain data crosses the process boundary.
+    """
+    path = Path(file_path)
+    try:
+        if path.suffix == ".xlsx":
+            df = pd.read_excel(path)
+            df.to_csv(path.with_suffix(".csv"), index=False)
+        else:
+            df = pd.read_csv(path)
+        event_results = load_event_results(df, path, disc_event_index)
+    except (
+        pd.errors.EmptyDataError,
+        pd.errors.ParserError,
+        OSError,
+        ValueError,
+        KeyError,
+    ) as e:
+        return {"file": file_path, "rows": 0, "results": [], "error": repr(e)}
+    return {
+        "file": file_path,
+        "rows": len(df),
+        "results": [result.model_dump(mode="json") for result in event_results],
+        "error": None,
+    }
+
+
+def ingest_event_results(
+    folder_path: str = "data/event_results/",
+    workers: int | None = None,
+    manifest: ImportManifest | None = None,
+    disc_event_index: DiscEventIndex | None = None,
+    client: httpx.Client | None = None,
+) -> dict[str, dict]:
+    """
+    Parse every new or changed results file in parallel and upsert the results.
+    :param folder_path: Folder containing the CSV/XLSX result files.
+    :param workers: Process pool size; defaults to the CPU count.
+    :param manifest: Import manifest; defaults to the one at MANIFEST_PATH.
+    :param disc_event_index: Disc events to match dates to; loaded from the
+        API when not provided.
+    :param client: Client bound to the API base URL; one is opened when not
+        provided.
+    :return: Report per file path.
+    """
+    manifest = manifest or ImportManifest.load()
+    pending = {}
+    for path in discover_result_files(folder_path):
+        digest = file_digest(path)
+        if manifest.is_unchanged(path, digest):
+            ic(f"Skipping {path}: unchanged since last import")
+            continue
+        pending[str(path)] = digest
+    ic(f"Ingesting {len(pending)} files with {workers or os.cpu_count()} workers")
+    if not pending:
+        return {}
+
+    if disc_event_index is None:
+        disc_event_index = load_disc_event_index()
+    reports: dict[str, dict] = {}
+    with contextlib.ExitStack() as stack:
+        pool = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+        if client is None:
+            client = stack.enter_context(
+                httpx.Client(base_url=settings.api_base_url, timeout=30.0)
+            )
+        futures = {
+            pool.submit(parse_result_file, path, disc_event_index): path
+            for path in pending
+        }
+        for future in as_completed(futures):
+            file_path = futures[future]
+            try:
+                parsed = future.result()
+            except WORKER_ERRORS as e:
+                parsed = {"file": file_path, "rows": 0, "results": [], "error": repr(e)}
+            report = {"rows": parsed["rows"], "error": parsed["error"]}
+            imported = {}
+            if parsed["error"]:
+                report["status"] = "failed"
+            else:
+                records = {
+                    event_result_key(result): result for result in parsed["results"]
+                }
+                changed = manifest.changed_records(file_path, records)
+                counts, imported = upload_event_results(changed, client)
+                report.update(counts)
+                report["unchanged"] += len(records) - len(changed)
+                report["status"] = "failed" if counts["failed"] else "done"
+            manifest.record(file_path, pending[file_path], report["status"], imported)
+            reports[file_path] = report
+            ic(f"{file_path}: {report}")
+
+    failed = [file for file, report in reports.items() if report["status"] != "done"]
+    ic(f"Ingested {len(reports) - len(failed)}/{len(reports)} files")
+    if failed:
+        ic(f"Failed files (re-run to retry): {failed}")
+    return reports
@@ -1,10 +1,9 @@
 """
 Calculates round points based on position_raw for each division in a CSV file
-and posts event results to an API endpoint. Associates results with disc events.
+and upserts event results through the API. Associates results with disc events.
 """
 
 import datetime
-import math
 import re
 from pathlib import Path
 
@@ -12,24 +11,42 @@ import httpx
 import numpy as np
 import pandas as pd
 from icecream import ic
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
+from data.disc_event_index import DiscEventIndex, load_disc_event_index
+from data.import_manifest import ImportManifest, file_digest
 from src.core.config import settings
 from src.schemas.event_results import EventResultCreate
 
+event_results_adapter = TypeAdapter(list[EventResultCreate])
+HOLE_COLUMN = re.compile(r"hole_(\d+)")
+SYNC_BATCH_SIZE = 500
 
-def convert_xlsx_to_csv(folder_path):
+
+def convert_xlsx_to_csv(
+    folder_path, manifest: ImportManifest | None = None
+) -> dict[str, tuple[str, str]]:
     """
     Convert all .xlsx files in the specified folder to .csv files using pandas.
     :param folder_path: Path to the folder containing .xlsx files.
+    :param manifest: Optional ImportManifest; files imported successfully
+        with the same contents are skipped without being parsed.
+    :return: The converted files, as the path of each CSV written mapped to
+        the path and content hash of its XLSX file.
     """
     ic(f"Looking for XLSX files in folder: {folder_path}")
     xlsx_files = Path(folder_path).glob("*.xlsx")
+    converted = {}
     for xlsx_file in xlsx_files:
         try:
+            digest = file_digest(xlsx_file)
+            if manifest and manifest.is_unchanged(xlsx_file, digest):
+                ic(f"Skipping unchanged file: {xlsx_file}")
+                continue
             df = pd.read_excel(xlsx_file)
             csv_file = xlsx_file.with_suffix(".csv")
             df.to_csv(csv_file, index=False)
+            converted[str(csv_file)] = (str(xlsx_file), digest)
             ic(f"Converted {xlsx_file} to {csv_file}")
         except (
             pd.errors.EmptyDataError,
@@ -38,62 +55,24 @@ def convert_xlsx_to_csv(folder_path):
             ValueError,
         ) as e:
             ic(f"Failed to convert {xlsx_file}: {e}")
+    return converted
 
 
-def get_disc_event_id_for_date(event_date: str) -> int:
+def get_disc_event_id_for_date(
+    event_date: str, disc_event_index: DiscEventIndex | None = None
+) -> int:
     """
     Get the appropriate disc event ID for a given date.
     :param event_date: Date string in ISO format (YYYY-MM-DDTHH:MM:SS)
+    :param disc_event_index: Preloaded index shared across files; loaded from
+        the API when not provided.
     :return: Disc event ID or 1 as fallback
     """
-    try:
-        event_datetime = datetime.datetime.fromisoformat(
-            event_date.replace("Z", "+00:00")
-        )
-        ic(f"Looking for disc event for date: {event_datetime}")
-
-        with httpx.Client(base_url=settings.api_base_url, timeout=30.0) as client:
-            ic(f"Fetching disc events from: {settings.api_base_url}/disc-events/")
-            response = client.get("/disc-events/")
-            response.raise_for_status()
-            disc_events = response.json()
-
-            ic(f"Found {len(disc_events)} disc events")
-            for event in disc_events:
-                start_date = datetime.datetime.fromisoformat(
-                    event["start_date"].replace("Z", "+00:00")
-                )
-                end_date = datetime.datetime.fromisoformat(
-                    event["end_date"].replace("Z", "+00:00")
-                )
-
-                ic(
-                    f'DiscEvent {event["id"]}: '
-                    f'{event["name"]} ({start_date} to {end_date})'
-                )
-                if start_date <= event_datetime <= end_date:
-                    ic(f'✓ Date {event_datetime} falls within disc event {event["id"]}')
-                    return event["id"]
-                else:
-                    ic(f'✗ Date {event_datetime} out of disc event {event["id"]} range')
-
-            if disc_events:
-                ic(
-                    f"No matching disc event found for {event_date}, using first "
-                    f'available disc event ID: {disc_events[0]["id"]}'
-                )
-                return disc_events[0]["id"]
-
-    except httpx.ConnectError as e:
-        ic(f"Connection error getting disc events: {e}")
-        ic(f"Make sure API is running at: {settings.api_base_url}")
-    except httpx.TimeoutException as e:
-        ic(f"Timeout error getting disc events: {e}")
-    except (httpx.RequestError, httpx.HTTPStatusError, ValueError) as e:
-        ic(f"Error getting event session ID for date {event_date}: {e}")
-
-    ic(f"Falling back to event session ID 1 for date {event_date}")
-    return 1
+    if disc_event_index is None:
+        disc_event_index = load_disc_event_index()
+    disc_event_id = disc_event_index.resolve(event_date)
+    ic(f"Resolved date {event_date} to disc event {disc_event_id}")
+    return disc_event_id
 
 
 def assign_points(df: pd.DataFrame) -> pd.DataFrame:
@@ -125,113 +104,240 @@ def assign_points(df: pd.DataFrame) -> pd.DataFrame:
     return df3
 
 
-def post_event_result(event_result: dict):
+def _numeric_column(df: pd.DataFrame, column: str) -> pd.Series:
     """
-    Post an event result to the API endpoint.
-    :param event_result: Dictionary containing event result data.
+    Coerce a column to numeric as a whole, mapping unparseable values and
+    +/-inf to NaN. Missing columns become an all-NaN column.
     """
+    if column not in df:
+        return pd.Series(np.nan, index=df.index, dtype="float64")
+    values = pd.to_numeric(df[column], errors="coerce")
+    return values.replace([np.inf, -np.inf], np.nan)
 
-    def clean_nans(obj):
-        if isinstance(obj, dict):
-            return {k: clean_nans(v) for k, v in obj.items()}
-        elif isinstance(obj, list):
-            return [clean_nans(v) for v in obj]
-        elif isinstance(obj, float):
-            if math.isnan(obj) or math.isinf(obj):
-                return None
-            return obj
-        else:
-            return obj
-
-    cleaned_event_result = clean_nans(event_result)
-    ic(f"Posting event result to {settings.api_base_url}/event-results/")
+
+def hole_score_lists(df: pd.DataFrame) -> list[list[int | None]]:
+    """
+    Collect the hole_<n> columns into one list of strokes per row, in hole
+    order. Blank or invalid strokes become None, and trailing holes nobody in
+    the file played (a shorter layout in a wider sheet) are dropped.
+    :param df: Results DataFrame with optional hole_1 ... hole_<n> columns.
+    :return: One list per row, empty when the file has no hole columns.
+    """
+    columns = sorted(
+        (column for column in df.columns if HOLE_COLUMN.fullmatch(str(column))),
+        key=lambda column: int(HOLE_COLUMN.fullmatch(str(column)).group(1)),
+    )
+    if not columns:
+        return [[] for _ in range(len(df))]
+    strokes = (
+        df[columns].apply(pd.to_numeric, errors="coerce").to_numpy(float, copy=True)
+    )
+    strokes[~np.isfinite(strokes) | (strokes < 1)] = np.nan
+    played = np.flatnonzero(~np.isnan(strokes).all(axis=0))
+    strokes = strokes[:, : played[-1] + 1] if len(played) else strokes[:, :0]
+    scores = strokes.round().astype(object)
+    scores[np.isnan(strokes)] = None
+    return [[None if s is None else int(s) for s in row] for row in scores]
+
+
+def build_event_result_records(
+    df: pd.DataFrame, date_val, disc_event_id: int, course_layout_id: int = 1
+) -> list[dict]:
+    """
+    Convert a points-assigned DataFrame into EventResultCreate payloads using
+    whole-column operations: inf/NaN cleaning, numeric coercion and position
+    parsing are vectorized, and NaN becomes None in a single pass. Per-hole
+    strokes from the hole_<n> columns are attached as hole_scores.
+    :param df: DataFrame returned by assign_points.
+    :param date_val: ISO date string applied to every row.
+    :param disc_event_id: Disc event the results belong to.
+    :param course_layout_id: Course layout the results were played on.
+    :return: List of dicts ready for batch validation.
+    """
+    position_raw = _numeric_column(df, "position_raw")
+    has_position = position_raw.notna()
+    columns = {
+        "date": date_val,
+        "division": df.get("division"),
+        "position": position_raw.round()
+        .astype("Int64")
+        .astype(str)
+        .where(has_position, ""),
+        "position_raw": position_raw,
+        "name": df.get("name"),
+        "event_relative_score": _numeric_column(df, "event_relative_score"),
+        "event_total_score": _numeric_column(df, "event_total_score"),
+        "pdga_number": _numeric_column(df, "pdga_number"),
+        "username": df.get("username"),
+        "round_relative_score": _numeric_column(df, "round_relative_score"),
+        "round_total_score": _numeric_column(df, "round_total_score"),
+        "course_layout_id": course_layout_id,
+        "round_points": _numeric_column(df, "adjusted_points").fillna(0.0),
+        "disc_event_id": disc_event_id,
+    }
+    records = pd.DataFrame(columns, index=df.index).astype(object)
+    records = records.where(records.notna(), None).to_dict("records")
+    for record, hole_scores in zip(records, hole_score_lists(df)):
+        record["hole_scores"] = hole_scores
+    return records
+
+
+def validate_event_results(records: list[dict]) -> list[EventResultCreate]:
+    """
+    Batch-validate event result payloads with a single TypeAdapter call.
+    Rows that fail validation are logged and dropped; the rest are returned.
+    :param records: Payload dicts from build_event_result_records.
+    :return: Validated EventResultCreate models.
+    """
     try:
-        with httpx.Client(base_url=settings.api_base_url, timeout=30.0) as client:
-            response = client.post("/event-results/", json=cleaned_event_result)
-            response.raise_for_status()
-            ic(f"Successfully posted event result: {response.json()}")
+        return event_results_adapter.validate_python(records)
+    except ValidationError as e:
+        invalid_rows = set()
+        for error in e.errors():
+            row_index = error["loc"][0]
+            invalid_rows.add(row_index)
+            ic(f'Validation error for row {row_index}: {error["msg"]}')
+        ic(f"Skipping {len(invalid_rows)} invalid rows")
+        valid_records = [
+            record for i, record in enumerate(records) if i not in invalid_rows
+        ]
+        return event_results_adapter.validate_python(valid_records)
+
+
+def event_result_key(event_result: dict) -> str:
+    """
+    Natural key of an event result: one result per username per date.
+    :param event_result: JSON-serializable event result data.
+    """
+    return f'{event_result["date"]}|{event_result["username"]}'
+
+
+def sync_event_result_batch(batch: list[dict], client: httpx.Client) -> dict | None:
+    """
+    Upsert a batch of event results with one POST /event-results/sync.
+    :param batch: JSON-serializable event result data.
+    :param client: Client bound to the API base URL.
+    :return: The API's counts per outcome, or None if the request failed.
+    """
+    try:
+        response = client.post("/event-results/sync", json={"event_results": batch})
+        response.raise_for_status()
+        return response.json()
     except httpx.ConnectError as e:
-        ic(f"Connection error posting event result: {e}")
+        ic(f"Connection error syncing event results: {e}")
         ic(f"Make sure API is running at: {settings.api_base_url}")
     except httpx.TimeoutException as e:
-        ic(f"Timeout error posting event result: {e}")
+        ic(f"Timeout error syncing event results: {e}")
     except httpx.HTTPStatusError as e:
         ic(f"HTTPStatusError: {e.response.status_code} - {e.response.text}")
     except httpx.RequestError as e:
         ic(f"RequestError: {e}")
+    return None
+
+
+def upload_event_results(
+    event_results: dict[str, dict],
+    client: httpx.Client,
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> tuple[dict[str, int], dict[str, dict]]:
+    """
+    Upsert event results in batches, each written by the API in one
+    transaction.
+    :param event_results: JSON-serializable results keyed by event_result_key.
+    :param client: Client bound to the API base URL.
+    :param batch_size: Results sent per request.
+    :return: Counts per outcome, and the results that were imported.
+    """
+    counts = {"created": 0, "updated": 0, "unchanged": 0, "failed": 0}
+    imported = {}
+    keys = list(event_results)
+    for start in range(0, len(keys), batch_size):
+        batch_keys = keys[start : start + batch_size]
+        synced = sync_event_result_batch(
+            [event_results[key] for key in batch_keys], client
+        )
+        if synced is None:
+            counts["failed"] += len(batch_keys)
+            continue
+        rejected = set(synced["rejected"])
+        for outcome in ("created", "updated", "unchanged"):
+            counts[outcome] += synced[outcome]
+        counts["failed"] += len(rejected)
+        for index, key in enumerate(batch_keys):
+            if index not in rejected:
+                imported[key] = event_results[key]
+    return counts, imported
+
 
+def get_date_for_file(file_path) -> str | None:
+    """
+    Extract the round date (YYYY-MM-DD, at 18:00) from a results file name.
+    :param file_path: Path to the results file.
+    :return: ISO datetime string, or None if the name has no date.
+    """
+    match = re.search(r"(\d{4}-\d{2}-\d{2})", str(file_path))
+    if not match:
+        return None
+    dt = datetime.datetime.strptime(match.group(1), "%Y-%m-%d").replace(hour=18)
+    return dt.isoformat()
 
-def import_and_process_csv(file_path):
+
+def load_event_results(
+    df: pd.DataFrame, file_path, disc_event_index=None
+) -> list[EventResultCreate]:
+    """
+    Assign points to a results DataFrame and convert it to validated
+    EventResultCreate models for the file's date and disc event.
+    :param df: Raw results as read from the CSV/XLSX file.
+    :param file_path: Path of the source file, used to derive the date.
+    :param disc_event_index: Optional DiscEventIndex shared across files.
+    :return: Validated event results.
     """
-    Import a CSV file, assign points for each division, and post event results.
+    date_val = get_date_for_file(file_path)
+    ic(f"Loaded {len(df)} rows from {file_path}")
+    ic("Assigning points...")
+    df = assign_points(df)
+    disc_event_id = (
+        get_disc_event_id_for_date(date_val, disc_event_index) if date_val else 1
+    )
+    records = build_event_result_records(df, date_val, disc_event_id)
+    return validate_event_results(records)
+
+
+def import_and_process_csv(
+    file_path, disc_event_index=None, manifest: ImportManifest | None = None
+) -> str:
+    """
+    Import a CSV file, assign points for each division, and upsert event results.
     :param file_path: Path to the CSV file.
+    :param disc_event_index: Optional DiscEventIndex shared across files.
+    :param manifest: Optional ImportManifest; unchanged files are skipped and
+        only new or changed rows of a changed file are sent to the API.
+    :return: "done" if every row is imported, else "failed".
     """
     ic(f"Processing file: {file_path}")
     try:
-        pd.set_option("display.max_rows", None)
-        pd.set_option("display.max_columns", None)
-        match = re.search(r"(\d{4}-\d{2}-\d{2})", str(file_path))
-        if match:
-            date_str = match.group(1)
-            dt = datetime.datetime.strptime(date_str, "%Y-%m-%d").replace(hour=18)
-            date_val = dt.isoformat()
-        else:
-            date_val = None
+        digest = file_digest(file_path)
+        if manifest and manifest.is_unchanged(file_path, digest):
+            ic(f"Skipping unchanged file: {file_path}")
+            return "done"
         ic(f"Reading CSV file: {file_path}")
         df = pd.read_csv(file_path)
-        ic(f"Loaded {len(df)} rows from CSV")
-        ic("Assigning points...")
-        df = assign_points(df)
-        df.insert(0, "date", date_val)
-        df = df.loc[:, ~df.columns.str.startswith("hole_")]
-        df = df.replace([float("inf"), -float("inf")], pd.NA)
-        df = df.where(pd.notnull(df), np.nan)
-        df.loc[:, "position_raw"] = pd.to_numeric(
-            df["position_raw"],
-            errors="coerce",
-            downcast="float",
-        )
-        ic(f"Processing {len(df)} rows for API posting...")
-        disc_event_id = get_disc_event_id_for_date(date_val) if date_val else 1
-        for row_index, row in df.iterrows():
-            if isinstance(row_index, int) and row_index % 10 == 0:  # Progress indicator
-                ic(f"Processing row {row_index + 1}/{len(df)}")
-            pdga_number = row.get("pdga_number")
-            if isinstance(pdga_number, float) and math.isnan(pdga_number):
-                pdga_number = None
-            position_raw = row.get("position_raw")
-            if position_raw is None or (
-                isinstance(position_raw, float) and math.isnan(position_raw)
-            ):
-                position = ""
-                position_raw_clean = None
-            else:
-                position = str(position_raw)
-                position_raw_clean = float(position_raw)
-            course_layout_id = 1
-            event_result = {
-                "date": row.get("date"),
-                "division": row.get("division"),
-                "position": position,
-                "position_raw": position_raw_clean,
-                "name": row.get("name"),
-                "event_relative_score": row.get("event_relative_score"),
-                "event_total_score": row.get("event_total_score"),
-                "pdga_number": pdga_number,
-                "username": row.get("username"),
-                "round_relative_score": row.get("round_relative_score"),
-                "round_total_score": row.get("round_total_score"),
-                "course_layout_id": course_layout_id,
-                "round_points": row.get("adjusted_points", 0.0),
-                "disc_event_id": disc_event_id,
-            }
-            try:
-                EventResultCreate(**event_result)
-            except ValidationError as e:
-                ic(f"Validation error for row {row_index}: {e}")
-                continue
-            post_event_result(event_result)
-        ic(f"Completed processing file: {file_path}")
+        event_results = load_event_results(df, file_path, disc_event_index)
+        records = {}
+        for event_result in event_results:
+            record = event_result.model_dump(mode="json")
+            records[event_result_key(record)] = record
+        if manifest:
+            records = manifest.changed_records(file_path, records)
+        ic(f"Upserting {len(records)}/{len(df)} new or changed rows...")
+        with httpx.Client(base_url=settings.api_base_url, timeout=30.0) as client:
+            counts, imported = upload_event_results(records, client)
+        ic(f"Completed processing file: {file_path}: {counts}")
+        status = "failed" if counts["failed"] else "done"
+        if manifest:
+            manifest.record(file_path, digest, status, imported)
+        return status
     except KeyboardInterrupt:
         ic("Processing interrupted by user")
         raise
@@ -243,24 +349,41 @@ def import_and_process_csv(file_path):
         ic(f"ParserError: {e}")
     except ValueError as e:
         ic(f"ValueError: {e}")
+    return "failed"
 
 
-def process_all_csv_files(folder_path):
+def process_all_csv_files(
+    folder_path, manifest: ImportManifest | None = None
+) -> dict[str, str]:
     """
     Loop through all .csv files in the specified folder, process them, and
-    post event results.
+    upsert event results.
     :param folder_path: Path to the folder containing CSV files.
+    :param manifest: Optional ImportManifest used to skip unchanged files.
+    :return: The import status of each CSV file, by path.
     """
     ic(f"Looking for CSV files in folder: {folder_path}")
     csv_files = Path(folder_path).glob("*.csv")
-    for csv_file in csv_files:
-        import_and_process_csv(csv_file)
+    disc_event_index = load_disc_event_index()
+    return {
+        str(csv_file): import_and_process_csv(csv_file, disc_event_index, manifest)
+        for csv_file in csv_files
+    }
 
 
-def create_event_rounds():
-    folder = "data/event_results/"
-    convert_xlsx_to_csv(folder)
-    process_all_csv_files(folder)
+def create_event_rounds(
+    manifest: ImportManifest | None = None, folder: str = "data/event_results/"
+):
+    """
+    Convert new or changed XLSX files to CSV, then import every CSV file.
+    An XLSX file is recorded in the manifest with the status of its CSV, so
+    it is only converted again once it changes or its import failed.
+    """
+    converted = convert_xlsx_to_csv(folder, manifest)
+    statuses = process_all_csv_files(folder, manifest)
+    if manifest:
+        for csv_file, (xlsx_file, digest) in converted.items():
+            manifest.record(xlsx_file, digest, statuses.get(csv_file, "failed"))
 
 
 if __name__ == "__main__":
@@ -19,6 +19,14 @@ if config.config_file_name is not None:
 target_metadata = Base.metadata
 
 
+def include_name(name, type_, _parent_names) -> bool:
+    """
+    Leave the SQLite FTS5 search tables (and their shadow tables) created by
+    src.models.search out of autogenerate comparisons.
+    """
+    return not (type_ == "table" and "_fts" in (name or ""))
+
+
 def get_url():
     return str(settings.sql_alchemy_db_uri)
 
@@ -50,6 +58,7 @@ def run_migrations_offline() -> None:
             literal_binds=True,
             dialect_opts={"paramstyle": "named"},
             render_as_batch=True,
+            include_name=include_name,
         )
     else:
         ic("No SQLite detected. (offline).")
@@ -58,6 +67,7 @@ def run_migrations_offline() -> None:
             target_metadata=target_metadata,
             literal_binds=True,
             dialect_opts={"paramstyle": "named"},
+            include_name=include_name,
         )
 
     with context.begin_transaction():
@@ -85,12 +95,14 @@ def run_migrations_online() -> None:
                 connection=conn,
                 target_metadata=target_metadata,
                 render_as_batch=True,
+                include_name=include_name,
             )
         else:
             ic("No SQLite detected. Running ONLINE.")
             context.configure(
                 connection=conn,
                 target_metadata=target_metadata,
+                include_name=include_name,
             )
 
         with context.begin_transaction():
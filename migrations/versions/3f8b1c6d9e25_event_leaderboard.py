@@ -0,0 +1,48 @@
+"""create event_leaderboard
+
+Revision ID: 3f8b1c6d9e25
+Revises: 7a3c5e9b1d40
+Create Date: 2026-10-19 22:00:00.000000
+
+Per-division leaderboard of each disc event, keyed by (disc_event_id,
+division, rank) so grouped reads are a primary key range scan. Filled from
+the existing event results.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "3f8b1c6d9e25"
+down_revision = "7a3c5e9b1d40"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "event_leaderboard",
+        sa.Column("disc_event_id", sa.Integer(), nullable=False),
+        sa.Column("division", sa.String(), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("event_result_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["disc_event_id"], ["disc_events.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["event_result_id"], ["event_results.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("disc_event_id", "division", "rank"),
+    )
+    op.execute(
+        "INSERT INTO event_leaderboard "
+        "(disc_event_id, division, rank, event_result_id) "
+        "SELECT disc_event_id, division, ROW_NUMBER() OVER ("
+        "PARTITION BY disc_event_id, division "
+        "ORDER BY position_raw ASC NULLS LAST, id), id "
+        "FROM event_results"
+    )
+
+
+def downgrade():
+    op.drop_table("event_leaderboard")
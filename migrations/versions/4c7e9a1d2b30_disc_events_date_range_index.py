@@ -0,0 +1,30 @@
+"""add (start_date, end_date) index to disc_events
+
+Revision ID: 4c7e9a1d2b30
+Revises: a88f017e2a08
+Create Date: 2026-10-19 09:00:00.000000
+
+Backs the date-containment lookup used by GET /disc-events/containing and
+the CSV importer.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "4c7e9a1d2b30"
+down_revision = "a88f017e2a08"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_disc_events_start_date_end_date",
+        "disc_events",
+        ["start_date", "end_date"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_disc_events_start_date_end_date", table_name="disc_events")
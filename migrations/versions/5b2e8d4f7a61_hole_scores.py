@@ -0,0 +1,35 @@
+"""create hole_scores table
+
+Revision ID: 5b2e8d4f7a61
+Revises: e1f5a9c3d7b2
+Create Date: 2026-10-19 16:00:00.000000
+
+One row per scored hole of an event result, keyed by (event_result_id,
+hole_number), so the primary key index also serves per-result lookups.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "5b2e8d4f7a61"
+down_revision = "e1f5a9c3d7b2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "hole_scores",
+        sa.Column("event_result_id", sa.Integer(), nullable=False),
+        sa.Column("hole_number", sa.SmallInteger(), nullable=False),
+        sa.Column("strokes", sa.SmallInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_result_id"], ["event_results.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("event_result_id", "hole_number"),
+    )
+
+
+def downgrade():
+    op.drop_table("hole_scores")
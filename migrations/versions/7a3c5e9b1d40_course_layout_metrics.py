@@ -0,0 +1,87 @@
+"""add derived metrics to course_layouts
+
+Revision ID: 7a3c5e9b1d40
+Revises: c4d9e2a7f318
+Create Date: 2026-10-19 20:00:00.000000
+
+Stores hole_count, total_par, total_distance, average_hole_length and
+par_distribution on each layout, and computes them for existing layouts
+from their holes.
+"""
+
+from collections import Counter, defaultdict
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "7a3c5e9b1d40"
+down_revision = "c4d9e2a7f318"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "course_layouts",
+        sa.Column("hole_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("course_layouts", sa.Column("total_par", sa.Integer()))
+    op.add_column("course_layouts", sa.Column("total_distance", sa.Integer()))
+    op.add_column("course_layouts", sa.Column("average_hole_length", sa.Float()))
+    op.add_column("course_layouts", sa.Column("par_distribution", sa.JSON()))
+
+    bind = op.get_bind()
+    holes = defaultdict(list)
+    for layout_id, par, distance in bind.execute(
+        sa.text("SELECT layout_id, par, distance FROM holes")
+    ):
+        holes[layout_id].append((par, distance))
+    course_layouts = sa.table(
+        "course_layouts",
+        sa.column("id", sa.Integer()),
+        sa.column("hole_count", sa.Integer()),
+        sa.column("total_par", sa.Integer()),
+        sa.column("total_distance", sa.Integer()),
+        sa.column("average_hole_length", sa.Float()),
+        sa.column("par_distribution", sa.JSON()),
+    )
+    rows = []
+    for layout_id, layout_holes in holes.items():
+        pars = [par for par, _ in layout_holes if par is not None]
+        distances = [distance for _, distance in layout_holes if distance is not None]
+        rows.append(
+            {
+                "layout_id": layout_id,
+                "hole_count": len(layout_holes),
+                "total_par": sum(pars) if pars else None,
+                "total_distance": sum(distances) if distances else None,
+                "average_hole_length": (
+                    sum(distances) / len(distances) if distances else None
+                ),
+                "par_distribution": {
+                    str(par): count for par, count in sorted(Counter(pars).items())
+                },
+            }
+        )
+    if rows:
+        bind.execute(
+            course_layouts.update()
+            .where(course_layouts.c.id == sa.bindparam("layout_id"))
+            .values(
+                hole_count=sa.bindparam("hole_count"),
+                total_par=sa.bindparam("total_par"),
+                total_distance=sa.bindparam("total_distance"),
+                average_hole_length=sa.bindparam("average_hole_length"),
+                par_distribution=sa.bindparam("par_distribution"),
+            ),
+            rows,
+        )
+
+
+def downgrade():
+    op.drop_column("course_layouts", "par_distribution")
+    op.drop_column("course_layouts", "average_hole_length")
+    op.drop_column("course_layouts", "total_distance")
+    op.drop_column("course_layouts", "total_par")
+    op.drop_column("course_layouts", "hole_count")
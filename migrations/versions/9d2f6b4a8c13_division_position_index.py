@@ -0,0 +1,30 @@
+"""index event_results by division and position
+
+Revision ID: 9d2f6b4a8c13
+Revises: 3f8b1c6d9e25
+Create Date: 2026-10-19 23:00:00.000000
+
+Matches the ROW_NUMBER() window of grouped results across disc events
+(partition by division, order by position_raw then id), so each division's
+ranks are read in index order instead of sorted per request.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d2f6b4a8c13"
+down_revision = "3f8b1c6d9e25"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_event_results_division_position_raw",
+        "event_results",
+        ["division", "position_raw", "id"],
+    )
+
+
+def downgrade():
+    op.drop_index("ix_event_results_division_position_raw", table_name="event_results")
@@ -0,0 +1,24 @@
+"""add link index to courses
+
+Revision ID: 9d3b6f2e1a47
+Revises: 4c7e9a1d2b30
+Create Date: 2026-10-19 12:00:00.000000
+
+Backs matching scraped courses by link in POST /courses/sync.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "9d3b6f2e1a47"
+down_revision = "4c7e9a1d2b30"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f("ix_courses_link"), "courses", ["link"], unique=False)
+
+
+def downgrade():
+    op.drop_index(op.f("ix_courses_link"), table_name="courses")
@@ -0,0 +1,58 @@
+"""read search trigram counts from fts5vocab and narrow the update triggers
+
+Revision ID: b5e2c7d9f4a1
+Revises: 9d2f6b4a8c13
+Create Date: 2026-10-20 10:00:00.000000
+
+SQLite only. The typo-tolerant search reads the document count of its
+trigrams from an fts5vocab table over each FTS5 index in one query, and the
+update triggers only re-index a row when one of its indexed columns changes.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b5e2c7d9f4a1"
+down_revision = "9d2f6b4a8c13"
+branch_labels = None
+depends_on = None
+
+SQLITE_FTS_TABLES = [
+    ("courses_fts", "courses", ("name", "city", "state")),
+    ("disc_events_fts", "disc_events", ("name",)),
+    ("players_fts", "event_results", ("username", "name")),
+]
+
+
+def _update_trigger(fts_table, source, columns, of_columns):
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    update_of = f"OF {cols} " if of_columns else ""
+    return (
+        f"CREATE TRIGGER {fts_table}_au AFTER UPDATE {update_of}ON {source} BEGIN "
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values}); "
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_values}); END"
+    )
+
+
+def upgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for fts_table, source, columns in SQLITE_FTS_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {fts_table}_au")
+        op.execute(_update_trigger(fts_table, source, columns, of_columns=True))
+        op.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}_vocab "
+            f"USING fts5vocab({fts_table}, 'row')"
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name != "sqlite":
+        return
+    for fts_table, source, columns in SQLITE_FTS_TABLES:
+        op.execute(f"DROP TABLE IF EXISTS {fts_table}_vocab")
+        op.execute(f"DROP TRIGGER IF EXISTS {fts_table}_au")
+        op.execute(_update_trigger(fts_table, source, columns, of_columns=False))
@@ -0,0 +1,116 @@
+"""pack hole scores into an event_results column
+
+Revision ID: c4d9e2a7f318
+Revises: 5b2e8d4f7a61
+Create Date: 2026-10-19 18:00:00.000000
+
+Replaces the one-row-per-hole hole_scores table with a hole_scores column on
+event_results: smallint[] on Postgres, a blob of one signed byte per hole
+elsewhere. Holes without a score are stored as 0. Existing scores are copied
+over before the table is dropped.
+"""
+
+from array import array
+from itertools import groupby
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "c4d9e2a7f318"
+down_revision = "5b2e8d4f7a61"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 1000
+
+
+def _column_type(dialect: str):
+    if dialect == "postgresql":
+        return postgresql.ARRAY(sa.SmallInteger())
+    return sa.LargeBinary()
+
+
+def _pack(strokes: list[int], dialect: str):
+    if dialect == "postgresql":
+        return strokes
+    return array("b", strokes).tobytes()
+
+
+def _unpack(value) -> list[int]:
+    if isinstance(value, (bytes, memoryview)):
+        return array("b", bytes(value)).tolist()
+    return list(value)
+
+
+def upgrade():
+    bind = op.get_bind()
+    dialect = bind.dialect.name
+    op.add_column(
+        "event_results",
+        sa.Column("hole_scores", _column_type(dialect), nullable=True),
+    )
+    event_results = sa.table(
+        "event_results",
+        sa.column("id", sa.Integer()),
+        sa.column("hole_scores", _column_type(dialect)),
+    )
+    update = (
+        event_results.update()
+        .where(event_results.c.id == sa.bindparam("result_id"))
+        .values(hole_scores=sa.bindparam("packed"))
+    )
+    rows = bind.execute(
+        sa.text(
+            "SELECT event_result_id, hole_number, strokes FROM hole_scores "
+            "ORDER BY event_result_id, hole_number"
+        )
+    )
+    batch = []
+    for result_id, scores in groupby(rows, key=lambda row: row[0]):
+        by_hole = {hole_number: strokes for _, hole_number, strokes in scores}
+        strokes = [by_hole.get(n, 0) for n in range(1, max(by_hole) + 1)]
+        batch.append({"result_id": result_id, "packed": _pack(strokes, dialect)})
+        if len(batch) >= BATCH_SIZE:
+            bind.execute(update, batch)
+            batch = []
+    if batch:
+        bind.execute(update, batch)
+    op.drop_table("hole_scores")
+
+
+def downgrade():
+    bind = op.get_bind()
+    hole_scores = op.create_table(
+        "hole_scores",
+        sa.Column("event_result_id", sa.Integer(), nullable=False),
+        sa.Column("hole_number", sa.SmallInteger(), nullable=False),
+        sa.Column("strokes", sa.SmallInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["event_result_id"], ["event_results.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("event_result_id", "hole_number"),
+    )
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, hole_scores FROM event_results WHERE hole_scores IS NOT NULL"
+        )
+    )
+    batch = []
+    for result_id, packed in rows:
+        for hole_number, strokes in enumerate(_unpack(packed), start=1):
+            if strokes:
+                batch.append(
+                    {
+                        "event_result_id": result_id,
+                        "hole_number": hole_number,
+                        "strokes": strokes,
+                    }
+                )
+        if len(batch) >= BATCH_SIZE:
+            op.bulk_insert(hole_scores, batch)
+            batch = []
+    if batch:
+        op.bulk_insert(hole_scores, batch)
+    op.drop_column("event_results", "hole_scores")
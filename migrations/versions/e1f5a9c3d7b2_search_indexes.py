@@ -0,0 +1,83 @@
+"""add trigram search indexes for courses, disc events and players
+
+Revision ID: e1f5a9c3d7b2
+Revises: e6a4c8b0d215
+Create Date: 2026-10-19 14:00:00.000000
+
+Backs GET /search. Postgres gets pg_trgm GIN indexes; SQLite gets
+external-content FTS5 trigram tables kept in sync by triggers.
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e1f5a9c3d7b2"
+down_revision = "e6a4c8b0d215"
+branch_labels = None
+depends_on = None
+
+SQLITE_FTS_TABLES = [
+    ("courses_fts", "courses", ("name", "city", "state")),
+    ("disc_events_fts", "disc_events", ("name",)),
+    ("players_fts", "event_results", ("username", "name")),
+]
+
+POSTGRES_TRGM_INDEXES = [
+    ("ix_courses_name_trgm", "courses", "name"),
+    ("ix_courses_city_trgm", "courses", "city"),
+    ("ix_courses_state_trgm", "courses", "state"),
+    ("ix_disc_events_name_trgm", "disc_events", "name"),
+    ("ix_event_results_username_trgm", "event_results", "username"),
+    ("ix_event_results_name_trgm", "event_results", "name"),
+]
+
+
+def _sqlite_fts_ddl(fts_table, source, columns):
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = (
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5({cols}, "
+        f"content='{source}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au "
+        f"AFTER UPDATE OF {cols} ON {source} BEGIN {delete_old} {insert_new} END",
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def upgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index, table, column in POSTGRES_TRGM_INDEXES:
+            op.execute(
+                f"CREATE INDEX IF NOT EXISTS {index} ON {table} "
+                f"USING gin ({column} gin_trgm_ops)"
+            )
+    elif dialect == "sqlite":
+        for fts_table, source, columns in SQLITE_FTS_TABLES:
+            for statement in _sqlite_fts_ddl(fts_table, source, columns):
+                op.execute(statement)
+
+
+def downgrade():
+    dialect = op.get_bind().dialect.name
+    if dialect == "postgresql":
+        for index, *_ in POSTGRES_TRGM_INDEXES:
+            op.execute(f"DROP INDEX IF EXISTS {index}")
+    elif dialect == "sqlite":
+        for fts_table, *_ in SQLITE_FTS_TABLES:
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {fts_table}_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {fts_table}")
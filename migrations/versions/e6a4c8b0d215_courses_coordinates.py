@@ -0,0 +1,45 @@
+"""add latitude/longitude and spatial indexes to courses
+
+Revision ID: e6a4c8b0d215
+Revises: 9d3b6f2e1a47
+Create Date: 2026-10-19 13:00:00.000000
+
+Backs GET /courses/nearby. The composite B-tree works on every backend; on
+Postgres a GiST index over point(longitude, latitude) serves the bounding-box
+prefilter without requiring PostGIS.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e6a4c8b0d215"
+down_revision = "9d3b6f2e1a47"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column("courses", sa.Column("latitude", sa.Float(), nullable=True))
+    op.add_column("courses", sa.Column("longitude", sa.Float(), nullable=True))
+    op.create_index(
+        "ix_courses_latitude_longitude",
+        "courses",
+        ["latitude", "longitude"],
+        unique=False,
+    )
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_courses_location_gist",
+            "courses",
+            [sa.text("point(longitude, latitude)")],
+            postgresql_using="gist",
+        )
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_courses_location_gist", table_name="courses")
+    op.drop_index("ix_courses_latitude_longitude", table_name="courses")
+    op.drop_column("courses", "longitude")
+    op.drop_column("courses", "latitude")
@@ -0,0 +1,92 @@
+"""
+Tests for the direct-to-database bulk loader.
+
+The loader is run against an in-memory SQLite database using the sample data
+files shipped in data/, then run a second time to check that the set-based
+merge skips rows that already exist.
+"""
+
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.pool import StaticPool
+
+from data.bulk_load import bulk_load
+from src.models import (
+    Course,
+    CourseLayout,
+    DiscEvent,
+    EventResult,
+    Hole,
+    LeaderboardEntry,
+)
+from src.models.base import Base
+
+
+@pytest.fixture(name="bulk_engine")
+def bulk_engine_fixture():
+    """
+    Create an empty in-memory SQLite database with all tables.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def _count(engine, model) -> int:
+    with engine.connect() as conn:
+        return conn.execute(select(func.count()).select_from(model)).scalar_one()
+
+
+def test_bulk_load_inserts_all_tables(bulk_engine):
+    """
+    Test that a first load populates every table and reports inserted rows.
+    """
+    counts = bulk_load(db_engine=bulk_engine, batch_size=50)
+
+    assert counts["courses"] == _count(bulk_engine, Course) == 1
+    assert counts["course_layouts"] == _count(bulk_engine, CourseLayout) == 2
+    assert counts["holes"] == _count(bulk_engine, Hole) == 34
+    assert counts["disc_events"] == _count(bulk_engine, DiscEvent) == 3
+    assert counts["event_results"] == _count(bulk_engine, EventResult)
+    assert counts["event_results"] > 0
+    assert _count(bulk_engine, LeaderboardEntry) == counts["event_results"]
+
+    with bulk_engine.connect() as conn:
+        orphaned = conn.execute(
+            select(func.count())
+            .select_from(EventResult)
+            .where(EventResult.disc_event_id.not_in(select(DiscEvent.id)))
+        ).scalar_one()
+        unscored = conn.execute(
+            select(func.count())
+            .select_from(EventResult)
+            .where(EventResult.hole_strokes.is_(None))
+        ).scalar_one()
+        hole_counts = conn.execute(
+            select(CourseLayout.hole_count).order_by(CourseLayout.id)
+        ).scalars()
+        assert list(hole_counts) == [21, 13]
+    assert orphaned == 0
+    assert unscored == 0
+
+
+def test_bulk_load_is_idempotent(bulk_engine):
+    """
+    Test that re-loading the same files inserts nothing new.
+    """
+    bulk_load(db_engine=bulk_engine)
+    before = _count(bulk_engine, EventResult)
+
+    counts = bulk_load(db_engine=bulk_engine)
+
+    assert counts == {
+        "courses": 0,
+        "course_layouts": 0,
+        "holes": 0,
+        "disc_events": 0,
+        "event_results": 0,
+    }
+    assert _count(bulk_engine, EventResult) == before
@@ -13,9 +13,11 @@ from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
 from src.api.deps import get_db
+from src.crud.hole import create_hole, delete_hole, update_hole
 from src.main import app
 from src.models.base import Base
 from src.schemas.courses import CourseCreate
+from src.schemas.holes import HoleCreate, HoleUpdate
 
 
 @pytest.fixture(scope="module", name="test_session")
@@ -85,3 +87,52 @@ def test_create_course(test_client):
     course_data = load_course_layout_data()
     response = test_client.post("/api/v1/courses", json=course_data.model_dump())
     assert response.status_code == 201
+
+
+def test_course_layout_summary(test_client):
+    """
+    Test that layout metrics are derived from the holes on create.
+    """
+    layouts = test_client.get("/api/v1/course-layouts/").json()["course_layouts"]
+    full = next(layout for layout in layouts if layout["name"].startswith("Full 21"))
+    layout_id = full["id"]
+    response = test_client.get(f"/api/v1/course-layouts/id/{layout_id}/summary")
+    assert response.status_code == 200
+    summary = response.json()
+    assert summary["hole_count"] == len(full["holes"]) == 21
+    assert summary["total_par"] == sum(hole["par"] for hole in full["holes"])
+    assert summary["total_distance"] == sum(hole["distance"] for hole in full["holes"])
+    assert summary["average_hole_length"] == pytest.approx(
+        summary["total_distance"] / 21
+    )
+    assert sum(summary["par_distribution"].values()) == 21
+    assert "holes" not in summary
+    assert test_client.get("/api/v1/course-layouts/id/999/summary").status_code == 404
+
+
+def test_hole_writes_refresh_layout_metrics(test_client, test_session):
+    """
+    Test that creating, updating and deleting holes keeps the metrics current.
+    """
+    layout_id = test_client.get("/api/v1/course-layouts/").json()["course_layouts"][0][
+        "id"
+    ]
+    before = test_client.get(f"/api/v1/course-layouts/id/{layout_id}/summary").json()
+
+    hole = create_hole(
+        test_session, layout_id, HoleCreate(hole_name="22", par=5, distance=600)
+    )
+    summary = test_client.get(f"/api/v1/course-layouts/id/{layout_id}/summary").json()
+    assert summary["hole_count"] == before["hole_count"] + 1
+    assert summary["total_par"] == before["total_par"] + 5
+    assert summary["par_distribution"]["5"] == 1
+
+    update_hole(test_session, hole.id, HoleUpdate(hole_name="22", par=4, distance=650))
+    summary = test_client.get(f"/api/v1/course-layouts/id/{layout_id}/summary").json()
+    assert summary["total_par"] == before["total_par"] + 4
+    assert summary["total_distance"] == before["total_distance"] + 650
+
+    delete_hole(test_session, hole.id)
+    summary = test_client.get(f"/api/v1/course-layouts/id/{layout_id}/summary").json()
+    assert summary == before
+    assert create_hole(test_session, 999, HoleCreate(hole_name="1", par=3)) is None
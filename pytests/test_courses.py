@@ -6,12 +6,15 @@ import json
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session
 from sqlalchemy.pool import StaticPool
 
+from data.course_processing import build_course_patch
 from src.api.deps import get_db
+from src.crud import get_nearby_courses
 from src.main import app
+from src.models import Course
 from src.models.base import Base
 from src.schemas.courses import CourseCreate
 
@@ -129,3 +132,338 @@ def test_delete_course(test_client):
 
     get_response = test_client.get("/api/v1/courses/id/1")
     assert get_response.status_code == 404
+
+
+def test_sync_courses(test_client):
+    """
+    Test that syncing scraped courses creates new ones and only updates
+    courses whose fields changed.
+    """
+    first = {
+        "courses": [
+            {
+                "name": "Memorial Park",
+                "link": "/courses/memorial-park-a1b2",
+                "location": "Houston, TX",
+                "rating": 4.3,
+                "reviews_count": 1204,
+            },
+            {"name": "Bear Creek", "rating": 4.0},
+        ]
+    }
+    response = test_client.post("/api/v1/courses/sync", json=first)
+    assert response.status_code == 200
+    assert response.json() == {"created": 2, "updated": 0, "unchanged": 0}
+
+    second = {
+        "courses": [
+            {
+                "name": "Memorial Park",
+                "link": "/courses/memorial-park-a1b2",
+                "rating": 4.4,
+                "reviews_count": 1210,
+            },
+            {"name": "Bear Creek", "rating": 4.0},
+            {"name": "Tom Bass", "link": "/courses/tom-bass-9z8y"},
+        ]
+    }
+    response = test_client.post("/api/v1/courses/sync", json=second)
+    assert response.status_code == 200
+    assert response.json() == {"created": 1, "updated": 1, "unchanged": 1}
+
+    course = test_client.get("/api/v1/courses/name/Memorial Park").json()
+    assert course["rating"] == 4.4
+    assert course["reviews_count"] == 1210
+    assert course["location"] == "Houston, TX"
+
+
+def test_get_nearby_courses(test_client):
+    """
+    Test that nearby courses are filtered by radius and ordered by distance.
+    """
+    courses = {
+        "courses": [
+            {"name": "Nearby Austin", "latitude": 30.2672, "longitude": -97.7431},
+            {"name": "Nearby Katy", "latitude": 29.7858, "longitude": -95.8245},
+            {"name": "Nearby Houston", "latitude": 29.7646, "longitude": -95.4413},
+            {"name": "Nearby Unknown"},
+        ]
+    }
+    assert test_client.post("/api/v1/courses/sync", json=courses).status_code == 200
+
+    response = test_client.get(
+        "/api/v1/courses/nearby",
+        params={"lat": 29.7604, "lon": -95.3698, "radius_km": 50},
+    )
+    assert response.status_code == 200
+    nearby = response.json()["courses"]
+    assert [course["name"] for course in nearby] == ["Nearby Houston", "Nearby Katy"]
+    assert nearby[0]["distance_km"] < nearby[1]["distance_km"] < 50
+
+    response = test_client.get(
+        "/api/v1/courses/nearby",
+        params={"lat": 29.7604, "lon": -95.3698, "radius_km": 500, "limit": 1},
+    )
+    assert [course["name"] for course in response.json()["courses"]] == [
+        "Nearby Houston"
+    ]
+
+    response = test_client.get("/api/v1/courses/nearby", params={"lat": 91, "lon": 0})
+    assert response.status_code == 422
+
+
+def test_nearby_courses_fetch_limit_and_wrap(test_client, test_session):
+    """
+    Test that only the nearest candidates are read and just limit courses
+    loaded, and that a search near the antimeridian finds courses on the
+    other side of it.
+    """
+    courses = {
+        "courses": [
+            {"name": f"Fiji {index}", "latitude": -17.7, "longitude": lon}
+            for index, lon in enumerate([179.95, 179.9, -179.95, -179.6, 178.0])
+        ]
+        + [
+            {"name": f"Grid {index}", "latitude": 10 + index / 100, "longitude": 20}
+            for index in range(60)
+        ]
+    }
+    assert test_client.post("/api/v1/courses/sync", json=courses).status_code == 200
+    test_session.expunge_all()
+
+    loaded = []
+    statements = []
+
+    def record(unused_conn, unused_cursor, statement, *unused_args):
+        statements.append(statement)
+
+    def record_load(course, unused_context):
+        loaded.append(course)
+
+    engine = test_session.get_bind()
+    event.listen(Course, "load", record_load)
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        nearby = get_nearby_courses(test_session, 10, 20, radius_km=500, limit=3)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+        event.remove(Course, "load", record_load)
+    assert [course.name for course, _ in nearby] == ["Grid 0", "Grid 1", "Grid 2"]
+    assert sorted(course.name for course in loaded) == ["Grid 0", "Grid 1", "Grid 2"]
+    assert "LIMIT" in statements[0]
+
+    response = test_client.get(
+        "/api/v1/courses/nearby",
+        params={"lat": -17.7, "lon": 179.99, "radius_km": 50},
+    )
+    names = [course["name"] for course in response.json()["courses"]]
+    assert names == ["Fiji 0", "Fiji 2", "Fiji 1", "Fiji 3"]
+
+
+def test_patch_course(test_client, test_session):
+    """
+    Test that a patch diffs nested layouts and holes by id and writes only
+    the rows that changed.
+    """
+    course = {
+        "name": "Patch Park",
+        "layouts": [
+            {
+                "name": "Main",
+                "holes": [
+                    {"hole_name": "1", "par": 3, "distance": 300},
+                    {"hole_name": "2", "par": 3, "distance": 350},
+                    {"hole_name": "3", "par": 4, "distance": 500},
+                ],
+            },
+            {"name": "Short", "holes": [{"hole_name": "1", "par": 3}]},
+        ],
+    }
+    created = test_client.post("/api/v1/courses/", json=course).json()
+    course_id = created["id"]
+    main = created["layouts"][0]
+    first, second, _ = main["holes"]
+
+    statements = []
+
+    def record(unused_conn, unused_cursor, statement, *unused_args):
+        statements.append(statement.split()[0])
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = test_client.patch(
+            f"/api/v1/courses/id/{course_id}",
+            json={
+                "city": "Houston",
+                "layouts": [
+                    {
+                        "id": main["id"],
+                        "difficulty": "hard",
+                        "holes": [
+                            {"id": first["id"], "par": 3},
+                            {"id": second["id"], "distance": 360},
+                            {"hole_name": "4", "par": 5, "distance": 600},
+                        ],
+                    },
+                    {"name": "Long", "holes": [{"hole_name": "1", "par": 4}]},
+                ],
+            },
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 200
+    patched = response.json()
+    assert patched["city"] == "Houston"
+    assert patched["name"] == "Patch Park"
+    layouts = {layout["name"]: layout for layout in patched["layouts"]}
+    assert set(layouts) == {"Main", "Long"}
+    assert layouts["Main"]["difficulty"] == "hard"
+    holes = {hole["hole_name"]: hole for hole in layouts["Main"]["holes"]}
+    assert set(holes) == {"1", "2", "4"}
+    assert holes["1"]["id"] == first["id"]
+    assert holes["2"]["distance"] == 360
+    assert [hole["par"] for hole in layouts["Long"]["holes"]] == [4]
+
+    # The unchanged hole 1 is not written; existence is a SELECT 1.
+    writes = [statement for statement in statements if statement != "SELECT"]
+    assert writes.count("UPDATE") == 3
+    assert writes.count("DELETE") == 3
+    assert writes.count("INSERT") == 2
+
+    main_id = main["id"]
+    summary = test_client.get(f"/api/v1/course-layouts/id/{main_id}/summary").json()
+    assert summary["hole_count"] == 3
+    assert summary["total_par"] == 11
+    assert summary["total_distance"] == 1260
+    long_id = layouts["Long"]["id"]
+    summary = test_client.get(f"/api/v1/course-layouts/id/{long_id}/summary").json()
+    assert summary["hole_count"] == 1
+
+
+@pytest.mark.parametrize(
+    "payload, status_code",
+    [
+        ({"name": None}, 422),
+        ({"layouts": [{"id": 9999, "name": "Gone"}]}, 422),
+        ({"layouts": [{"holes": [{"hole_name": "1"}]}]}, 422),
+        ({"layouts": [{"name": "New", "holes": [{"id": 1, "par": 3}]}]}, 422),
+        ({"layouts": [{"id": 1}, {"id": 1}]}, 422),
+    ],
+)
+def test_patch_course_invalid(test_client, payload, status_code):
+    """
+    Test that unknown nested ids and invalid fields are rejected without
+    changing the course.
+    """
+    course_id = test_client.get("/api/v1/courses/name/Patch Park").json()["id"]
+    response = test_client.patch(f"/api/v1/courses/id/{course_id}", json=payload)
+    assert response.status_code == status_code
+    course = test_client.get(f"/api/v1/courses/id/{course_id}").json()
+    assert {layout["name"] for layout in course["layouts"]} == {"Main", "Long"}
+    assert test_client.patch("/api/v1/courses/id/9999", json={}).status_code == 404
+
+
+def test_bulk_create_courses(test_client, test_session):
+    """
+    Test that a bulk import creates the course graph with one INSERT per
+    table and skips names that already exist.
+    """
+    courses = {
+        "courses": [
+            {
+                "name": "Bulk One",
+                "layouts": [
+                    {
+                        "name": "Main",
+                        "holes": [
+                            {"hole_name": "1", "par": 3, "distance": 280},
+                            {"hole_name": "2", "par": 4, "distance": 420},
+                        ],
+                    },
+                    {"name": "Short", "holes": [{"hole_name": "1", "par": 3}]},
+                ],
+            },
+            {"name": "Patch Park"},
+            {"name": "Bulk Two", "city": "Austin"},
+            {"name": "Bulk One"},
+        ]
+    }
+    statements = []
+
+    def record(unused_conn, unused_cursor, statement, *unused_args):
+        statements.append(statement.split()[0])
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        response = test_client.post("/api/v1/courses/bulk", json=courses)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert response.status_code == 201
+    result = response.json()
+    assert result["created"] == 2
+    assert result["conflicts"] == ["Patch Park", "Bulk One"]
+    # One IN query for conflicts. Postgres sends one INSERT per table; SQLite
+    # cannot order a batched RETURNING, so courses and layouts go row by row.
+    assert statements.count("SELECT") == 1
+    expected_inserts = 3 if engine.dialect.name == "postgresql" else 2 + 2 + 1
+    assert statements.count("INSERT") == expected_inserts
+
+    first_id = result["course_ids"][0]
+    course = test_client.get(f"/api/v1/courses/id/{first_id}").json()
+    assert course["name"] == "Bulk One"
+    layouts = {layout["name"]: layout for layout in course["layouts"]}
+    assert [hole["par"] for hole in layouts["Main"]["holes"]] == [3, 4]
+    assert len(layouts["Short"]["holes"]) == 1
+    main_id = layouts["Main"]["id"]
+    summary = test_client.get(f"/api/v1/course-layouts/id/{main_id}/summary").json()
+    assert summary["total_distance"] == 700
+    second_id = result["course_ids"][1]
+    second = test_client.get(f"/api/v1/courses/id/{second_id}").json()
+    assert second["city"] == "Austin"
+
+    response = test_client.post("/api/v1/courses/", json={"name": "Bulk Two"})
+    assert response.status_code == 409
+
+
+def test_reimport_course_patch(test_client):
+    """
+    Test that re-importing a changed course file writes its layout and hole
+    changes, keeping the ids of the layouts and holes it still has.
+    """
+    course = CourseCreate.model_validate(
+        {
+            "name": "Reimport Park",
+            "layouts": [
+                {
+                    "name": "Main",
+                    "par": 6,
+                    "holes": [
+                        {"hole_name": "1", "par": 3, "distance": 300},
+                        {"hole_name": "2", "par": 3, "distance": 350},
+                    ],
+                },
+                {"name": "Short", "holes": [{"hole_name": "1", "par": 3}]},
+            ],
+        }
+    )
+    created = test_client.post("/api/v1/courses/", json=course.model_dump()).json()
+    stored_main = created["layouts"][0]
+
+    changed = course.model_copy(deep=True)
+    main = changed.layouts[0]
+    main.par = 7
+    main.holes[1].par = 4
+    changed.layouts = [main]
+    patch = build_course_patch(changed, created)
+    response = test_client.patch(f"/api/v1/courses/id/{created["id"]}", json=patch)
+    assert response.status_code == 200
+
+    patched = response.json()
+    assert [layout["name"] for layout in patched["layouts"]] == ["Main"]
+    patched_main = patched["layouts"][0]
+    assert (patched_main["id"], patched_main["par"]) == (stored_main["id"], 7)
+    hole_ids = [hole["id"] for hole in patched_main["holes"]]
+    assert hole_ids == [hole["id"] for hole in stored_main["holes"]]
+    assert [hole["par"] for hole in patched_main["holes"]] == [3, 4]
@@ -165,3 +165,50 @@ def test_partial_update_disc_event(test_client):
 
     assert _norm(updated["start_date"]) == _norm(event_data["start_date"])
     assert _norm(updated["end_date"]) == _norm(event_data["end_date"])
+
+
+def test_get_disc_event_containing_date(test_client):
+    """
+    Test resolving the disc event whose date range contains a given date.
+    """
+    event_data = {
+        "name": "Containing Date Event",
+        "start_date": "2030-01-01T00:00:00Z",
+        "end_date": "2030-01-31T00:00:00Z",
+        "description": "Event for date containment lookup.",
+    }
+    create_response = test_client.post("/api/v1/disc-events/", json=event_data)
+    assert create_response.status_code in (200, 201)
+    event_id = create_response.json()["id"]
+
+    response = test_client.get(
+        "/api/v1/disc-events/containing", params={"date": "2030-01-15T18:00:00Z"}
+    )
+    assert response.status_code == 200
+    assert response.json()["id"] == event_id
+
+    response = test_client.get(
+        "/api/v1/disc-events/containing", params={"date": "2031-06-01T18:00:00"}
+    )
+    assert response.status_code == 404
+
+
+def test_get_disc_event_by_name(test_client):
+    """
+    Test retrieving a disc event by its name.
+    """
+    event_data = {
+        "name": "Named Lookup Event",
+        "start_date": "2030-02-01T00:00:00Z",
+        "end_date": "2030-02-02T00:00:00Z",
+        "description": "Event looked up by name.",
+    }
+    create_response = test_client.post("/api/v1/disc-events/", json=event_data)
+    assert create_response.status_code in (200, 201)
+
+    response = test_client.get("/api/v1/disc-events/name/Named Lookup Event")
+    assert response.status_code == 200
+    assert response.json()["id"] == create_response.json()["id"]
+
+    response = test_client.get("/api/v1/disc-events/name/Unknown Event")
+    assert response.status_code == 404
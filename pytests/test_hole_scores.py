@@ -0,0 +1,182 @@
+"""
+This module contains tests for per-hole score storage and hole statistics.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from data.round_processing import hole_score_lists
+from src.api.deps import get_db
+from src.main import app
+from src.models import EventResult
+from src.models.base import Base
+from src.models.hole_score import (
+    decode_hole_scores,
+    encode_hole_scores,
+    hole_score_list,
+    hole_score_matrix,
+)
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+def _event_result(username: str, hole_scores: list) -> dict:
+    return {
+        "date": "2025-04-01T18:00:00",
+        "division": "MA3",
+        "position": "1",
+        "position_raw": 1,
+        "name": username.title(),
+        "event_relative_score": 0,
+        "event_total_score": 10,
+        "username": username,
+        "round_relative_score": 0,
+        "round_total_score": 10,
+        "course_layout_id": 1,
+        "disc_event_id": 1,
+        "hole_scores": hole_scores,
+    }
+
+
+def test_hole_score_lists():
+    """
+    Test that hole columns are ordered numerically, blanks become None and
+    trailing unplayed holes are dropped.
+    """
+    df = pd.DataFrame(
+        {
+            "name": ["A", "B"],
+            "hole_10": [None, None],
+            "hole_2": [4, "x"],
+            "hole_1": [3, 2],
+            "hole_3": [None, 5],
+        }
+    )
+    assert hole_score_lists(df) == [[3, 4, None], [2, None, 5]]
+    assert hole_score_lists(df[["name"]]) == [[], []]
+
+
+def test_hole_score_codec():
+    """
+    Test packing strokes, zero-copy decoding and stacking rounds.
+    """
+    packed = encode_hole_scores([3, None, 4]).tobytes()
+    assert packed == bytes([3, 0, 4])
+    strokes = decode_hole_scores(packed)
+    assert not strokes.flags.owndata
+    assert hole_score_list(strokes) == [3, None, 4]
+
+    matrix = hole_score_matrix([packed, bytes([2, 3, 5, 4])])
+    assert matrix.dtype == np.int8
+    assert matrix.tolist() == [[3, 0, 4, 0], [2, 3, 5, 4]]
+    assert hole_score_matrix([packed], holes=2).tolist() == [[3, 0]]
+    assert hole_score_matrix([]).shape == (0, 0)
+
+
+def test_hole_scores_round_trip(test_client, test_session):
+    """
+    Test that hole scores are stored with a result, replaced on update and
+    validated.
+    """
+    course = {
+        "name": "Hole Score Park",
+        "layouts": [
+            {
+                "name": "Main",
+                "holes": [
+                    {"hole_name": "1", "par": 3},
+                    {"hole_name": "2", "par": 3},
+                    {"hole_name": "3", "par": 4},
+                ],
+            }
+        ],
+    }
+    assert test_client.post("/api/v1/courses/", json=course).status_code == 201
+    disc_event = {
+        "name": "Hole Score League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    assert test_client.post("/api/v1/disc-events/", json=disc_event).status_code == 201
+
+    response = test_client.post(
+        "/api/v1/event-results/", json=_event_result("ace", [3, None, 4])
+    )
+    assert response.status_code == 201
+    assert response.json()["hole_scores"] == [3, None, 4]
+    result_id = response.json()["id"]
+
+    response = test_client.put(
+        f"/api/v1/event-results/id/{result_id}", json=_event_result("ace", [2, 3, 5])
+    )
+    assert response.json()["hole_scores"] == [2, 3, 5]
+    stored = select(EventResult.hole_strokes).where(EventResult.id == result_id)
+    assert test_session.scalars(stored).one().tolist() == [2, 3, 5]
+
+    invalid = _event_result("bad", [0, 3, 3])
+    assert test_client.post("/api/v1/event-results/", json=invalid).status_code == 422
+
+
+def test_layout_hole_stats(test_client):
+    """
+    Test scoring averages, birdie/par/bogey rates and difficulty ranks.
+    """
+    for username, hole_scores in (("bee", [3, 4, 4]), ("cee", [4, 4, 3])):
+        response = test_client.post(
+            "/api/v1/event-results/", json=_event_result(username, hole_scores)
+        )
+        assert response.status_code == 201
+
+    response = test_client.get("/api/v1/course-layouts/id/1/hole-stats")
+    assert response.status_code == 200
+    stats = response.json()
+    assert stats["rounds"] == 3
+    first, second, third = stats["holes"]
+    # Hole 1 scores 2, 3, 4 on par 3; hole 2 scores 3, 4, 4 on par 3;
+    # hole 3 scores 5, 4, 3 on par 4.
+    assert first["scoring_average"] == pytest.approx(3.0)
+    assert first["birdie_rate"] == pytest.approx(1 / 3)
+    assert first["par_rate"] == pytest.approx(1 / 3)
+    assert first["bogey_rate"] == pytest.approx(1 / 3)
+    assert second["average_to_par"] == pytest.approx(2 / 3)
+    assert second["bogey_rate"] == pytest.approx(2 / 3)
+    assert third["par"] == 4
+    assert [hole["difficulty_rank"] for hole in stats["holes"]] == [2, 1, 3]
+
+    filtered = test_client.get(
+        "/api/v1/course-layouts/id/1/hole-stats", params={"division": "MPO"}
+    ).json()
+    assert filtered["rounds"] == 0
+    assert filtered["holes"][0]["scoring_average"] is None
+    assert filtered["holes"][0]["difficulty_rank"] is None
+    missing = test_client.get("/api/v1/course-layouts/id/99/hole-stats")
+    assert missing.status_code == 404
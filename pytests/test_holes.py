@@ -0,0 +1,160 @@
+"""
+This module contains tests for the holes endpoints.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.api.deps import get_db
+from src.main import app
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+def test_create_layout_holes(test_client):
+    """
+    Test adding holes through their layout and listing them.
+    """
+    course = {"name": "Hole Patch Park", "layouts": [{"name": "Main"}, {"name": "Alt"}]}
+    assert test_client.post("/api/v1/courses/", json=course).status_code == 201
+    for layout_id, hole_name, par, distance in (
+        (1, "1", 3, 250),
+        (1, "2", 3, 300),
+        (1, "3", 4, None),
+        (2, "1", 3, 200),
+    ):
+        response = test_client.post(
+            f"/api/v1/course-layouts/id/{layout_id}/holes",
+            json={"hole_name": hole_name, "par": par, "distance": distance},
+        )
+        assert response.status_code == 201
+        assert response.json()["layout_id"] == layout_id
+
+    holes = test_client.get("/api/v1/course-layouts/id/1/holes").json()
+    assert holes["count"] == 3
+    assert [hole["hole_name"] for hole in holes["holes"]] == ["1", "2", "3"]
+    assert test_client.get("/api/v1/holes/").json()["count"] == 4
+    missing = test_client.post(
+        "/api/v1/course-layouts/id/99/holes", json={"hole_name": "1", "par": 3}
+    )
+    assert missing.status_code == 404
+
+
+def test_bulk_patch_holes(test_client):
+    """
+    Test that a bulk patch changes only the fields sent and refreshes the
+    metrics of every affected layout.
+    """
+    response = test_client.patch(
+        "/api/v1/holes/",
+        json={
+            "holes": [
+                {"id": 1, "par": 4, "distance": 320},
+                {"id": 2, "distance": None},
+                {"id": 3, "hole_name": "3A", "distance": 410},
+                {"id": 4, "par": 2},
+            ]
+        },
+    )
+    assert response.status_code == 200
+    holes = {hole["id"]: hole for hole in response.json()["holes"]}
+    assert holes[1] | {"layout_id": 1} == {
+        "id": 1,
+        "hole_name": "1",
+        "par": 4,
+        "distance": 320,
+        "layout_id": 1,
+    }
+    assert holes[2]["par"] == 3 and holes[2]["distance"] is None
+    assert holes[3]["hole_name"] == "3A" and holes[3]["par"] == 4
+    assert holes[4]["par"] == 2 and holes[4]["distance"] == 200
+
+    summary = test_client.get("/api/v1/course-layouts/id/1/summary").json()
+    assert summary["total_par"] == 11
+    assert summary["total_distance"] == 730
+    assert summary["par_distribution"] == {"3": 1, "4": 2}
+    summary = test_client.get("/api/v1/course-layouts/id/2/summary").json()
+    assert summary["total_par"] == 2
+
+
+def test_layout_bulk_patch_holes(test_client):
+    """
+    Test that a layout-scoped patch rejects holes from other layouts and
+    leaves every hole unchanged when it does.
+    """
+    response = test_client.patch(
+        "/api/v1/course-layouts/id/1/holes",
+        json={"holes": [{"id": 1, "par": 3}, {"id": 2, "par": 3}]},
+    )
+    assert response.status_code == 200
+    assert [hole["par"] for hole in response.json()["holes"]] == [3, 3]
+
+    response = test_client.patch(
+        "/api/v1/course-layouts/id/1/holes",
+        json={"holes": [{"id": 1, "par": 5}, {"id": 4, "par": 5}]},
+    )
+    assert response.status_code == 404
+    assert test_client.get("/api/v1/holes/id/1").json()["par"] == 3
+
+
+@pytest.mark.parametrize(
+    "payload, status_code",
+    [
+        ({"holes": [{"id": 1, "par": 4}, {"id": 99, "par": 4}]}, 404),
+        ({"holes": [{"id": 1, "par": 4}, {"id": 1, "par": 5}]}, 422),
+        ({"holes": [{"id": 1, "par": None}]}, 422),
+        ({"holes": [{"id": 1, "tee": "A"}]}, 422),
+        ({"holes": []}, 422),
+    ],
+)
+def test_bulk_patch_holes_invalid(test_client, payload, status_code):
+    """
+    Test that unknown holes, duplicate ids and invalid fields are rejected.
+    """
+    response = test_client.patch("/api/v1/holes/", json=payload)
+    assert response.status_code == status_code
+    assert test_client.get("/api/v1/holes/id/1").json()["par"] == 3
+
+
+def test_hole_item_routes(test_client):
+    """
+    Test reading, replacing and deleting a single hole.
+    """
+    response = test_client.put(
+        "/api/v1/holes/id/4", json={"hole_name": "1", "par": 3, "distance": 210}
+    )
+    assert response.status_code == 200
+    assert response.json()["distance"] == 210
+    assert test_client.delete("/api/v1/holes/id/4").status_code == 204
+    assert test_client.get("/api/v1/holes/id/4").status_code == 404
+    summary = test_client.get("/api/v1/course-layouts/id/2/summary").json()
+    assert summary["hole_count"] == 0
+    assert test_client.delete("/api/v1/holes/id/4").status_code == 404
@@ -0,0 +1,41 @@
+"""
+Tests for the import manifest used by incremental re-imports.
+"""
+
+from data.import_manifest import ImportManifest, file_digest
+
+
+def test_unchanged_file_is_skipped_after_successful_import(tmp_path):
+    """
+    Test that a file is only skipped when its contents match a "done" import.
+    """
+    data_file = tmp_path / "round.csv"
+    data_file.write_text("username,score\nalice,54\n", encoding="utf-8")
+    manifest = ImportManifest(str(tmp_path / "manifest.json"))
+    digest = file_digest(data_file)
+
+    assert not manifest.is_unchanged(data_file, digest)
+    manifest.record(data_file, digest, "failed")
+    assert not manifest.is_unchanged(data_file, digest)
+    manifest.record(data_file, digest, "done")
+
+    reloaded = ImportManifest.load(manifest.path)
+    assert reloaded.is_unchanged(data_file, digest)
+    data_file.write_text("username,score\nalice,53\n", encoding="utf-8")
+    assert not reloaded.is_unchanged(data_file, file_digest(data_file))
+
+
+def test_changed_records_returns_new_and_modified_rows(tmp_path):
+    """
+    Test that only rows missing from or different to the last import are returned.
+    """
+    manifest = ImportManifest(str(tmp_path / "manifest.json"))
+    first = {"a": {"score": 54}, "b": {"score": 60}}
+    manifest.record("round.csv", "sha", "done", first)
+
+    second = {"a": {"score": 54}, "b": {"score": 59}, "c": {"score": 61}}
+
+    assert manifest.changed_records("round.csv", second) == {
+        "b": {"score": 59},
+        "c": {"score": 61},
+    }
@@ -0,0 +1,29 @@
+"""
+This module contains tests for the import time of the API.
+"""
+
+from data.benchmark_import_time import import_profile
+from src.core.lazy import lazy_import
+
+# src.main imports in about 1.3 s; the margin is for slower machines.
+IMPORT_BUDGET_SECONDS = 3.0
+# Packages src.main must only import on first use.
+LAZY_PACKAGES = {"icecream", "redis", "pandas", "playwright"}
+
+
+def test_import_time_budget():
+    """
+    Test that importing src.main in a fresh interpreter stays within the
+    import time budget and leaves lazily imported packages unloaded.
+    """
+    profile = import_profile("src.main")
+    assert profile["src.main"][1] / 1e6 < IMPORT_BUDGET_SECONDS
+    loaded = {name.split(".")[0] for name in profile} & LAZY_PACKAGES
+    assert not loaded
+
+
+def test_lazy_import_missing_module():
+    """
+    Test that lazily importing a package that is not installed gives None.
+    """
+    assert lazy_import("no_such_package") is None
@@ -0,0 +1,236 @@
+"""
+This module contains tests for the background job queue and job routes.
+"""
+
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.api.deps import get_db
+from src.core import job_queue, settings
+from src.core.jobs import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    MemoryJobQueue,
+    RedisJobQueue,
+    check_job_backend,
+)
+from src.main import app
+from src.models import EventResult
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+class WorkerDied(BaseException):
+    """
+    Raised by a task to stop its worker the way a killed process would.
+    """
+
+
+@pytest.fixture(name="redis_queue")
+def redis_queue_fixture(monkeypatch):
+    """
+    Make RedisJobQueue instances, all sharing one fake Redis server.
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    redis = pytest.importorskip("redis")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis.Redis,
+        "from_url",
+        lambda unused_url: fakeredis.FakeRedis(server=server),
+    )
+
+    def make_queue(**kwargs) -> RedisJobQueue:
+        return RedisJobQueue(
+            "redis://fake", session_factory=None, retry_delay=0, **kwargs
+        )
+
+    return make_queue
+
+
+@pytest.mark.parametrize("backend", ["memory", "redis"])
+def test_queue_retries_and_dedupes(backend, request):
+    """
+    Test that failing tasks are retried up to max_attempts, and that a dedupe
+    key returns the job in flight until it finishes.
+    """
+    if backend == "memory":
+        queue = MemoryJobQueue(session_factory=None, retry_delay=0, workers=0)
+    else:
+        queue = request.getfixturevalue("redis_queue")()
+    calls = []
+
+    @queue.task("flaky")
+    def flaky(fail_times: int) -> int:
+        calls.append(fail_times)
+        if len(calls) <= fail_times:
+            raise RuntimeError("not yet")
+        return len(calls)
+
+    job = queue.enqueue("flaky", {"fail_times": 1}, dedupe_key="flaky")
+    assert queue.enqueue("flaky", {"fail_times": 5}, dedupe_key="flaky") == job
+    assert queue.run_next(timeout=0)
+    retried = queue.get(job["id"])
+    assert (retried["status"], retried["attempts"]) == (QUEUED, 1)
+    assert retried["error"] == "RuntimeError: not yet"
+    assert queue.run_next(timeout=0)
+    done = queue.get(job["id"])
+    assert (done["status"], done["result"], done["error"]) == (SUCCEEDED, 2, None)
+    assert not queue.run_next(timeout=0)
+
+    again = queue.enqueue("flaky", {"fail_times": 5}, dedupe_key="flaky")
+    assert again["id"] != job["id"]
+    while queue.run_next(timeout=0):
+        pass
+    failed = queue.get(again["id"])
+    assert (failed["status"], failed["attempts"]) == (FAILED, 3)
+    with pytest.raises(ValueError):
+        queue.enqueue("missing")
+
+
+def test_redis_queue_recovers_lost_jobs(redis_queue):
+    """
+    Test that the job of a worker that died is queued again once its lease
+    runs out, keeping its dedupe key meanwhile, and fails once it has used
+    up its attempts.
+    """
+    queue = redis_queue(lease=0.05, max_attempts=2)
+    calls = []
+
+    @queue.task("crash")
+    def crash(crashes: int) -> int:
+        calls.append(crashes)
+        if len(calls) <= crashes:
+            raise WorkerDied
+        return len(calls)
+
+    job = queue.enqueue("crash", {"crashes": 1}, dedupe_key="crash")
+    with pytest.raises(WorkerDied):
+        queue.run_next(timeout=0)
+    assert queue.get(job["id"])["status"] == RUNNING
+    assert queue.enqueue("crash", {"crashes": 1}, dedupe_key="crash")["id"] == job["id"]
+    assert not queue.run_next(timeout=0)
+
+    time.sleep(0.1)
+    assert queue.run_next(timeout=0)
+    done = queue.get(job["id"])
+    assert (done["status"], done["result"], done["attempts"]) == (SUCCEEDED, 2, 2)
+    again = queue.enqueue("crash", {"crashes": 5}, dedupe_key="crash")
+    assert again["id"] != job["id"]
+
+    for _ in range(2):
+        with pytest.raises(WorkerDied):
+            queue.run_next(timeout=0)
+        time.sleep(0.1)
+    assert not queue.run_next(timeout=0)
+    lost = queue.get(again["id"])
+    assert (lost["status"], lost["error"]) == (FAILED, "Worker lost")
+    assert queue.enqueue("crash", {"crashes": 0}, dedupe_key="crash")["id"] not in (
+        job["id"],
+        again["id"],
+    )
+
+
+def test_memory_backend_needs_one_worker(monkeypatch):
+    """
+    Test that the in-process queue is refused for several API workers.
+    """
+    monkeypatch.setattr(settings, "JOB_BACKEND", "memory")
+    check_job_backend(1)
+    with pytest.raises(RuntimeError, match="GUNICORN_WORKERS=1"):
+        check_job_backend(4)
+    monkeypatch.setattr(settings, "JOB_BACKEND", "redis")
+    check_job_backend(4)
+
+
+def _event_result(username: str, position_raw: int | None) -> dict:
+    return {
+        "date": "2025-04-01T18:00:00",
+        "division": "MA3",
+        "position": str(position_raw or "DNF"),
+        "position_raw": position_raw,
+        "name": username.title(),
+        "event_relative_score": 0,
+        "event_total_score": 54,
+        "username": username,
+        "round_relative_score": 0,
+        "round_total_score": 54,
+        "course_layout_id": 1,
+        "disc_event_id": 1,
+    }
+
+
+def test_recompute_job(test_client, test_session, monkeypatch):
+    """
+    Test that a disc event recompute is queued once, reported at
+    GET /jobs/{id} and recomputes tied points when run.
+    """
+    monkeypatch.setattr(job_queue, "workers", 0)
+    monkeypatch.setattr(
+        job_queue, "session_factory", sessionmaker(bind=test_session.get_bind())
+    )
+    disc_event = {
+        "name": "Points League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    assert test_client.post("/api/v1/disc-events/", json=disc_event).status_code == 201
+    for username, position_raw in (("ann", 1), ("bob", 1), ("cy", 2), ("dee", None)):
+        response = test_client.post(
+            "/api/v1/event-results/", json=_event_result(username, position_raw)
+        )
+        assert response.status_code == 201
+
+    response = test_client.post("/api/v1/disc-events/id/1/recompute")
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == QUEUED
+    assert test_client.post("/api/v1/disc-events/id/1/recompute").json() == job
+    assert test_client.post("/api/v1/disc-events/id/9/recompute").status_code == 404
+
+    assert job_queue.run_next(timeout=0)
+    job_id = job["id"]
+    response = test_client.get(f"/api/v1/jobs/{job_id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == SUCCEEDED
+    assert response.json()["result"] == {"event_results": 4}
+    test_session.expire_all()
+    points = dict(
+        test_session.execute(
+            select(EventResult.username, EventResult.round_points)
+        ).all()
+    )
+    assert points == {"ann": 29.5, "bob": 29.5, "cy": 29.0, "dee": 0.0}
+    assert test_client.get("/api/v1/jobs/unknown").status_code == 404
@@ -0,0 +1,175 @@
+"""
+This module contains tests for the stored per-division event leaderboards.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.api.deps import get_db
+from src.crud.event_result import delete_event_result
+from src.main import app
+from src.models import LeaderboardEntry
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+def _event_result(
+    username: str, division: str, position_raw: int | None, disc_event_id: int = 1
+) -> dict:
+    return {
+        "date": "2025-04-01T18:00:00",
+        "division": division,
+        "position": str(position_raw or "DNF"),
+        "position_raw": position_raw,
+        "name": username.title(),
+        "event_relative_score": 0,
+        "event_total_score": 50 + (position_raw or 10),
+        "username": username,
+        "round_relative_score": 0,
+        "round_total_score": 50 + (position_raw or 10),
+        "course_layout_id": 1,
+        "disc_event_id": disc_event_id,
+    }
+
+
+def _ranks(test_session) -> dict[str, list[int]]:
+    ranks: dict[str, list[int]] = {}
+    rows = test_session.execute(
+        select(LeaderboardEntry.division, LeaderboardEntry.event_result_id).order_by(
+            LeaderboardEntry.division, LeaderboardEntry.rank
+        )
+    )
+    for division, event_result_id in rows:
+        ranks.setdefault(division, []).append(event_result_id)
+    return ranks
+
+
+def test_leaderboard_follows_writes(test_client, test_session):
+    """
+    Test that creating, updating and deleting results keeps the stored
+    leaderboard ranked by position_raw, without a position last.
+    """
+    disc_event = {
+        "name": "Leaderboard League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    assert test_client.post("/api/v1/disc-events/", json=disc_event).status_code == 201
+    ids = {}
+    for username, division, position_raw in (
+        ("cara", "MA3", 3),
+        ("dnf", "MA3", None),
+        ("abe", "MA3", 1),
+        ("bo", "MA3", 2),
+        ("fay", "FA3", 1),
+    ):
+        response = test_client.post(
+            "/api/v1/event-results/",
+            json=_event_result(username, division, position_raw),
+        )
+        assert response.status_code == 201
+        ids[username] = response.json()["id"]
+    assert _ranks(test_session) == {
+        "FA3": [ids["fay"]],
+        "MA3": [ids["abe"], ids["bo"], ids["cara"], ids["dnf"]],
+    }
+
+    bo_id = ids["bo"]
+    response = test_client.put(
+        f"/api/v1/event-results/id/{bo_id}", json=_event_result("bo", "FA3", 2)
+    )
+    assert response.status_code == 200
+    assert _ranks(test_session)["FA3"] == [ids["fay"], ids["bo"]]
+    assert delete_event_result(test_session, ids["abe"])
+    assert _ranks(test_session)["MA3"] == [ids["cara"], ids["dnf"]]
+
+    response = test_client.get(
+        "/api/v1/event-results/",
+        params={"disc_event_id": 1, "group_by_division": True},
+    )
+    assert response.status_code == 200
+    grouped = response.json()["grouped"]
+    assert [group["division"] for group in grouped] == ["FA3", "MA3"]
+    assert [result["username"] for result in grouped[0]["results"]] == ["fay", "bo"]
+    assert grouped[1]["results"][-1]["username"] == "dnf"
+
+    assert test_client.delete("/api/v1/disc-events/id/1").status_code == 204
+    assert not _ranks(test_session)
+
+
+def test_grouped_pages_per_division(test_client):
+    """
+    Test that grouped results page each division on its own, by event from
+    the stored leaderboard and across events with ROW_NUMBER(), and that
+    division stats cover every result rather than the page.
+    """
+    disc_event = {
+        "name": "Paging League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    response = test_client.post("/api/v1/disc-events/", json=disc_event)
+    disc_event_id = response.json()["id"]
+    field = [("ma", "MA3", position) for position in (4, 2, None, 1, 3)]
+    field += [("fa", "FA3", 2), ("fa", "FA3", 1), ("ju", "MJ18", 1)]
+    for i, (name, division, position_raw) in enumerate(field):
+        response = test_client.post(
+            "/api/v1/event-results/",
+            json=_event_result(f"{name}{i}", division, position_raw, disc_event_id),
+        )
+        assert response.status_code == 201
+
+    def positions(params: dict) -> dict[str, list]:
+        response = test_client.get("/api/v1/event-results/", params=params)
+        assert response.status_code == 200
+        return {
+            group["division"]: [result["position_raw"] for result in group["results"]]
+            for group in response.json()["grouped"]
+        }
+
+    page = {"group_by_division": True, "skip": 1, "limit": 2}
+    expected = {"FA3": [2], "MA3": [2, 3]}
+    assert positions({**page, "disc_event_id": disc_event_id}) == expected
+    assert positions(page) == expected
+    assert positions({**page, "skip": 4}) == {"MA3": [None]}
+
+    response = test_client.get(
+        "/api/v1/event-results/",
+        params={**page, "disc_event_id": disc_event_id, "include_stats": True},
+    )
+    grouped = {group["division"]: group for group in response.json()["grouped"]}
+    assert sorted(grouped) == ["FA3", "MA3", "MJ18"]
+    assert grouped["MJ18"]["results"] == []
+    stats = grouped["MA3"]["stats"]
+    assert stats["count"] == 5
+    assert stats["average_round_score"] == pytest.approx(54.0)
+    assert stats["median_round_score"] == 53
+    assert (stats["best_round_score"], stats["worst_round_score"]) == (51, 60)
@@ -0,0 +1,336 @@
+"""
+This module contains tests for live disc event results over server-sent events
+and scoreboard WebSockets.
+"""
+
+import asyncio
+
+import pytest
+from fastapi import WebSocketDisconnect
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.api import live
+from src.api.deps import get_db, get_websocket_db
+from src.api.routes import disc_event as disc_event_routes
+from src.api.scoreboard import (
+    NOT_FOUND_CLOSE_CODE,
+    ScoreboardClient,
+    ScoreboardHub,
+    diff_rows,
+    scoreboard_hubs,
+)
+from src.core import live_broker
+from src.core.broker import LocalBroker, RedisBroker
+from src.main import app
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+def _event_result(username: str, division: str, position_raw: int) -> dict:
+    return {
+        "date": "2025-04-01T18:00:00",
+        "division": division,
+        "position": str(position_raw),
+        "position_raw": position_raw,
+        "name": username.title(),
+        "event_relative_score": 0,
+        "event_total_score": 54,
+        "username": username,
+        "round_relative_score": 0,
+        "round_total_score": 54,
+        "course_layout_id": 1,
+        "disc_event_id": 1,
+    }
+
+
+def test_broker_fan_out():
+    """
+    Test that a message published from another thread reaches every
+    subscriber, and that a full queue drops its oldest message.
+    """
+
+    async def scenario():
+        broker = LocalBroker(queue_size=2)
+        first = broker.subscribe("scores")
+        second = broker.subscribe("scores")
+        assert not broker.has_subscribers("other")
+        for message in ("a", "b", "c"):
+            await asyncio.to_thread(broker.publish, "scores", message)
+        await asyncio.sleep(0)
+        assert [await first.get(), await first.get()] == ["b", "c"]
+        assert (first.dropped, second.queue.qsize()) == (1, 2)
+        first.close()
+        second.close()
+        assert broker.subscriber_count("scores") == 0
+
+    asyncio.run(scenario())
+
+
+def test_live_stream_keepalive(monkeypatch):
+    """
+    Test that the stream opens with its snapshot, relays messages, sends
+    keepalive comments when idle and unsubscribes when closed.
+    """
+    monkeypatch.setattr(live.settings, "LIVE_KEEPALIVE_SECONDS", 0.01)
+
+    async def scenario():
+        broker = LocalBroker()
+        subscription = broker.subscribe("scores")
+        stream = live.live_stream(subscription, ["event: standings\n", "data: {}\n\n"])
+        assert await anext(stream) == "event: standings\ndata: {}\n\n"
+        broker.publish("scores", "event: result\ndata: {}\n\n")
+        assert await anext(stream) == "event: result\ndata: {}\n\n"
+        assert await anext(stream) == live.KEEPALIVE
+        await stream.aclose()
+        assert broker.subscriber_count("scores") == 0
+
+    asyncio.run(scenario())
+
+
+def test_writes_publish_results_and_standings(test_client, test_session):
+    """
+    Test that creating and updating results publishes the result and the
+    standings of every division it changed to the disc event's viewers.
+    """
+    disc_event = {
+        "name": "Live League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    assert test_client.post("/api/v1/disc-events/", json=disc_event).status_code == 201
+    missing = test_client.get("/api/v1/disc-events/id/99/live")
+    assert missing.status_code == 404
+    assert not live_broker.has_subscribers(live.live_channel(99))
+
+    async def scenario():
+        subscription = live_broker.subscribe(live.live_channel(1))
+        try:
+            response = await asyncio.to_thread(
+                test_client.post,
+                "/api/v1/event-results/",
+                json=_event_result("ace", "MA3", 1),
+            )
+            assert response.status_code == 201
+            result_id = response.json()["id"]
+            created = await asyncio.wait_for(subscription.get(), 5)
+            response = await asyncio.to_thread(
+                test_client.put,
+                f"/api/v1/event-results/id/{result_id}",
+                json=_event_result("ace", "FA3", 1),
+            )
+            assert response.status_code == 200
+            updated = await asyncio.wait_for(subscription.get(), 5)
+        finally:
+            subscription.close()
+        return created, updated
+
+    created, updated = asyncio.run(scenario())
+    assert created.startswith("event: result\ndata: ")
+    assert created.count("event: standings") == 1
+    assert '"username":"ace"' in created
+    assert updated.count("event: standings") == 2
+    empty_division = '"division":"MA3","results":[]'
+    assert empty_division in updated
+
+    snapshot = disc_event_routes.live_snapshot(test_session, 1)
+    assert len(snapshot) == 1 and '"division":"FA3"' in snapshot[0]
+    assert disc_event_routes.live_snapshot(test_session, 99) is None
+
+
+@pytest.fixture(name="fake_redis")
+def fake_redis_fixture(monkeypatch):
+    """
+    Point every Redis client at one in-memory fakeredis server, as the
+    workers of a deployment share one Redis.
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    redis_asyncio = pytest.importorskip("redis.asyncio")
+    server = fakeredis.FakeServer()
+    monkeypatch.setattr(
+        redis_asyncio.Redis,
+        "from_url",
+        lambda unused_url: fakeredis.FakeAsyncRedis(server=server),
+    )
+    monkeypatch.setattr(
+        pytest.importorskip("redis").Redis,
+        "from_url",
+        lambda unused_url: fakeredis.FakeRedis(server=server),
+    )
+    return server
+
+
+async def _until(condition, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not condition():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.usefixtures("fake_redis")
+def test_redis_broker_across_workers():
+    """
+    Test that a message published by one worker reaches the subscribers of
+    another through Redis, and that publishers see whether any worker has
+    subscribers on a channel.
+    """
+
+    async def scenario():
+        viewer_worker = RedisBroker("redis://fake", prefix="test:")
+        writer_worker = RedisBroker("redis://fake", prefix="test:")
+        assert not writer_worker.has_subscribers("event:1")
+        subscription = viewer_worker.subscribe("event:1")
+        try:
+            await _until(lambda: writer_worker.has_subscribers("event:1"))
+            assert not writer_worker.has_subscribers("event:2")
+            await asyncio.to_thread(writer_worker.publish, "event:1", "hello")
+            assert await asyncio.wait_for(subscription.get(), 2) == "hello"
+        finally:
+            subscription.close()
+        await _until(lambda: not writer_worker.has_subscribers("event:1"))
+        viewer_worker.close()
+
+    asyncio.run(scenario())
+
+
+@pytest.mark.usefixtures("fake_redis")
+def test_redis_broker_falls_back_to_local_delivery(monkeypatch):
+    """
+    Test that a publish Redis refuses is still delivered to the publishing
+    worker's own subscribers, and that a failed subscriber check errs on the
+    side of publishing.
+    """
+    redis = pytest.importorskip("redis")
+    fakeredis = pytest.importorskip("fakeredis")
+
+    async def scenario():
+        broker = RedisBroker("redis://fake", prefix="test:")
+        subscription = broker.subscribe("event:1")
+
+        def refuse(*unused_args):
+            raise redis.ConnectionError("Redis is down")
+
+        monkeypatch.setattr(fakeredis.FakeRedis, "publish", refuse)
+        monkeypatch.setattr(fakeredis.FakeRedis, "pubsub_numsub", refuse)
+        try:
+            assert broker.has_subscribers("event:2")
+            await asyncio.to_thread(broker.publish, "event:1", "local")
+            assert await asyncio.wait_for(subscription.get(), 2) == "local"
+        finally:
+            subscription.close()
+            broker.close()
+
+    asyncio.run(scenario())
+
+
+def _row(result_id: int, rank: int, total: int = 54) -> dict:
+    return {"i": result_id, "r": rank, "n": "A", "p": str(rank), "s": 0, "t": total}
+
+
+def test_scoreboard_deltas_and_slow_clients():
+    """
+    Test that deltas carry new rows in full, only the changed fields of
+    shown rows and the ids that left, and that a client whose queue is
+    full is dropped from the broadcast.
+    """
+    assert diff_rows([_row(1, 1), _row(2, 2)], [_row(2, 1), _row(3, 2, 50)]) == {
+        "u": [{"i": 2, "r": 1, "p": "1"}, _row(3, 2, 50)],
+        "x": [1],
+    }
+    assert not diff_rows([_row(1, 1)], [_row(1, 1)])
+
+    async def scenario():
+        hub = ScoreboardHub(1, LocalBroker().subscribe("scoreboard:1"))
+        hub.rows = {"MA3": [_row(1, 1)], "FA3": [_row(2, 1)]}
+        fast, slow = ScoreboardClient(None, 2), ScoreboardClient(None, 1)
+        hub.clients = {fast, slow}
+        hub.broadcast(hub.snapshot())
+        assert hub.apply({"MA3": [_row(1, 1)]}) is None
+        delta = hub.apply({"MA3": [_row(1, 1, 53)], "FA3": []})
+        hub.broadcast(delta)
+        assert hub.clients == {fast} and slow.too_slow.is_set()
+        assert hub.rows == {"MA3": [_row(1, 1, 53)]}
+        return delta
+
+    assert asyncio.run(scenario()) == (
+        '{"k":"d","d":{"MA3":{"u":[{"i":1,"t":53}]},"FA3":{"x":[2]}}}'
+    )
+
+
+def test_scoreboard_websocket(test_session):
+    """
+    Test that a scoreboard gets a snapshot, then the deltas of writes, and
+    that an unknown disc event closes the socket.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    app.dependency_overrides[get_websocket_db] = get_session_override
+    with TestClient(app) as test_client:
+        with test_client.websocket_connect(
+            "/api/v1/disc-events/id/99/scoreboard"
+        ) as ws:
+            with pytest.raises(WebSocketDisconnect) as closed:
+                ws.receive_text()
+        assert closed.value.code == NOT_FOUND_CLOSE_CODE
+
+        with test_client.websocket_connect("/api/v1/disc-events/id/1/scoreboard") as ws:
+            snapshot = ws.receive_json()
+            assert snapshot["k"] == "s"
+            assert [row["n"] for row in snapshot["d"]["FA3"]] == ["Ace"]
+            ace_id = snapshot["d"]["FA3"][0]["i"]
+            response = test_client.post(
+                "/api/v1/event-results/", json=_event_result("bea", "FA3", 2)
+            )
+            assert response.status_code == 201
+            bea_id = response.json()["id"]
+            added = ws.receive_json()
+            response = test_client.put(
+                f"/api/v1/event-results/id/{ace_id}",
+                json=_event_result("ace", "FA3", 3),
+            )
+            assert response.status_code == 200
+            moved = ws.receive_json()
+        assert added == {
+            "k": "d",
+            "d": {
+                "FA3": {
+                    "u": [{"i": bea_id, "r": 2, "n": "Bea", "p": "2", "s": 0, "t": 54}]
+                }
+            },
+        }
+        assert moved["d"]["FA3"]["u"] == [
+            {"i": bea_id, "r": 1},
+            {"i": ace_id, "r": 2, "p": "3"},
+        ]
+    assert not scoreboard_hubs.hubs
+    app.dependency_overrides.pop(get_websocket_db)
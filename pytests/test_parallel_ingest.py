@@ -0,0 +1,165 @@
+"""
+Tests for the parallel ingestion of event result files: per-file reports,
+resuming from the import manifest and the batched upload through
+POST /event-results/sync.
+
+The process pool is swapped for a thread pool so that a test can make one
+file fail in ways parse_result_file does not catch.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from data import parallel_ingest
+from data.disc_event_index import DiscEventIndex
+from data.import_manifest import ImportManifest
+from src.api.deps import get_db
+from src.main import app
+from src.models import EventResult
+from src.models.base import Base
+
+HEADER = (
+    "division,position_raw,name,event_relative_score,event_total_score,"
+    "username,round_relative_score,round_total_score\n"
+)
+
+
+@pytest.fixture(name="test_session")
+def test_session_fixture():
+    """
+    Create an in-memory SQLite database session with one disc event.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="api_client")
+def api_client_fixture(test_session):
+    """
+    A client for the API under its v1 prefix, as the data scripts use it.
+    """
+    app.dependency_overrides[get_db] = lambda: test_session
+    with TestClient(app, base_url="http://testserver/api/v1") as api_client:
+        disc_event = {
+            "name": "Spring League",
+            "start_date": "2025-03-01T00:00:00",
+            "end_date": "2025-05-31T00:00:00",
+        }
+        assert api_client.post("/disc-events/", json=disc_event).status_code == 201
+        yield api_client
+
+
+@pytest.fixture(name="disc_event_index")
+def disc_event_index_fixture() -> DiscEventIndex:
+    return DiscEventIndex(
+        [{"id": 1, "start_date": "2025-03-01T00:00:00", "end_date": "2025-05-31"}]
+    )
+
+
+def _ingest(folder, api_client, disc_event_index, manifest_path):
+    return parallel_ingest.ingest_event_results(
+        str(folder),
+        workers=2,
+        manifest=ImportManifest.load(str(manifest_path)),
+        disc_event_index=disc_event_index,
+        client=api_client,
+    )
+
+
+def _result_count(test_session) -> int:
+    return test_session.scalar(select(func.count()).select_from(EventResult))
+
+
+def test_ingest_reports_each_file_and_resumes(
+    tmp_path, monkeypatch, api_client, disc_event_index, test_session
+):
+    """
+    Test that a file failing in its worker, even with an error the worker
+    does not catch, is reported on its own while the other files import, and
+    that a re-run skips imported files and retries only the failed ones.
+    """
+    monkeypatch.setattr(parallel_ingest, "ProcessPoolExecutor", ThreadPoolExecutor)
+    parse_result_file = parallel_ingest.parse_result_file
+    crashing = {"2025-04-08.csv"}
+
+    def crash_some(file_path, index):
+        if file_path.rsplit("/", 1)[-1] in crashing:
+            raise RuntimeError("worker died")
+        return parse_result_file(file_path, index)
+
+    monkeypatch.setattr(parallel_ingest, "parse_result_file", crash_some)
+    folder = tmp_path / "results"
+    folder.mkdir()
+    (folder / "2025-04-01.csv").write_text(
+        HEADER + "MA3,1,Ann,-5,49,ann,-5,49\nMA3,2,Bob,-3,51,bob,-3,51\n"
+    )
+    (folder / "2025-04-08.csv").write_text(HEADER + "MA3,1,Ann,-4,50,ann,-4,50\n")
+    (folder / "2025-04-15.csv").write_text("")
+    manifest_path = tmp_path / "manifest.json"
+
+    reports = _ingest(folder, api_client, disc_event_index, manifest_path)
+    first, crashed, empty = (
+        reports[str(folder / name)]
+        for name in ("2025-04-01.csv", "2025-04-08.csv", "2025-04-15.csv")
+    )
+    assert (first["status"], first["created"], first["failed"]) == ("done", 2, 0)
+    assert crashed["status"] == "failed" and "worker died" in crashed["error"]
+    assert empty["status"] == "failed" and "EmptyDataError" in empty["error"]
+    assert _result_count(test_session) == 2
+
+    crashing.clear()
+    reports = _ingest(folder, api_client, disc_event_index, manifest_path)
+    assert str(folder / "2025-04-01.csv") not in reports
+    retried = reports[str(folder / "2025-04-08.csv")]
+    assert (retried["status"], retried["created"]) == ("done", 1)
+    assert reports[str(folder / "2025-04-15.csv")]["status"] == "failed"
+    assert _result_count(test_session) == 3
+
+    (folder / "2025-04-01.csv").write_text(
+        HEADER + "MA3,1,Ann,-6,48,ann,-6,48\nMA3,2,Bob,-3,51,bob,-3,51\n"
+    )
+    changed = _ingest(folder, api_client, disc_event_index, manifest_path)
+    changed = changed[str(folder / "2025-04-01.csv")]
+    assert (changed["updated"], changed["unchanged"], changed["created"]) == (1, 1, 0)
+    assert _result_count(test_session) == 3
+
+
+def test_sync_rejects_unknown_disc_events(api_client):
+    """
+    Test that a batch upsert skips, and lists by index, results whose disc
+    event does not exist, and writes the rest.
+    """
+    result = {
+        "date": "2025-04-22T18:00:00",
+        "division": "MA3",
+        "position": "1",
+        "position_raw": 1,
+        "name": "Cy",
+        "event_relative_score": 0,
+        "event_total_score": 54,
+        "username": "cy",
+        "round_relative_score": 0,
+        "round_total_score": 54,
+        "course_layout_id": 1,
+        "disc_event_id": 1,
+    }
+    batch = [result, {**result, "username": "dee", "disc_event_id": 99}]
+    response = api_client.post("/event-results/sync", json={"event_results": batch})
+    assert response.status_code == 200
+    assert response.json() == {
+        "created": 1,
+        "updated": 0,
+        "unchanged": 0,
+        "rejected": [1],
+    }
+    response = api_client.post("/event-results/sync", json={"event_results": batch})
+    assert response.json()["unchanged"] == 1
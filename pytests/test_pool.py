@@ -0,0 +1,64 @@
+"""
+This module contains tests for connection pool sizing and metrics.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from src.core.pool import MeteredQueuePool, pool_limits, pool_stats
+from src.main import app
+
+
+@pytest.mark.parametrize(
+    "max_connections, workers, expected",
+    [(100, 4, (16, 9)), (100, 8, (8, 4)), (10, 20, (1, 1)), (30, 0, (20, 10))],
+)
+def test_pool_limits(max_connections, workers, expected):
+    """
+    Test that worker pools share the connection budget.
+    """
+    assert pool_limits(max_connections, workers) == expected
+
+
+def test_metered_pool(tmp_path):
+    """
+    Test that checkouts, waits, timeouts and overflow are reported and
+    survive the pool being recreated.
+    """
+    db_path = tmp_path / "pool.db"
+    engine = create_engine(
+        f"sqlite:///{db_path}",
+        poolclass=MeteredQueuePool,
+        pool_size=1,
+        max_overflow=1,
+        pool_timeout=0.05,
+    )
+    first, second = engine.connect(), engine.connect()
+    stats = pool_stats(engine)
+    assert stats["in_use"] == 2
+    assert stats["overflow"] == 1
+    assert stats["checkouts"] == 2
+    with pytest.raises(PoolTimeoutError):
+        engine.connect()
+    stats = pool_stats(engine)
+    assert stats["timeouts"] == 1
+    assert stats["max_wait_ms"] >= 50
+    first.close()
+    second.close()
+
+    engine.dispose()
+    engine.connect().close()
+    stats = pool_stats(engine)
+    assert stats["checkouts"] == 4
+    assert stats["in_use"] == 0
+
+
+def test_pool_stats_route():
+    """
+    Test that the pool metrics of the primary and replicas are exposed.
+    """
+    response = TestClient(app).get("/api/v1/healthcheck/pool")
+    assert response.status_code == 200
+    assert set(response.json()) == {"primary", "replicas"}
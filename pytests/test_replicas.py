@@ -0,0 +1,106 @@
+"""
+This module contains tests for read replica routing, using two SQLite
+database files as the primary and the replica.
+"""
+
+import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.api import deps
+from src.core.db import ReplicaRouter
+from src.main import app
+from src.models import DiscEvent
+from src.models.base import Base
+
+
+def _engine(path):
+    engine = create_engine(
+        f"sqlite:///{path}", connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _add_disc_event(engine, name: str) -> None:
+    with Session(engine) as session:
+        session.add(
+            DiscEvent(
+                name=name,
+                start_date=datetime.datetime(2025, 1, 1),
+                end_date=datetime.datetime(2025, 1, 31),
+            )
+        )
+        session.commit()
+
+
+@pytest.fixture(name="engines")
+def engines_fixture(tmp_path):
+    """
+    A primary and a replica database holding different disc events.
+    """
+    primary = _engine(tmp_path / "primary.db")
+    replica = _engine(tmp_path / "replica.db")
+    _add_disc_event(primary, "Primary League")
+    _add_disc_event(replica, "Replica League")
+    yield primary, replica
+    primary.dispose()
+    replica.dispose()
+
+
+@pytest.fixture(name="test_client")
+def client(engines, monkeypatch):
+    """
+    Provides a TestClient whose sessions are routed between the two files.
+    """
+    primary, replica = engines
+    monkeypatch.setattr(deps, "engine", primary)
+    monkeypatch.setattr(deps, "replica_router", ReplicaRouter([replica], 60))
+    overrides = app.dependency_overrides.copy()
+    app.dependency_overrides.clear()
+    yield TestClient(app)
+    app.dependency_overrides.update(overrides)
+
+
+def _event_names(test_client) -> list[str]:
+    return [event["name"] for event in test_client.get("/api/v1/disc-events/").json()]
+
+
+def test_reads_use_replica_until_write(test_client):
+    """
+    Test that reads go to the replica, writes to the primary, and reads right
+    after a write stay on the primary.
+    """
+    assert _event_names(test_client) == ["Replica League"]
+
+    new_event = {
+        "name": "Written League",
+        "start_date": "2025-02-01T00:00:00",
+        "end_date": "2025-02-28T00:00:00",
+    }
+    response = test_client.post("/api/v1/disc-events/", json=new_event)
+    assert response.status_code == 201
+    assert deps.PRIMARY_COOKIE in response.cookies
+    assert _event_names(test_client) == ["Primary League", "Written League"]
+
+    test_client.cookies.clear()
+    assert _event_names(test_client) == ["Replica League"]
+
+
+def test_replica_round_robin_and_health(engines, tmp_path):
+    """
+    Test that replicas are used in turn and unhealthy ones are skipped.
+    """
+    primary, replica = engines
+    router = ReplicaRouter([primary, replica], check_interval=60)
+    assert [router.choose() for _ in range(3)] == [primary, replica, primary]
+
+    missing_path = tmp_path / "missing" / "replica.db"
+    missing = create_engine(f"sqlite:///{missing_path}")
+    router = ReplicaRouter([missing, replica], check_interval=60)
+    assert [router.choose() for _ in range(2)] == [replica, replica]
+    assert router.is_healthy(0) is False
+    assert ReplicaRouter([missing], check_interval=60).choose() is None
@@ -0,0 +1,147 @@
+"""
+Tests for the columnar conversion of event result files, checked against the
+previous row-by-row loop kept in data.benchmark_csv_conversion, and for the
+conversion of XLSX files.
+"""
+
+import math
+
+import pandas as pd
+import pytest
+
+from data.benchmark_csv_conversion import DATE_VAL, row_loop_conversion
+from data.import_manifest import ImportManifest, file_digest
+from data.round_processing import (
+    assign_points,
+    build_event_result_records,
+    convert_xlsx_to_csv,
+    validate_event_results,
+)
+from src.schemas.event_results import EventResultCreate
+
+
+def _row(username: str, position_raw, **fields) -> dict:
+    row = {
+        "division": "MA3",
+        "position_raw": position_raw,
+        "name": username.title(),
+        "event_relative_score": 0,
+        "event_total_score": 54,
+        "pdga_number": 12345,
+        "username": username,
+        "round_relative_score": 0,
+        "round_total_score": 54,
+    }
+    row.update(fields)
+    return row
+
+
+@pytest.fixture(name="results_df")
+def results_df_fixture() -> pd.DataFrame:
+    """
+    Results with a tie, a DNF, inf and NaN values, numbers as strings and
+    rows that cannot be valid.
+    """
+    return assign_points(
+        pd.DataFrame(
+            [
+                _row("ann", 1, pdga_number=math.inf),
+                _row("bob", 2, event_total_score="55"),
+                _row("cy", 2.0, event_relative_score=-math.inf, pdga_number=None),
+                _row("dee", "DNF", round_total_score="60"),
+                _row("eve", 4, name=math.nan),
+                _row("fay", 5, event_total_score="abc"),
+            ]
+        )
+    )
+
+
+def _by_username(results: list[EventResultCreate]) -> dict[str, EventResultCreate]:
+    return {result.username: result for result in results}
+
+
+def test_records_clean_and_coerce(results_df):
+    """
+    Test that inf and NaN become None, positions are parsed from
+    position_raw (ties share a position, "DNF" has none) and numbers are
+    coerced as whole columns.
+    """
+    records = {
+        record["username"]: record
+        for record in build_event_result_records(results_df, DATE_VAL, 7, 3)
+    }
+    assert records["ann"]["pdga_number"] is None
+    assert records["ann"]["position"] == "1"
+    assert records["bob"]["position"] == records["cy"]["position"] == "2"
+    assert records["bob"]["round_points"] == records["cy"]["round_points"] == 28.5
+    assert records["bob"]["event_total_score"] == 55
+    assert records["cy"]["event_relative_score"] is None
+    assert (records["dee"]["position"], records["dee"]["position_raw"]) == ("", None)
+    assert records["dee"]["round_total_score"] == 60
+    assert records["dee"]["round_points"] == 0.0
+    assert records["eve"]["name"] is None
+    assert records["fay"]["event_total_score"] is None
+    ann_ids = (records["ann"]["disc_event_id"], records["ann"]["course_layout_id"])
+    assert ann_ids == (7, 3)
+    assert all(record["hole_scores"] == [] for record in records.values())
+
+
+def test_validation_drops_bad_rows(results_df):
+    """
+    Test that one TypeAdapter call rejects only the rows that are invalid.
+    """
+    records = build_event_result_records(results_df, DATE_VAL, 1)
+    valid = _by_username(validate_event_results(records))
+    assert sorted(valid) == ["ann", "bob", "dee"]
+    assert valid["dee"].position_raw is None
+    assert validate_event_results([]) == []
+
+
+def test_matches_row_loop(results_df):
+    """
+    Test that the columnar pipeline keeps the same rows with the same values
+    as the previous row-by-row loop, whose positions were written as floats.
+    The row loop also dropped DNF rows, whose points were NaN; they now get
+    0 points.
+    """
+    columnar = _by_username(
+        validate_event_results(build_event_result_records(results_df, DATE_VAL, 1))
+    )
+    row_loop = _by_username(
+        [EventResultCreate(**row) for row in row_loop_conversion(results_df.copy())]
+    )
+    assert columnar.keys() - row_loop.keys() == {"dee"}
+    for username, previous in row_loop.items():
+        result = columnar[username]
+        assert result.model_dump(exclude={"position"}) == previous.model_dump(
+            exclude={"position"}
+        )
+        if result.position_raw is not None:
+            assert float(result.position) == float(previous.position)
+
+
+def test_convert_skips_imported_xlsx(tmp_path):
+    """
+    Test that an XLSX file imported with the same contents is not parsed
+    again, while new, changed and failed ones are converted.
+    """
+    pytest.importorskip("openpyxl")
+    manifest = ImportManifest(str(tmp_path / "manifest.json"))
+    for name in ("done", "failed", "new"):
+        pd.DataFrame([_row(name, 1)]).to_excel(tmp_path / f"{name}.xlsx", index=False)
+    for name, status in (("done", "done"), ("failed", "failed")):
+        xlsx_file = tmp_path / f"{name}.xlsx"
+        manifest.record(xlsx_file, file_digest(xlsx_file), status)
+
+    converted = convert_xlsx_to_csv(tmp_path, manifest)
+    assert sorted(converted) == [
+        str(tmp_path / "failed.csv"),
+        str(tmp_path / "new.csv"),
+    ]
+    assert not (tmp_path / "done.csv").exists()
+    assert pd.read_csv(tmp_path / "new.csv")["username"].tolist() == ["new"]
+
+    pd.DataFrame([_row("changed", 1)]).to_excel(tmp_path / "done.xlsx", index=False)
+    assert sorted(convert_xlsx_to_csv(tmp_path, manifest)) == [
+        str(tmp_path / name) for name in ("done.csv", "failed.csv", "new.csv")
+    ]
@@ -0,0 +1,417 @@
+"""
+Tests for the UDisc scraper pipeline.
+
+Course pages are served from local HTML fixtures by a stub HTTP server, so no
+requests are made to UDisc. Tests that render pages are skipped when no
+Chromium build is installed for Playwright; parsing and the HTML cache are
+tested offline.
+"""
+
+import asyncio
+import datetime
+import json
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlparse
+
+import httpx
+import pytest
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
+
+from scraping.checkpoint import ScrapeCheckpoint
+from scraping.course_sink import build_course_sync, sync_courses
+from scraping.fetch_course_details import fetch_page_html, get_course_details
+from scraping.fetch_course_pages import get_course_list
+from scraping.html_cache import HtmlCache
+from scraping.parsers import parse_course_html, parse_course_list_html
+from scraping.schemas import UDiscCoords
+from scraping.tiling import crawl_tiles, initial_tiles
+
+FIXTURES = Path(__file__).parent / "fixtures" / "udisc"
+BASE_URL = "https://udisc.example"
+COURSE_LINKS = [
+    "/courses/memorial-park-a1b2",
+    "/courses/tc-jester-c3d4",
+    "/courses/no-reviews-e5f6",
+]
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    """
+    Serve /courses from courses.html and /courses/<slug> from <slug>.html.
+    """
+
+    def translate_path(self, path):
+        parts = urlparse(path).path.strip("/").split("/")
+        name = parts[-1] if len(parts) > 1 else parts[0]
+        return str(Path(self.directory) / f"{name}.html")
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        pass
+
+
+@pytest.fixture(name="stub_server", scope="module")
+def stub_server_fixture():
+    """
+    Serve the UDisc HTML fixtures on a random local port.
+    """
+    handler = partial(FixtureHandler, directory=str(FIXTURES))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+async def _chromium_installed() -> bool:
+    async with async_playwright() as p:
+        try:
+            browser = await p.chromium.launch(headless=True)
+        except PlaywrightError:
+            return False
+        await browser.close()
+        return True
+
+
+@pytest.fixture(name="chromium", scope="module")
+def chromium_fixture():
+    """
+    Skip browser tests when Playwright's Chromium is not installed.
+    """
+    if not asyncio.run(_chromium_installed()):
+        pytest.skip("Playwright Chromium is not installed")
+
+
+def test_get_course_details_uses_checkpoint_without_browser(tmp_path):
+    """
+    Test that fully checkpointed courses are returned without scraping.
+    """
+    checkpoint = ScrapeCheckpoint(str(tmp_path / "checkpoint.json"))
+    for link in COURSE_LINKS:
+        checkpoint.mark_done(link, {"name": link})
+    checkpoint.flush()
+
+    details = asyncio.run(
+        get_course_details(
+            COURSE_LINKS[::-1],
+            base_url="http://127.0.0.1:9",
+            checkpoint_path=checkpoint.path,
+        )
+    )
+
+    assert [course["name"] for course in details] == COURSE_LINKS[::-1]
+    # A completed run clears the checkpoint, so the next run scrapes afresh.
+    assert not (tmp_path / "checkpoint.json").exists()
+
+
+def test_checkpoint_saves_in_batches(tmp_path):
+    """
+    Test that the checkpoint is written every save_every courses and on
+    flush, and that clearing it deletes the file.
+    """
+    path = tmp_path / "checkpoint.json"
+    checkpoint = ScrapeCheckpoint(str(path), save_every=2)
+    checkpoint.mark_done(COURSE_LINKS[0], {"name": "one"})
+    assert not path.exists()
+    checkpoint.mark_done(COURSE_LINKS[1], {"name": "two"})
+    assert len(ScrapeCheckpoint.load(str(path)).done) == 2
+    checkpoint.mark_done(COURSE_LINKS[2], {"name": "three"})
+    checkpoint.flush()
+    assert ScrapeCheckpoint.load(str(path)).pending(COURSE_LINKS) == []
+
+    checkpoint.clear()
+    assert not path.exists()
+    assert ScrapeCheckpoint.load(str(path)).pending(COURSE_LINKS) == COURSE_LINKS
+
+
+@pytest.mark.usefixtures("chromium")
+def test_get_course_list_from_stub_server(stub_server):
+    """
+    Test that course links are collected once the list has rendered.
+    """
+    courses = asyncio.run(get_course_list(f"{stub_server}/courses?zoom=10"))
+
+    assert courses == COURSE_LINKS
+
+
+@pytest.mark.usefixtures("chromium")
+def test_get_course_details_worker_pool_resumes(stub_server, tmp_path):
+    """
+    Test that the worker pool scrapes pending courses only, skips pages that
+    never render and records results in the checkpoint.
+    """
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    ScrapeCheckpoint(
+        checkpoint_path, {COURSE_LINKS[0]: {"name": "from checkpoint"}}
+    ).save()
+    links = COURSE_LINKS + ["/courses/missing-0000"]
+
+    details = asyncio.run(
+        get_course_details(
+            links,
+            workers=2,
+            base_url=stub_server,
+            checkpoint_path=checkpoint_path,
+            timeout=2_000,
+        )
+    )
+
+    assert [course["name"] for course in details] == [
+        "from checkpoint",
+        "TC Jester",
+        "No Reviews",
+    ]
+    assert details[1] == {
+        "name": "TC Jester",
+        "location": "Houston, TX",
+        "rating": "3.9",
+        "reviews_count": 856,
+        "link": "/courses/tc-jester-c3d4",
+        "latitude": None,
+        "longitude": None,
+    }
+    assert details[2]["reviews_count"] is None
+    saved = ScrapeCheckpoint.load(checkpoint_path)
+    assert saved.pending(links) == ["/courses/missing-0000"]
+
+
+def _fixture_html(course_link: str) -> str:
+    slug = course_link.rsplit("/", 1)[-1]
+    return (FIXTURES / f"{slug}.html").read_text()
+
+
+def test_parse_course_html_fixtures():
+    """
+    Test that the lxml parsers extract the same fields as the browser scraper.
+    """
+    assert parse_course_list_html(_fixture_html("/courses")) == COURSE_LINKS
+    assert parse_course_html(_fixture_html(COURSE_LINKS[0]), COURSE_LINKS[0]) == {
+        "name": "Memorial Park",
+        "location": "Houston, TX",
+        "rating": "4.3",
+        "reviews_count": 1204,
+        "link": "/courses/memorial-park-a1b2",
+        "latitude": 29.7646,
+        "longitude": -95.4413,
+    }
+    no_reviews = parse_course_html(_fixture_html(COURSE_LINKS[2]), COURSE_LINKS[2])
+    assert no_reviews["rating"] is None
+    assert no_reviews["reviews_count"] is None
+
+
+def test_html_cache_is_content_addressed_and_expires(tmp_path):
+    """
+    Test that identical pages share one stored object and that expired pages
+    are only returned when stale entries are allowed.
+    """
+    cache = HtmlCache(str(tmp_path), max_age=datetime.timedelta(days=1))
+    html = _fixture_html(COURSE_LINKS[0])
+    digest = cache.put(f"{BASE_URL}/a", html, etag='"v1"')
+    assert cache.put(f"{BASE_URL}/b", html) == digest
+    assert len(list((tmp_path / "objects").rglob("*.html"))) == 1
+    cache.flush()
+
+    reloaded = HtmlCache(str(tmp_path), max_age=datetime.timedelta(days=1))
+    assert reloaded.get(f"{BASE_URL}/a") == html
+    assert reloaded.entry(f"{BASE_URL}/a")["etag"] == '"v1"'
+
+    reloaded.index[f"{BASE_URL}/a"]["expires_at"] = "2000-01-01T00:00:00+00:00"
+    assert reloaded.get(f"{BASE_URL}/a") is None
+    assert reloaded.get(f"{BASE_URL}/a", allow_stale=True) == html
+
+
+class _Response:
+    def __init__(self, status: int):
+        self.status = status
+        self.headers = {"etag": '"v2"'}
+
+
+class _Page:
+    """
+    Stand-in for a Playwright page whose conditional requests get a 304.
+    """
+
+    def __init__(self, status: int, empty: bool = False):
+        self.status = status
+        self.empty = empty
+        self.request = self
+        self.sent: list[dict] = []
+        self.rendered = 0
+        self.waits: list[tuple[str, int]] = []
+
+    async def get(self, unused_url, headers):
+        self.sent.append(headers)
+        return _Response(self.status)
+
+    async def goto(self, unused_url, wait_until, timeout=None):
+        self.rendered += 1
+        self.waits.append((wait_until, timeout))
+        return _Response(200)
+
+    async def wait_for_selector(self, unused_selector, timeout):
+        self.waits.append(("selector", timeout))
+        if self.empty:
+            raise PlaywrightTimeoutError("no courses")
+
+    async def content(self):
+        return "<html>rendered</html>"
+
+
+def test_fetch_page_html_revalidates_expired_pages(tmp_path):
+    """
+    Test that an expired page is requested with its validators, returned
+    from the cache and renewed on a 304, and rendered again otherwise. The
+    index is only written every save_every entries or on flush.
+    """
+    cache = HtmlCache(str(tmp_path), save_every=3)
+    url = f"{BASE_URL}/a"
+    cache.put(url, "<html>cached</html>", etag='"v1"', last_modified="Mon")
+    cache.index[url]["expires_at"] = "2000-01-01T00:00:00+00:00"
+    assert not cache.index_path.exists()
+
+    page = _Page(304)
+    html = asyncio.run(fetch_page_html(page, url, "h1", cache))
+    assert html == "<html>cached</html>"
+    assert page.sent == [{"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}]
+    assert page.rendered == 0
+    assert cache.is_fresh(url)
+
+    page = _Page(200)
+    html = asyncio.run(fetch_page_html(page, url, "h1", cache))
+    assert html == "<html>rendered</html>"
+    assert page.rendered == 1
+    assert page.waits == [("domcontentloaded", None), ("selector", 30_000)]
+    assert HtmlCache(str(tmp_path)).entry(url)["etag"] == '"v2"'
+
+    assert asyncio.run(fetch_page_html(_Page(304), f"{BASE_URL}/b", "h1", cache))
+    assert f"{BASE_URL}/b" not in HtmlCache(str(tmp_path)).index
+    cache.flush()
+    assert f"{BASE_URL}/b" in HtmlCache(str(tmp_path)).index
+
+
+def test_fetch_page_html_caches_empty_pages(tmp_path):
+    """
+    Test that a page allowed to be empty waits for the page to load, then
+    only briefly for the selector, and is cached when it never appears.
+    """
+    cache = HtmlCache(str(tmp_path))
+    url = f"{BASE_URL}/courses?zoom=10"
+    page = _Page(200, empty=True)
+
+    html = asyncio.run(
+        fetch_page_html(page, url, "a", cache, timeout=30_000, empty_timeout=2_000)
+    )
+
+    assert page.waits == [("networkidle", 30_000), ("selector", 2_000)]
+    assert cache.get(url) == html
+    assert parse_course_list_html(html) == []
+
+
+def test_get_course_details_offline_from_cache(tmp_path):
+    """
+    Test that offline mode parses cached pages and skips uncached courses
+    without launching a browser.
+    """
+    cache = HtmlCache(str(tmp_path / "cache"))
+    for link in COURSE_LINKS[:2]:
+        cache.put(f"{BASE_URL}{link}", _fixture_html(link))
+    cache.put(f"{BASE_URL}/courses?zoom=10", _fixture_html("/courses"))
+
+    links = asyncio.run(
+        get_course_list(f"{BASE_URL}/courses?zoom=10", cache=cache, offline=True)
+    )
+    details = asyncio.run(
+        get_course_details(
+            links,
+            base_url=BASE_URL,
+            checkpoint_path=str(tmp_path / "checkpoint.json"),
+            cache=cache,
+            offline=True,
+        )
+    )
+
+    assert [course["name"] for course in details] == ["Memorial Park", "TC Jester"]
+
+
+def test_sync_courses_posts_batches():
+    """
+    Test that the sink drops invalid courses, leaves missing fields unset and
+    totals the per-batch results from the API.
+    """
+    batches = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        batch = json.loads(request.content)["courses"]
+        batches.append(batch)
+        return httpx.Response(
+            200, json={"created": len(batch), "updated": 0, "unchanged": 0}
+        )
+
+    scraped = [
+        {"name": "Memorial Park", "rating": "4.3", "link": COURSE_LINKS[0]},
+        {"name": "TC Jester", "rating": "-", "reviews_count": None},
+        {"name": None, "link": COURSE_LINKS[2]},
+    ]
+    courses = [build_course_sync(course) for course in scraped]
+    assert courses[2] is None
+
+    client = httpx.Client(
+        base_url="http://api.test", transport=httpx.MockTransport(handler)
+    )
+    totals = sync_courses(courses[:2] * 3, batch_size=4, client=client)
+
+    assert [len(batch) for batch in batches] == [4, 2]
+    assert batches[0][1] == {"name": "TC Jester"}
+    assert totals == {"created": 6, "updated": 0, "unchanged": 0, "failed": 0}
+
+
+def test_initial_tiles_partition_region():
+    """
+    Test that a large region is split into quadrants no wider than the span
+    limit that exactly cover the region, each zoomed to fit its span.
+    """
+    region = UDiscCoords.from_bounds(25.0, -107.0, 37.0, -93.0)
+
+    tiles = initial_tiles(region, max_span=2.0)
+
+    assert len(tiles) == 64
+    assert all(tile.ne_lat - tile.sw_lat <= 2.0 for tile in tiles)
+    assert all(tile.ne_lon - tile.sw_lon <= 2.0 for tile in tiles)
+    area = sum((t.ne_lat - t.sw_lat) * (t.ne_lon - t.sw_lon) for t in tiles)
+    assert area == pytest.approx(12.0 * 14.0)
+    assert {tile.zoom for tile in tiles} == {8}
+    assert {tile.zoom for tile in initial_tiles(region)} == {10}
+
+
+def test_crawl_tiles_subdivides_capped_tiles():
+    """
+    Test that tiles at the result cap are subdivided until every course is
+    found, and that links are de-duplicated across tiles.
+    """
+    courses = {
+        f"/courses/c{i}-{j}": (29.0 + i * 0.05 + 0.01, -96.0 + j * 0.05 + 0.01)
+        for i in range(8)
+        for j in range(8)
+    }
+    fetched = []
+
+    async def fetch_links(tile: UDiscCoords) -> list[str]:
+        fetched.append(tile)
+        inside = [
+            link
+            for link, (lat, lon) in courses.items()
+            if tile.sw_lat <= lat <= tile.ne_lat and tile.sw_lon <= lon <= tile.ne_lon
+        ]
+        return inside[:10]
+
+    region = UDiscCoords.from_bounds(29.0, -96.0, 29.4, -95.6)
+    links = asyncio.run(crawl_tiles([region, region], fetch_links, result_cap=10))
+
+    assert sorted(links) == sorted(courses)
+    assert len(links) == len(set(links))
+    assert all(tile.zoom <= 13 for tile in fetched)
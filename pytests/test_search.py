@@ -0,0 +1,159 @@
+"""
+This module contains tests for the search endpoint.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from src.api.deps import get_db
+from src.main import app
+from src.models.base import Base
+
+
+@pytest.fixture(scope="module", name="test_session")
+def test_session_fixture():
+    """
+    Create a shared in-memory SQLite database session for the test suite.
+    """
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    Base.metadata.create_all(engine)
+    with Session(engine) as test_session:
+        yield test_session
+
+
+@pytest.fixture(name="test_client")
+def client(test_session):
+    """
+    Provides a TestClient with the session dependency overridden.
+    """
+
+    def get_session_override():
+        return test_session
+
+    app.dependency_overrides[get_db] = get_session_override
+    return TestClient(app)
+
+
+def test_search_setup(test_client):
+    """
+    Create courses, a disc event and event results to search.
+    """
+    courses = {
+        "courses": [
+            {"name": "Memorial Park", "city": "Houston", "state": "Texas"},
+            {"name": "T.C. Jester Park", "city": "Houston", "state": "Texas"},
+            {"name": "Zilker Park", "city": "Austin", "state": "Texas"},
+        ]
+    }
+    assert test_client.post("/api/v1/courses/sync", json=courses).status_code == 200
+    disc_event = {
+        "name": "Jester Spring League",
+        "start_date": "2025-03-01T00:00:00",
+        "end_date": "2025-05-31T00:00:00",
+    }
+    assert test_client.post("/api/v1/disc-events/", json=disc_event).status_code == 201
+    for username, name, day in (
+        ("discdaddy", "Jordan Smith", "2025-04-01"),
+        ("discdaddy", "Jordan Smith", "2025-04-08"),
+        ("chainsaw", "Alex Jester", "2025-04-01"),
+    ):
+        result = {
+            "date": f"{day}T18:00:00",
+            "division": "MA3",
+            "position": "1",
+            "position_raw": 1,
+            "name": name,
+            "event_relative_score": 0,
+            "event_total_score": 54,
+            "username": username,
+            "round_relative_score": 0,
+            "round_total_score": 54,
+            "course_layout_id": 1,
+            "round_points": 0.0,
+            "disc_event_id": 1,
+        }
+        assert (
+            test_client.post("/api/v1/event-results/", json=result).status_code == 201
+        )
+
+
+def test_search_ranks_across_kinds(test_client):
+    """
+    Test that a query matches courses, disc events and players, best first,
+    with one result per player.
+    """
+    response = test_client.get("/api/v1/search/", params={"q": "jester"})
+    assert response.status_code == 200
+    results = response.json()["results"]
+    kinds = {(result["kind"], result["label"]) for result in results}
+    assert ("course", "T.C. Jester Park") in kinds
+    assert ("disc_event", "Jester Spring League") in kinds
+    assert ("player", "chainsaw") in kinds
+    assert all(result["score"] == 1.0 for result in results)
+
+    players = test_client.get("/api/v1/search/", params={"q": "discdaddy"}).json()
+    assert [result["label"] for result in players["results"]] == ["discdaddy"]
+
+
+def test_search_tolerates_typos(test_client):
+    """
+    Test that misspelled queries still find the intended course and city.
+    """
+    results = test_client.get("/api/v1/search/", params={"q": "memorail"}).json()
+    assert results["results"][0]["label"] == "Memorial Park"
+
+    results = test_client.get("/api/v1/search/", params={"q": "Austn"}).json()
+    assert results["results"][0]["label"] == "Zilker Park"
+
+
+def test_search_reflects_updates_and_validates_query(test_client):
+    """
+    Test that renamed courses are re-indexed and short queries are rejected.
+    """
+    course = test_client.get("/api/v1/courses/name/Zilker Park").json()
+    course_id = course["id"]
+    update = {"name": "Zilker Metropolitan Park"}
+    assert (
+        test_client.put(f"/api/v1/courses/id/{course_id}", json=update).status_code
+        == 200
+    )
+    results = test_client.get("/api/v1/search/", params={"q": "metropolitan"}).json()
+    assert [result["label"] for result in results["results"]] == [
+        "Zilker Metropolitan Park"
+    ]
+
+    assert test_client.get("/api/v1/search/", params={"q": "ab"}).status_code == 422
+
+
+def test_search_index_writes_and_trigram_counts(test_client, test_session):
+    """
+    Test that updating a column that is not indexed leaves the search index
+    alone, and that a typo search reads its trigram counts in one query.
+    """
+    course_id = test_client.get("/api/v1/courses/name/Memorial Park").json()["id"]
+    before = test_session.execute(text("SELECT total_changes()")).scalar_one()
+    test_session.execute(
+        text("UPDATE courses SET rating = 4.9 WHERE id = :id"), {"id": course_id}
+    )
+    after = test_session.execute(text("SELECT total_changes()")).scalar_one()
+    assert after - before == 1
+    test_session.commit()
+
+    statements = []
+
+    def record(unused_conn, unused_cursor, statement, *unused_args):
+        statements.append(statement)
+
+    engine = test_session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        results = test_client.get("/api/v1/search/", params={"q": "memorail"}).json()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    assert results["results"][0]["label"] == "Memorial Park"
+    assert sum("courses_fts_vocab" in statement for statement in statements) == 1
@@ -0,0 +1,87 @@
+"""
+Checkpoint for resumable scraper runs.
+
+Scraped course details are stored by course link as pages are parsed and
+written to disk every SAVE_EVERY courses, so an interrupted run picks up
+where it stopped instead of re-rendering every page. Once a run has scraped
+every course the checkpoint is cleared, so the next run starts afresh.
+"""
+
+import json
+import os
+
+CHECKPOINT_PATH = "scraping/.scrape_checkpoint.json"
+SAVE_EVERY = 25
+
+
+class ScrapeCheckpoint:
+    """
+    Course details keyed by course link, persisted as JSON.
+    """
+
+    def __init__(
+        self,
+        path: str = CHECKPOINT_PATH,
+        done: dict | None = None,
+        save_every: int = SAVE_EVERY,
+    ):
+        self.path = path
+        self.done: dict[str, dict] = done or {}
+        self.save_every = save_every
+        self.unsaved = 0
+
+    @classmethod
+    def load(cls, path: str = CHECKPOINT_PATH) -> "ScrapeCheckpoint":
+        """
+        Load the checkpoint from disk, or start an empty one.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                return cls(path, json.load(f))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return cls(path)
+
+    def save(self) -> None:
+        """
+        Atomically write the checkpoint so a crash never leaves it half-written.
+        """
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.done, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+        self.unsaved = 0
+
+    def flush(self) -> None:
+        """
+        Write courses recorded since the last save, if there are any.
+        """
+        if self.unsaved:
+            self.save()
+
+    def clear(self) -> None:
+        """
+        Forget every course and delete the checkpoint file, once a run has
+        scraped them all.
+        """
+        self.done = {}
+        self.unsaved = 0
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def pending(self, course_links: list[str]) -> list[str]:
+        """
+        Course links not yet scraped, in order and without duplicates.
+        """
+        return [link for link in dict.fromkeys(course_links) if link not in self.done]
+
+    def mark_done(self, course_link: str, details: dict) -> None:
+        """
+        Record the details scraped for a course, persisting the checkpoint
+        every save_every courses.
+        """
+        self.done[course_link] = details
+        self.unsaved += 1
+        if self.unsaved >= self.save_every:
+            self.save()
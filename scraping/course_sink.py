@@ -0,0 +1,94 @@
+"""
+Sink stage that persists scraped courses through the API.
+
+Scraped course details are validated as ``CourseSync`` payloads and posted to
+``POST /courses/sync`` in batches. The API matches each course to an existing
+row by link or name and only writes the fields that changed, one transaction
+per batch, so a nightly refresh only touches courses whose rating, review
+count or conditions actually moved.
+"""
+
+import httpx
+from icecream import ic
+from pydantic import ValidationError
+
+from src.core.config import settings
+from src.schemas import CourseSync
+
+SYNC_BATCH_SIZE = 200
+
+
+def build_course_sync(course: dict) -> CourseSync | None:
+    """
+    Convert scraped course details to a sync payload. Fields the scraper did
+    not find are left unset so they do not overwrite stored values.
+    :param course: Details from get_course_details.
+    :return: The payload, or None if the details are not a valid course.
+    """
+    course_data = {key: value for key, value in course.items() if value is not None}
+    if course_data.get("rating") == "-":
+        del course_data["rating"]
+    try:
+        return CourseSync.model_validate(course_data)
+    except ValidationError as e:
+        ic(e)
+        return None
+
+
+def sync_courses(
+    courses: list[CourseSync],
+    batch_size: int = SYNC_BATCH_SIZE,
+    client: httpx.Client | None = None,
+) -> dict[str, int]:
+    """
+    Post courses to the API in batches and total the results.
+    :param courses: Validated sync payloads.
+    :param batch_size: Courses per request (and per database transaction).
+    :param client: Client bound to the API base URL; one is created if omitted.
+    :return: Counts of created, updated, unchanged and failed courses.
+    """
+    totals = {"created": 0, "updated": 0, "unchanged": 0, "failed": 0}
+    owns_client = client is None
+    client = client or httpx.Client(base_url=settings.api_base_url, timeout=60.0)
+    try:
+        for start in range(0, len(courses), batch_size):
+            batch = courses[start : start + batch_size]
+            payload = {
+                "courses": [
+                    course.model_dump(mode="json", exclude_unset=True)
+                    for course in batch
+                ]
+            }
+            try:
+                response = client.post("/courses/sync", json=payload)
+                response.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                ic(f"HTTPStatusError: {e.response.status_code} - {e.response.text}")
+                totals["failed"] += len(batch)
+                continue
+            except httpx.RequestError as e:
+                ic(f"RequestError: {e}")
+                totals["failed"] += len(batch)
+                continue
+            for key, value in response.json().items():
+                totals[key] += value
+    finally:
+        if owns_client:
+            client.close()
+    ic(totals)
+    return totals
+
+
+def sync_scraped_courses(
+    course_details: list[dict], batch_size: int = SYNC_BATCH_SIZE
+) -> dict[str, int]:
+    """
+    Validate scraped course details and sync them to the API.
+    """
+    courses = [
+        course
+        for course in (build_course_sync(details) for details in course_details)
+        if course is not None
+    ]
+    ic(f"Syncing {len(courses)}/{len(course_details)} valid courses")
+    return sync_courses(courses, batch_size)
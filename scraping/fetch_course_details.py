@@ -1,59 +1,246 @@
 """
 Fetch course details from UDisc
+
+Course pages are scraped by a fixed pool of workers. Each worker owns one
+browser context and page that are reused for every course it handles, and
+waits for the course header to render instead of sleeping. Parsed details are
+written to a checkpoint as they complete so interrupted runs resume; the
+checkpoint is cleared once every course has been scraped.
+
+Rendered HTML is stored in an HtmlCache and parsed offline with lxml, so
+courses with a fresh cached page are parsed without opening the browser, and
+``offline=True`` re-parses the whole cache with no browser at all.
 """
 
 import asyncio
 
 from icecream import ic
-from playwright.async_api import Browser, async_playwright
+from playwright.async_api import Browser, BrowserContext
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import Page
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import async_playwright
 
+from scraping.checkpoint import CHECKPOINT_PATH, ScrapeCheckpoint
+from scraping.html_cache import HtmlCache
+from scraping.parsers import NAME_SELECTOR, parse_course_html
 
-async def parse_course_details(browser: Browser, course_link):
-    ic()
-    context = await browser.new_context()
-    page = await context.new_page()
-    await page.goto(f"https://udisc.com{course_link}")
-    await asyncio.sleep(5)
+UDISC_BASE_URL = "https://udisc.com"
+DEFAULT_WORKERS = 4
+PAGE_TIMEOUT_MS = 30_000
 
-    name_element = await page.query_selector(
-        "div.border-divider.mx-3.space-y-2.border-b.pb-4.md\\:mx-0 h1"
-    )
-    course_name = await name_element.inner_text() if name_element else None
-    ic(course_name)
 
-    location_element = await page.query_selector(
-        "span.my-auto.whitespace-nowrap.pr-4.text-sm.md\\:text-base"
+async def fetch_page_html(
+    page: Page,
+    url: str,
+    ready_selector: str,
+    cache: HtmlCache | None = None,
+    timeout=PAGE_TIMEOUT_MS,
+    empty_timeout: int | None = None,
+) -> str:
+    """
+    Render a page, wait for a selector to appear and return the page HTML,
+    storing it in the cache when one is given. A page cached with an ETag or
+    Last-Modified header is first requested conditionally, and the cached
+    HTML is returned without rendering if the server reports it unchanged.
+    :param page: Page to navigate; reused across calls by the caller.
+    :param url: Page URL.
+    :param ready_selector: Selector that marks the content as rendered.
+    :param cache: Optional HtmlCache the HTML is written to.
+    :param timeout: Milliseconds to wait for the selector.
+    :param empty_timeout: For pages that may have no content, such as an
+        empty map: wait up to timeout for the page to finish loading, then
+        only this many milliseconds for the selector. A page still without
+        it is returned, and cached, as it is.
+    """
+    headers = cache.conditional_headers(url) if cache is not None else {}
+    if headers:
+        response = await page.request.get(url, headers=headers)
+        if response.status == 304:
+            html = cache.revalidate(url)
+            if html is not None:
+                return html
+    if empty_timeout is None:
+        response = await page.goto(url, wait_until="domcontentloaded")
+        await page.wait_for_selector(ready_selector, timeout=timeout)
+    else:
+        response = await page.goto(url, wait_until="networkidle", timeout=timeout)
+        try:
+            await page.wait_for_selector(ready_selector, timeout=empty_timeout)
+        except PlaywrightTimeoutError:
+            ic(f"{url} loaded without {ready_selector}; treating it as empty")
+    html = await page.content()
+    if cache is not None:
+        headers = response.headers if response else {}
+        cache.put(url, html, headers.get("etag"), headers.get("last-modified"))
+    return html
+
+
+async def parse_course_details(
+    page: Page,
+    course_link,
+    base_url=UDISC_BASE_URL,
+    timeout=PAGE_TIMEOUT_MS,
+    cache: HtmlCache | None = None,
+):
+    """
+    Load a course page and extract its name, location, rating, review count,
+    link and coordinates.
+    :param page: Page to navigate; reused across courses by the caller.
+    :param course_link: Course path, e.g. "/courses/some-course-1234".
+    :param base_url: Site the course path is relative to.
+    :param timeout: Milliseconds to wait for the course header to render.
+    :param cache: Optional HtmlCache the rendered page is written to.
+    """
+    html = await fetch_page_html(
+        page, f"{base_url}{course_link}", NAME_SELECTOR, cache, timeout
     )
-    location = await location_element.inner_text() if location_element else None
-
-    reviews_link_element = await page.query_selector(f"a[href='{course_link}/reviews']")
-    rating = None
-    reviews_count = None
-    if reviews_link_element:
-        rating_element = await reviews_link_element.query_selector("div")
-        rating = await rating_element.inner_text() if rating_element else None
-        reviews_element = await reviews_link_element.query_selector("span")
-        reviews_text = await reviews_element.inner_text() if reviews_element else None
-        reviews_count = (
-            int("".join(filter(str.isdigit, reviews_text))) if reviews_text else None
-        )
+    course_details = parse_course_html(html, course_link)
+    ic(course_details["name"])
+    return course_details
 
-    await page.close()
-    await context.close()
-    return {
-        "name": course_name,
-        "location": location,
-        "rating": rating,
-        "reviews_count": reviews_count,
-    }
 
+def parse_cached_courses(
+    course_links: list[str],
+    cache: HtmlCache,
+    checkpoint: ScrapeCheckpoint,
+    base_url: str = UDISC_BASE_URL,
+    allow_stale: bool = False,
+) -> list[str]:
+    """
+    Parse courses whose page is in the cache, recording them in the checkpoint.
+    :return: Course links that still need to be fetched.
+    """
+    uncached = []
+    for course_link in course_links:
+        html = cache.get(f"{base_url}{course_link}", allow_stale=allow_stale)
+        if html is None:
+            uncached.append(course_link)
+            continue
+        checkpoint.done[course_link] = parse_course_html(html, course_link)
+        checkpoint.unsaved += 1
+    checkpoint.flush()
+    return uncached
 
-async def get_course_details(courses):
-    ic()
 
-    async with async_playwright() as p:
-        browser = await p.chromium.launch(headless=True)
-        tasks = [parse_course_details(browser, course) for course in courses]
-        course_details = await asyncio.gather(*tasks)
-        await browser.close()
-    return course_details
+async def _course_worker(
+    context: BrowserContext,
+    queue: asyncio.Queue,
+    checkpoint: ScrapeCheckpoint,
+    base_url: str,
+    timeout: int,
+    cache: HtmlCache | None,
+):
+    """
+    Scrape course links from the queue with a single reused page until the
+    queue is drained. Failed courses are logged and left out of the
+    checkpoint so the next run retries them.
+    """
+    page = await context.new_page()
+    try:
+        while True:
+            try:
+                course_link = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            try:
+                details = await parse_course_details(
+                    page, course_link, base_url, timeout, cache
+                )
+            except PlaywrightError as e:
+                ic(f"Failed to scrape {course_link}: {e}")
+                continue
+            checkpoint.mark_done(course_link, details)
+    finally:
+        await page.close()
+
+
+async def scrape_courses(
+    browser: Browser,
+    course_links: list[str],
+    checkpoint: ScrapeCheckpoint,
+    workers: int = DEFAULT_WORKERS,
+    base_url: str = UDISC_BASE_URL,
+    timeout: int = PAGE_TIMEOUT_MS,
+    cache: HtmlCache | None = None,
+):
+    """
+    Scrape the given course links with a bounded pool of workers, each with
+    its own reused browser context, recording results in the checkpoint.
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    for course_link in course_links:
+        queue.put_nowait(course_link)
+    contexts = [
+        await browser.new_context() for _ in range(min(workers, len(course_links)))
+    ]
+    try:
+        await asyncio.gather(
+            *(
+                _course_worker(context, queue, checkpoint, base_url, timeout, cache)
+                for context in contexts
+            )
+        )
+    finally:
+        for context in contexts:
+            await context.close()
+
+
+async def get_course_details(
+    courses,
+    workers: int = DEFAULT_WORKERS,
+    base_url: str = UDISC_BASE_URL,
+    checkpoint_path: str = CHECKPOINT_PATH,
+    resume: bool = True,
+    timeout: int = PAGE_TIMEOUT_MS,
+    cache: HtmlCache | None = None,
+    offline: bool = False,
+):
+    """
+    Scrape details for every course link, skipping courses already in the
+    checkpoint from an interrupted run and parsing cached pages without a
+    browser. The checkpoint is kept while courses are left to scrape and
+    cleared once every course is done.
+    :param courses: Course links from get_course_list.
+    :param workers: Number of pages scraped concurrently.
+    :param base_url: Site the course links are relative to.
+    :param checkpoint_path: Where scraped details are recorded.
+    :param resume: Reuse details from an existing checkpoint.
+    :param timeout: Milliseconds to wait for each course page to render.
+    :param cache: Optional HtmlCache; fresh pages are parsed from it.
+    :param offline: Parse only cached pages (fresh or stale); never render.
+    :return: Details for each course that has been scraped, in input order.
+    """
+    ic()
+    checkpoint = (
+        ScrapeCheckpoint.load(checkpoint_path)
+        if resume
+        else ScrapeCheckpoint(checkpoint_path)
+    )
+    pending = checkpoint.pending(courses)
+    if cache is not None:
+        pending = parse_cached_courses(
+            pending, cache, checkpoint, base_url, allow_stale=offline
+        )
+    if offline:
+        ic(f"{len(pending)} courses are not cached; skipping in offline mode")
+        pending = []
+    ic(f"Scraping {len(pending)}/{len(courses)} courses with {workers} workers")
+    if pending:
+        try:
+            async with async_playwright() as p:
+                browser = await p.chromium.launch(headless=True)
+                try:
+                    await scrape_courses(
+                        browser, pending, checkpoint, workers, base_url, timeout, cache
+                    )
+                finally:
+                    await browser.close()
+        finally:
+            checkpoint.flush()
+            if cache is not None:
+                cache.flush()
+    details = [checkpoint.done[link] for link in courses if link in checkpoint.done]
+    if not checkpoint.pending(courses):
+        checkpoint.clear()
+    return details
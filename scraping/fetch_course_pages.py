@@ -2,31 +2,70 @@
 Fetches the list of courses from UDisc for a given location.
 """
 
-import asyncio
-
 from icecream import ic
-from playwright.async_api import async_playwright
-
+from playwright.async_api import Browser, async_playwright
 
-async def get_course_list(url: str):
-    ic()
+from scraping.fetch_course_details import fetch_page_html
+from scraping.html_cache import HtmlCache
+from scraping.parsers import (
+    COURSE_LINK_SELECTOR,
+    COURSE_LIST_SELECTOR,
+    parse_course_list_html,
+)
 
-    async with async_playwright() as p:
-        courses = []
-        browser = await p.chromium.launch(headless=True)
-        page = await browser.new_page()
-        await page.goto(url)
+LIST_TIMEOUT_MS = 30_000
+# A map with no courses never renders a link; once the page has loaded, wait
+# this long for one before taking the list as empty.
+EMPTY_LIST_TIMEOUT_MS = 2_000
 
-        await asyncio.sleep(5)
 
-        elements_with_class = await page.query_selector_all(
-            ".divide-divider.border-divider.mt-2.flex-1.flex-col.divide-y.border-y"
+async def _render_course_list(
+    browser: Browser, url: str, cache: HtmlCache | None, timeout: int
+) -> str:
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        return await fetch_page_html(
+            page,
+            url,
+            f"{COURSE_LIST_SELECTOR} {COURSE_LINK_SELECTOR}",
+            cache,
+            timeout,
+            empty_timeout=EMPTY_LIST_TIMEOUT_MS,
         )
-        for element in elements_with_class:
-            course_links = await element.query_selector_all("a[href^='/courses']")
-            for course_link in course_links:
-                href = await course_link.get_attribute("href")
-                courses.append(href)
+    finally:
+        await context.close()
 
-        await browser.close()
-        return courses
+
+async def get_course_list(
+    url: str,
+    timeout: int = LIST_TIMEOUT_MS,
+    cache: HtmlCache | None = None,
+    offline: bool = False,
+    browser: Browser | None = None,
+):
+    """
+    Collect the course links shown on a UDisc course map page.
+    :param url: Course map URL, e.g. from UDiscCoords.generate_url.
+    :param timeout: Milliseconds to wait for the course list to render.
+    :param cache: Optional HtmlCache; a fresh cached page is parsed directly.
+    :param offline: Use the cached page even if stale; never render.
+    :param browser: Optional shared browser; one is launched if omitted.
+    """
+    ic()
+    html = cache.get(url, allow_stale=offline) if cache is not None else None
+    if html is None and offline:
+        ic(f"{url} is not cached; no courses in offline mode")
+        return []
+    if html is None and browser is not None:
+        html = await _render_course_list(browser, url, cache, timeout)
+    elif html is None:
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+            try:
+                html = await _render_course_list(browser, url, cache, timeout)
+            finally:
+                await browser.close()
+                if cache is not None:
+                    cache.flush()
+    return parse_course_list_html(html)
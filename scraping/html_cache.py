@@ -0,0 +1,156 @@
+"""
+Content-addressed on-disk cache of fetched page HTML.
+
+Page bodies are stored once per SHA-256 under ``objects/``, so re-fetching a
+page that has not changed does not write a new copy. ``index.json`` maps each
+URL to the hash of its latest body together with the response ETag and
+Last-Modified headers and when the entry was fetched and expires. The headers
+are sent back as If-None-Match and If-Modified-Since when an expired page is
+fetched again, so a page the server reports unchanged is not rendered again.
+
+The index is written every SAVE_EVERY entries; callers flush it when done.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+from pathlib import Path
+
+CACHE_DIR = "scraping/.html_cache"
+DEFAULT_MAX_AGE = datetime.timedelta(days=7)
+SAVE_EVERY = 50
+
+
+def _now() -> datetime.datetime:
+    return datetime.datetime.now(datetime.timezone.utc)
+
+
+class HtmlCache:
+    """
+    URL-indexed, content-addressed store of page HTML.
+    """
+
+    def __init__(
+        self, root: str = CACHE_DIR, max_age=DEFAULT_MAX_AGE, save_every=SAVE_EVERY
+    ):
+        self.root = Path(root)
+        self.max_age = max_age
+        self.save_every = save_every
+        self.unsaved = 0
+        self.index_path = self.root / "index.json"
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index: dict[str, dict] = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.index = {}
+
+    def _object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / f"{digest}.html"
+
+    def entry(self, url: str) -> dict | None:
+        """
+        Cache metadata for a URL: sha256, etag, last_modified, fetched_at and
+        expires_at.
+        """
+        return self.index.get(url)
+
+    def is_fresh(self, url: str) -> bool:
+        """
+        True if the URL is cached and has not expired.
+        """
+        entry = self.index.get(url)
+        if not entry:
+            return False
+        return datetime.datetime.fromisoformat(entry["expires_at"]) > _now()
+
+    def get(self, url: str, allow_stale: bool = False) -> str | None:
+        """
+        Return the cached HTML for a URL, or None if it is missing or expired
+        (unless allow_stale is set).
+        """
+        if not allow_stale and not self.is_fresh(url):
+            return None
+        entry = self.index.get(url)
+        if not entry:
+            return None
+        try:
+            return self._object_path(entry["sha256"]).read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+
+    def conditional_headers(self, url: str) -> dict[str, str]:
+        """
+        Headers that ask the server to send a page only if it changed since
+        it was cached, or an empty dict if there is nothing to validate.
+        """
+        entry = self.index.get(url)
+        if not entry or not self._object_path(entry["sha256"]).exists():
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def revalidate(self, url: str) -> str | None:
+        """
+        Renew the entry of a page the server reported unchanged and return its
+        cached HTML, or None if it is not cached.
+        """
+        html = self.get(url, allow_stale=True)
+        if html is not None:
+            self._touch(self.index[url])
+        return html
+
+    def _touch(self, entry: dict) -> None:
+        fetched_at = _now()
+        entry["fetched_at"] = fetched_at.isoformat()
+        entry["expires_at"] = (fetched_at + self.max_age).isoformat()
+        self.unsaved += 1
+        if self.unsaved >= self.save_every:
+            self.save()
+
+    def put(
+        self,
+        url: str,
+        html: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> str:
+        """
+        Store the HTML fetched for a URL and return its content hash.
+        """
+        digest = hashlib.sha256(html.encode("utf-8")).hexdigest()
+        object_path = self._object_path(digest)
+        if not object_path.exists():
+            object_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = object_path.with_suffix(".tmp")
+            tmp_path.write_text(html, encoding="utf-8")
+            os.replace(tmp_path, object_path)
+        self.index[url] = {
+            "sha256": digest,
+            "etag": etag,
+            "last_modified": last_modified,
+        }
+        self._touch(self.index[url])
+        return digest
+
+    def flush(self) -> None:
+        """
+        Write entries changed since the last save, if there are any.
+        """
+        if self.unsaved:
+            self.save()
+
+    def save(self) -> None:
+        """
+        Atomically write the index so a crash never leaves it half-written.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.index, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.index_path)
+        self.unsaved = 0
@@ -0,0 +1,76 @@
+"""
+Parse UDisc course list and course detail pages from HTML.
+
+The parsers work on page HTML alone, so they run on rendered pages and on
+cached HTML alike, without a browser.
+"""
+
+import re
+
+from lxml import html as lxml_html
+
+COURSE_LIST_SELECTOR = (
+    ".divide-divider.border-divider.mt-2.flex-1.flex-col.divide-y.border-y"
+)
+COURSE_LINK_SELECTOR = "a[href^='/courses']"
+NAME_SELECTOR = "div.border-divider.mx-3.space-y-2.border-b.pb-4.md\\:mx-0 h1"
+LOCATION_SELECTOR = "span.my-auto.whitespace-nowrap.pr-4.text-sm.md\\:text-base"
+MAP_LINK_SELECTOR = "a[href*='google.com/maps']"
+COORDINATES_PATTERN = re.compile(r"(-?\d{1,2}\.\d+),\s*(-?\d{1,3}\.\d+)")
+
+
+def _first_text(element, selector: str) -> str | None:
+    matches = element.cssselect(selector)
+    return matches[0].text_content().strip() if matches else None
+
+
+def _coordinates(document) -> tuple[float | None, float | None]:
+    """
+    Latitude and longitude from the course's map directions link, if any.
+    """
+    for link in document.cssselect(MAP_LINK_SELECTOR):
+        match = COORDINATES_PATTERN.search(link.get("href", ""))
+        if match:
+            return float(match.group(1)), float(match.group(2))
+    return None, None
+
+
+def parse_course_list_html(html: str) -> list[str]:
+    """
+    Extract the course links from a course map page.
+    """
+    document = lxml_html.fromstring(html)
+    return [
+        link.get("href")
+        for course_list in document.cssselect(COURSE_LIST_SELECTOR)
+        for link in course_list.cssselect(COURSE_LINK_SELECTOR)
+    ]
+
+
+def parse_course_html(html: str, course_link: str) -> dict:
+    """
+    Extract the name, location, rating, review count and coordinates from a
+    course page.
+    :param html: Course page HTML.
+    :param course_link: Course path, used to find the reviews link and
+        returned as the course link.
+    """
+    document = lxml_html.fromstring(html)
+    latitude, longitude = _coordinates(document)
+    rating = None
+    reviews_count = None
+    reviews_links = document.cssselect(f"a[href='{course_link}/reviews']")
+    if reviews_links:
+        rating = _first_text(reviews_links[0], "div")
+        reviews_text = _first_text(reviews_links[0], "span")
+        digits = "".join(filter(str.isdigit, reviews_text or ""))
+        reviews_count = int(digits) if digits else None
+    return {
+        "name": _first_text(document, NAME_SELECTOR),
+        "location": _first_text(document, LOCATION_SELECTOR),
+        "rating": rating,
+        "reviews_count": reviews_count,
+        "link": course_link,
+        "latitude": latitude,
+        "longitude": longitude,
+    }
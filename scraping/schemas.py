@@ -2,20 +2,83 @@
 Generate a URL for a UDisc course map based on coordinates.
 """
 
+import math
+
 from pydantic import BaseModel
 
+# A map view at zoom 10 spans about 0.6 degrees; each zoom level halves it.
+BASE_ZOOM = 10
+BASE_ZOOM_SPAN = 0.6
+MIN_ZOOM = 3
+MAX_ZOOM = 18
+
+
+def zoom_for_span(lat_span: float, lon_span: float) -> int:
+    """
+    The closest zoom level whose map view still shows the whole box.
+    """
+    span = max(lat_span, lon_span)
+    if span <= 0:
+        return MAX_ZOOM
+    zoom = BASE_ZOOM + math.floor(math.log2(BASE_ZOOM_SPAN / span))
+    return min(max(zoom, MIN_ZOOM), MAX_ZOOM)
+
 
 class UDiscCoords(BaseModel):
+    """
+    A UDisc course map view: centre, bounding box and zoom level.
+    """
+
     lat: float
     lon: float
     sw_lat: float
     sw_lon: float
     ne_lat: float
     ne_lon: float
+    zoom: int = 10
+
+    @classmethod
+    def from_bounds(
+        cls,
+        sw_lat: float,
+        sw_lon: float,
+        ne_lat: float,
+        ne_lon: float,
+        zoom: int | None = None,
+    ) -> "UDiscCoords":
+        """
+        Build a map view centred on a bounding box, at the zoom level that
+        fits the box unless one is given.
+        """
+        if zoom is None:
+            zoom = zoom_for_span(ne_lat - sw_lat, ne_lon - sw_lon)
+        return cls(
+            lat=(sw_lat + ne_lat) / 2,
+            lon=(sw_lon + ne_lon) / 2,
+            sw_lat=sw_lat,
+            sw_lon=sw_lon,
+            ne_lat=ne_lat,
+            ne_lon=ne_lon,
+            zoom=zoom,
+        )
+
+    def split(self) -> list["UDiscCoords"]:
+        """
+        Split the bounding box into four quadrants (SW, SE, NW, NE), each at
+        the zoom level that fits its own span.
+        """
+        mid_lat = (self.sw_lat + self.ne_lat) / 2
+        mid_lon = (self.sw_lon + self.ne_lon) / 2
+        return [
+            UDiscCoords.from_bounds(self.sw_lat, self.sw_lon, mid_lat, mid_lon),
+            UDiscCoords.from_bounds(self.sw_lat, mid_lon, mid_lat, self.ne_lon),
+            UDiscCoords.from_bounds(mid_lat, self.sw_lon, self.ne_lat, mid_lon),
+            UDiscCoords.from_bounds(mid_lat, mid_lon, self.ne_lat, self.ne_lon),
+        ]
 
     def generate_url(self) -> str:
         return (
-            f"https://udisc.com/courses?zoom=10&lat={self.lat}&lng={self.lon}"
+            f"https://udisc.com/courses?zoom={self.zoom}&lat={self.lat}&lng={self.lon}"
             f"&swLat={self.sw_lat}&swLng={self.sw_lon}"
             f"&neLat={self.ne_lat}&neLng={self.ne_lon}"
         )
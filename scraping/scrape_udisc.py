@@ -1,36 +1,132 @@
 """
-Scrape UDisc for a list of disc golf courses.
+Scrape UDisc for a list of disc golf courses and sync them to the API.
+
+Usage:
+    python -m scraping.scrape_udisc                 # resume from the checkpoint
+    python -m scraping.scrape_udisc --workers 8 --restart
+    python -m scraping.scrape_udisc --offline     # re-parse cached HTML only
+    python -m scraping.scrape_udisc --bbox 25.8,-106.7,36.5,-93.5   # Texas
 """
 
+import argparse
 import asyncio
 
 from icecream import ic
-from pydantic import ValidationError
 
-from scraping.fetch_course_details import get_course_details
-from scraping.fetch_course_pages import get_course_list
-from scraping.schemas import generated_url
-from src.schemas import CourseCreate
+from scraping.checkpoint import CHECKPOINT_PATH
+from scraping.course_sink import SYNC_BATCH_SIZE, sync_scraped_courses
+from scraping.fetch_course_details import DEFAULT_WORKERS, get_course_details
+from scraping.html_cache import CACHE_DIR, HtmlCache
+from scraping.schemas import UDiscCoords, coords
+from scraping.tiling import RESULT_CAP, crawl_region
+
+
+def parse_bbox(value: str) -> UDiscCoords:
+    """
+    Parse "sw_lat,sw_lon,ne_lat,ne_lon" into a map region.
+    """
+    try:
+        sw_lat, sw_lon, ne_lat, ne_lon = (float(part) for part in value.split(","))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError("expected sw_lat,sw_lon,ne_lat,ne_lon") from e
+    return UDiscCoords.from_bounds(sw_lat, sw_lon, ne_lat, ne_lon)
+
 
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Parse command line options for the scraper.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--bbox",
+        type=parse_bbox,
+        default=coords,
+        help="Region to crawl as sw_lat,sw_lon,ne_lat,ne_lon (default: Houston).",
+    )
+    parser.add_argument(
+        "--result-cap",
+        type=int,
+        default=RESULT_CAP,
+        help="Courses listed per map view; tiles at the cap are subdivided.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help="Number of map tiles and course pages scraped concurrently.",
+    )
+    parser.add_argument(
+        "--restart",
+        action="store_true",
+        help=f"Ignore {CHECKPOINT_PATH} and re-scrape every course.",
+    )
+    parser.add_argument(
+        "--offline",
+        action="store_true",
+        help=f"Re-parse every page cached in {CACHE_DIR} without a browser.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=SYNC_BATCH_SIZE,
+        help="Courses sent to the API per request and per transaction.",
+    )
+    return parser.parse_args(argv)
 
-async def main():
+
+async def main(
+    region: UDiscCoords = coords,
+    result_cap: int = RESULT_CAP,
+    workers: int = DEFAULT_WORKERS,
+    resume: bool = True,
+    offline: bool = False,
+    batch_size: int = SYNC_BATCH_SIZE,
+):
     ic()
-    courses_list = await get_course_list(url=generated_url)
-    course_details = await get_course_details(courses_list)
-    for course in course_details:
-        try:
-            rating = None if course["rating"] == "-" else course["rating"]
-            course_out = CourseCreate(
-                name=course["name"],
-                location=course["location"],
-                rating=rating,
-                reviews_count=course["reviews_count"],
-            )
-            ic(course_out.model_dump_json(indent=2))
-        except ValidationError as e:
-            ic(e)
+    cache = HtmlCache()
+    courses_list = await crawl_region(
+        region,
+        result_cap=result_cap,
+        concurrency=workers,
+        cache=cache,
+        offline=offline,
+    )
+    course_details = await get_course_details(
+        courses_list,
+        workers=workers,
+        resume=resume and not offline,
+        cache=cache,
+        offline=offline,
+    )
+    sync_scraped_courses(course_details, batch_size)
+
+
+def scrape_courses(
+    bbox: list[float] | None = None,
+    workers: int = DEFAULT_WORKERS,
+    restart: bool = False,
+    offline: bool = False,
+) -> None:
+    """
+    Scrape and sync courses from synchronous code, such as a background job.
+    :param bbox: Region as [sw_lat, sw_lon, ne_lat, ne_lon]; Houston if None.
+    """
+    region = UDiscCoords.from_bounds(*bbox) if bbox else coords
+    asyncio.run(
+        main(region=region, workers=workers, resume=not restart, offline=offline)
+    )
 
 
 if __name__ == "__main__":
     ic()
-    asyncio.run(main())
+    args = parse_args()
+    asyncio.run(
+        main(
+            region=args.bbox,
+            result_cap=args.result_cap,
+            workers=args.workers,
+            resume=not args.restart,
+            offline=args.offline,
+            batch_size=args.batch_size,
+        )
+    )
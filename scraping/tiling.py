@@ -0,0 +1,139 @@
+"""
+Quadtree crawl of the UDisc course map over an arbitrary region.
+
+A UDisc map view only lists a limited number of courses. A large region is
+first cut into tiles no bigger than a single map view, and each tile is
+fetched. Any tile whose list reaches the result cap may have been truncated,
+so it is split into four quadrants that are crawled in turn, down to a
+maximum depth. Quadrants partition their parent, so no area is fetched twice
+at the same depth. Tiles are fetched concurrently through one shared browser,
+and course links are de-duplicated across tiles in discovery order.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from icecream import ic
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from scraping.fetch_course_details import DEFAULT_WORKERS
+from scraping.fetch_course_pages import get_course_list
+from scraping.html_cache import HtmlCache
+from scraping.schemas import BASE_ZOOM_SPAN, UDiscCoords
+
+RESULT_CAP = 50
+MAX_DEPTH = 6
+MAX_TILE_SPAN = BASE_ZOOM_SPAN
+
+FetchLinks = Callable[[UDiscCoords], Awaitable[list[str]]]
+
+
+def initial_tiles(
+    region: UDiscCoords, max_span: float = MAX_TILE_SPAN
+) -> list[UDiscCoords]:
+    """
+    Split a region into tiles whose latitude and longitude spans are at most
+    max_span degrees, roughly the area of one map view. Each tile's zoom
+    level is derived from its span.
+    """
+    tiles = [region]
+    result = []
+    while tiles:
+        tile = tiles.pop()
+        too_large = (
+            tile.ne_lat - tile.sw_lat > max_span or tile.ne_lon - tile.sw_lon > max_span
+        )
+        if too_large:
+            tiles.extend(tile.split())
+        else:
+            result.append(tile)
+    return sorted(result, key=lambda tile: (tile.sw_lat, tile.sw_lon))
+
+
+async def crawl_tiles(
+    tiles: list[UDiscCoords],
+    fetch_links: FetchLinks,
+    result_cap: int = RESULT_CAP,
+    max_depth: int = MAX_DEPTH,
+    concurrency: int = DEFAULT_WORKERS,
+) -> list[str]:
+    """
+    Fetch course links for each tile, subdividing tiles that hit the cap.
+    :param tiles: Starting tiles, e.g. from initial_tiles.
+    :param fetch_links: Coroutine returning the course links of one tile.
+    :param result_cap: Number of links at which a tile is assumed truncated.
+    :param max_depth: Maximum number of times a starting tile is subdivided.
+    :param concurrency: Number of tiles fetched at the same time.
+    :return: Unique course links in discovery order.
+    """
+    links: dict[str, None] = {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def crawl_tile(tile: UDiscCoords, depth: int):
+        async with semaphore:
+            try:
+                tile_links = await fetch_links(tile)
+            except PlaywrightError as e:
+                ic(f"No course list for {tile.generate_url()}: {e}")
+                tile_links = []
+        links.update(dict.fromkeys(tile_links))
+        if len(tile_links) < result_cap:
+            return
+        if depth >= max_depth:
+            ic(f"Tile still at the result cap at max depth: {tile.generate_url()}")
+            return
+        await asyncio.gather(*(crawl_tile(child, depth + 1) for child in tile.split()))
+
+    await asyncio.gather(*(crawl_tile(tile, 0) for tile in tiles))
+    ic(f"Found {len(links)} unique courses across {len(tiles)} starting tiles")
+    return list(links)
+
+
+async def crawl_region(
+    region: UDiscCoords,
+    result_cap: int = RESULT_CAP,
+    max_depth: int = MAX_DEPTH,
+    concurrency: int = DEFAULT_WORKERS,
+    cache: HtmlCache | None = None,
+    offline: bool = False,
+) -> list[str]:
+    """
+    Collect every course link in a region using one shared browser.
+    :param region: Bounding box to crawl.
+    :param result_cap: Number of links at which a tile is assumed truncated.
+    :param max_depth: Maximum number of times a starting tile is subdivided.
+    :param concurrency: Number of tiles fetched at the same time.
+    :param cache: Optional HtmlCache for the map pages.
+    :param offline: Only use cached map pages; never render.
+    """
+    tiles = initial_tiles(region)
+    try:
+        if offline:
+
+            async def fetch_cached(tile: UDiscCoords) -> list[str]:
+                return await get_course_list(
+                    tile.generate_url(), cache=cache, offline=True
+                )
+
+            return await crawl_tiles(
+                tiles, fetch_cached, result_cap, max_depth, concurrency
+            )
+
+        async with async_playwright() as p:
+            browser = await p.chromium.launch(headless=True)
+
+            async def fetch_rendered(tile: UDiscCoords) -> list[str]:
+                return await get_course_list(
+                    tile.generate_url(), cache=cache, browser=browser
+                )
+
+            try:
+                return await crawl_tiles(
+                    tiles, fetch_rendered, result_cap, max_depth, concurrency
+                )
+            finally:
+                await browser.close()
+    finally:
+        if cache is not None:
+            cache.flush()
@@ -1,18 +1,25 @@
 """
 Module for dependency injection.
+
+SessionDep sessions use a read replica for GET, HEAD and OPTIONS requests
+when replicas are configured. Other requests use the primary and set a
+cookie that keeps the client's reads on the primary for
+READ_AFTER_WRITE_SECONDS, so it reads its own writes.
 """
 
+import time
 from collections.abc import Generator
 from typing import Annotated
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi.security import OAuth2PasswordBearer
 from jwt.exceptions import InvalidTokenError
 from pydantic import ValidationError
+from sqlalchemy import Engine
 from sqlalchemy.orm import Session, sessionmaker
 
-from src.core import engine, security, settings
+from src.core import engine, replica_router, security, settings
 from src.models import User
 from src.schemas import TokenPayload
 
@@ -25,11 +32,54 @@ session_local = sessionmaker(
 )
 
 
-def get_db() -> Generator[Session, None, None]:
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+PRIMARY_COOKIE = "read_primary_until"
+
+
+def _reads_primary(request: Request) -> bool:
+    try:
+        return float(request.cookies.get(PRIMARY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def route_engine(request: Request, response: Response) -> Engine:
+    """
+    Pick the engine for a request: a healthy replica for reads, the primary
+    for writes and for reads soon after the client's last write.
+    """
+    if not replica_router.engines:
+        return engine
+    if request.method not in READ_METHODS:
+        response.set_cookie(
+            PRIMARY_COOKIE,
+            str(time.time() + settings.READ_AFTER_WRITE_SECONDS),
+            max_age=int(settings.READ_AFTER_WRITE_SECONDS) + 1,
+            httponly=True,
+        )
+        return engine
+    if _reads_primary(request):
+        return engine
+    return replica_router.choose() or engine
+
+
+def get_db(request: Request, response: Response) -> Generator[Session, None, None]:
+    """
+    Get a database connection, on a read replica for read-only requests.
+    """
+    db = session_local(bind=route_engine(request, response))
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+def get_websocket_db() -> Generator[Session, None, None]:
     """
-    Get a database connection.
+    Get a database connection for a WebSocket, which only reads, on a read
+    replica when one is available.
     """
-    db = session_local()
+    db = session_local(bind=replica_router.choose() or engine)
     try:
         yield db
     finally:
@@ -37,6 +87,7 @@ def get_db() -> Generator[Session, None, None]:
 
 
 SessionDep = Annotated[Session, Depends(get_db)]
+WebSocketSessionDep = Annotated[Session, Depends(get_websocket_db)]
 TokenDep = Annotated[str, Depends(reusable_oauth2)]
 
 secret_key = settings.SECRET_KEY
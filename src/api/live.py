@@ -0,0 +1,112 @@
+"""
+Live results of disc events as server-sent events.
+
+GET /disc-events/id/{id}/live streams two kinds of events:
+- ``standings``: a division's top LIVE_STANDINGS_LIMIT results in leaderboard
+  order, for every division when the stream opens and afterwards for each
+  division a write changed
+- ``result``: an event result that was created or updated
+
+A write formats its events once and publishes them on the disc event's
+channel of `live_broker`, which fans them out to every viewer, so viewers add
+no database queries after their opening snapshot. The same standings go to
+the disc event's scoreboard channel (see src.api.scoreboard). Comment lines
+keep idle streams open through proxies.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Iterable
+
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+from src.api.scoreboard import encode, scoreboard_channel, scoreboard_rows
+from src.core import live_broker, settings
+from src.core.broker import Subscription
+from src.crud.leaderboard import get_standings
+from src.models import EventResult
+from src.schemas.event_results import DivisionStandings, EventResultPublic
+
+KEEPALIVE = ": keepalive\n\n"
+
+
+def live_channel(disc_event_id: int) -> str:
+    return f"disc-event:{disc_event_id}"
+
+
+def format_event(event: str, data: BaseModel) -> str:
+    return f"event: {event}\ndata: {data.model_dump_json()}\n\n"
+
+
+def standings_events(
+    disc_event_id: int, standings: dict[str, list[EventResult]]
+) -> list[str]:
+    return [
+        format_event(
+            "standings",
+            DivisionStandings(
+                disc_event_id=disc_event_id, division=division, results=results
+            ),
+        )
+        for division, results in standings.items()
+    ]
+
+
+def publish_results(
+    db: Session,
+    results: Iterable[EventResult],
+    previous_scopes: Iterable[tuple[int, str]] = (),
+) -> None:
+    """
+    Publish committed results, and the standings of the divisions they
+    changed, to the live viewers of their disc events.
+    :param previous_scopes: (disc_event_id, division) pairs updated results
+        moved out of, whose standings changed as well.
+    """
+    messages: dict[int, list[str]] = defaultdict(list)
+    divisions: dict[int, set[str]] = defaultdict(set)
+    for result in results:
+        public = EventResultPublic.model_validate(result, from_attributes=True)
+        messages[result.disc_event_id].append(format_event("result", public))
+        divisions[result.disc_event_id].add(result.division)
+    for disc_event_id, division in previous_scopes:
+        divisions[disc_event_id].add(division)
+    for disc_event_id, changed in divisions.items():
+        channel = live_channel(disc_event_id)
+        board_channel = scoreboard_channel(disc_event_id)
+        viewers = live_broker.has_subscribers(channel)
+        scoreboards = live_broker.has_subscribers(board_channel)
+        if not viewers and not scoreboards:
+            continue
+        standings = get_standings(
+            db, disc_event_id, settings.LIVE_STANDINGS_LIMIT, divisions=changed
+        )
+        if viewers:
+            events = messages[disc_event_id] + standings_events(
+                disc_event_id, standings
+            )
+            live_broker.publish(channel, "".join(events))
+        if scoreboards:
+            live_broker.publish(board_channel, encode(scoreboard_rows(standings)))
+
+
+async def live_stream(
+    subscription: Subscription, snapshot: list[str]
+) -> AsyncIterator[str]:
+    """
+    The opening snapshot, then the subscription's messages as they arrive.
+    The subscription is closed when the client disconnects.
+    """
+    try:
+        if snapshot:
+            yield "".join(snapshot)
+        while True:
+            try:
+                yield await asyncio.wait_for(
+                    subscription.get(), settings.LIVE_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield KEEPALIVE
+    finally:
+        subscription.close()
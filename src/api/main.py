@@ -10,8 +10,11 @@ from src.api.routes import (
     disc_event_router,
     event_result_router,
     healthcheck_router,
+    holes_router,
+    jobs_router,
     login_router,
     private_router,
+    search_router,
 )
 from src.core import settings
 
@@ -24,6 +27,9 @@ api_router.include_router(courses_router)
 api_router.include_router(private_router)
 api_router.include_router(event_result_router)
 api_router.include_router(disc_event_router)
+api_router.include_router(search_router)
+api_router.include_router(holes_router)
+api_router.include_router(jobs_router)
 
 if settings.ENVIRONMENT == "local":
     api_router.include_router(private_router)
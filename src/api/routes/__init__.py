@@ -7,8 +7,11 @@ from src.api.routes.courses import router as courses_router
 from src.api.routes.disc_event import router as disc_event_router
 from src.api.routes.event_result import router as event_result_router
 from src.api.routes.healthcheck import router as healthcheck_router
+from src.api.routes.holes import router as holes_router
+from src.api.routes.jobs import router as jobs_router
 from src.api.routes.login import router as login_router
 from src.api.routes.private import router as private_router
+from src.api.routes.search import router as search_router
 
 __all__ = [
     "healthcheck_router",
@@ -18,4 +21,7 @@ __all__ = [
     "private_router",
     "event_result_router",
     "disc_event_router",
+    "search_router",
+    "holes_router",
+    "jobs_router",
 ]
@@ -11,6 +11,13 @@ Routes (grouped by endpoint path, ordered by HTTP method):
 - Item endpoints (/course-layouts/id/{id}):
   - GET /course-layouts/id/{course_layout_id}: Retrieve a single course layout by ID
   - DELETE /course-layouts/id/{course_layout_id}: Delete a course layout
+  - GET /course-layouts/id/{course_layout_id}/summary: Derived layout metrics
+  - GET /course-layouts/id/{course_layout_id}/hole-stats: Per-hole scoring stats
+- Hole endpoints (/course-layouts/id/{id}/holes):
+  - GET /course-layouts/id/{course_layout_id}/holes: Retrieve a layout's holes
+  - POST /course-layouts/id/{course_layout_id}/holes: Add a hole to a layout
+  - PATCH /course-layouts/id/{course_layout_id}/holes: Update many of a
+    layout's holes in one transaction
 - Search endpoints (/course-layouts/search):
   - GET /course-layouts/search: Search course layouts by course name
 
@@ -30,10 +37,20 @@ from src.crud.course_layout import (
     get_course_layout,
     get_course_layouts,
 )
+from src.crud.hole import create_hole, get_layout_holes, patch_holes
+from src.crud.hole_score import get_layout_hole_stats
 from src.schemas.course_layouts import (
     CourseLayoutCreate,
     CourseLayoutPublic,
     CourseLayoutsPublic,
+    CourseLayoutSummary,
+)
+from src.schemas.holes import (
+    HoleCreate,
+    HolePublic,
+    HolesPatch,
+    HolesPublic,
+    LayoutHoleStats,
 )
 
 router = APIRouter(prefix="/course-layouts", tags=["Course Layouts"])
@@ -83,6 +100,80 @@ def delete_existing_course_layout(session: SessionDep, course_layout_id: int):
         raise HTTPException(status_code=404, detail="Course layout not found")
 
 
+@router.get("/id/{course_layout_id}/summary", response_model=CourseLayoutSummary)
+def read_course_layout_summary(session: SessionDep, course_layout_id: int):
+    """
+    Retrieve a layout's stored metrics (hole count, total par and distance,
+    average hole length, par distribution) without loading its holes.
+    """
+    db_course_layout = get_course_layout(db=session, course_layout_id=course_layout_id)
+    if db_course_layout is None:
+        raise HTTPException(status_code=404, detail="Course layout not found")
+    return db_course_layout
+
+
+@router.get("/id/{course_layout_id}/hole-stats", response_model=LayoutHoleStats)
+def read_course_layout_hole_stats(
+    session: SessionDep,
+    course_layout_id: int,
+    disc_event_id: int | None = None,
+    division: str | None = None,
+):
+    """
+    Per-hole scoring average, birdie/par/bogey rates and difficulty rank for a
+    course layout, optionally limited to one disc event and division.
+    """
+    stats = get_layout_hole_stats(
+        db=session,
+        course_layout_id=course_layout_id,
+        disc_event_id=disc_event_id,
+        division=division,
+    )
+    if stats is None:
+        raise HTTPException(status_code=404, detail="Course layout not found")
+    return stats
+
+
+@router.get("/id/{course_layout_id}/holes", response_model=HolesPublic)
+def read_course_layout_holes(session: SessionDep, course_layout_id: int):
+    """
+    Retrieve the holes of a course layout.
+    """
+    if get_course_layout(db=session, course_layout_id=course_layout_id) is None:
+        raise HTTPException(status_code=404, detail="Course layout not found")
+    holes = get_layout_holes(db=session, layout_id=course_layout_id)
+    return {"holes": holes, "count": len(holes)}
+
+
+@router.post("/id/{course_layout_id}/holes", response_model=HolePublic, status_code=201)
+def create_course_layout_hole(
+    session: SessionDep, course_layout_id: int, hole: HoleCreate
+):
+    """
+    Add a hole to a course layout.
+    """
+    db_hole = create_hole(db=session, layout_id=course_layout_id, hole=hole)
+    if db_hole is None:
+        raise HTTPException(status_code=404, detail="Course layout not found")
+    return db_hole
+
+
+@router.patch("/id/{course_layout_id}/holes", response_model=HolesPublic)
+def patch_course_layout_holes(
+    session: SessionDep, course_layout_id: int, holes_patch: HolesPatch
+):
+    """
+    Apply partial updates to many of a layout's holes with a single UPDATE in
+    one transaction. Nothing is changed if any hole is not on the layout.
+    """
+    holes = patch_holes(
+        db=session, patches=holes_patch.holes, layout_id=course_layout_id
+    )
+    if holes is None:
+        raise HTTPException(status_code=404, detail="Hole not found on layout")
+    return {"holes": holes, "count": len(holes)}
+
+
 @router.get("/search", response_model=CourseLayoutsPublic)
 def search_course_layouts(session: SessionDep, name: str):
     """
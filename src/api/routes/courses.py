@@ -8,12 +8,17 @@ Routes (grouped by endpoint path, ordered by HTTP method):
 - Collection endpoints (/courses):
   - GET /courses: Retrieve all courses with pagination
   - POST /courses: Create a new course
+  - POST /courses/bulk: Create many courses with their layouts and holes
+  - POST /courses/sync: Upsert a batch of scraped courses
 - Item endpoints (/courses/id/{id}):
   - GET /courses/id/{course_id}: Retrieve a single course by ID
   - PUT /courses/id/{course_id}: Update an existing course
+  - PATCH /courses/id/{course_id}: Partially update a course, diffing its
+    nested layouts and holes by id
   - DELETE /courses/id/{course_id}: Delete a course
-- Search endpoints (/courses/name/{name}):
+- Search endpoints (/courses/name/{name}, /courses/nearby):
   - GET /courses/name/{course_name}: Retrieve a course by name
+  - GET /courses/nearby: Nearest courses within a radius of a point
 
 Dependencies:
 - SessionDep: Database session dependency injection
@@ -21,18 +26,39 @@ Dependencies:
 - CRUD operations with proper error handling
 """
 
-from fastapi import APIRouter, HTTPException
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Query
+from sqlalchemy.exc import IntegrityError
 
 from src.api.deps import SessionDep
 from src.crud.course import (
+    bulk_create_courses,
+    course_exists,
     create_course,
     delete_course,
     get_course,
     get_course_by_name,
     get_courses,
+    get_existing_course_names,
+    get_nearby_courses,
+    patch_course,
+    sync_courses,
     update_course,
 )
-from src.schemas.courses import CourseCreate, CoursePublic, CoursesPublic, CourseUpdate
+from src.schemas.courses import (
+    CourseCreate,
+    CourseNearby,
+    CoursePatch,
+    CoursePublic,
+    CoursesCreate,
+    CoursesCreateResult,
+    CoursesNearbyPublic,
+    CoursesPublic,
+    CoursesSync,
+    CourseSyncResult,
+    CourseUpdate,
+)
 
 router = APIRouter(prefix="/courses", tags=["Courses"])
 
@@ -51,13 +77,47 @@ def create_new_course(session: SessionDep, course: CourseCreate):
     """
     Create a new course.
     """
-    course_check = get_course_by_name(db=session, name=course.name)
-    if course_check is not None:
+    if get_existing_course_names(db=session, names=[course.name]):
         raise HTTPException(status_code=409, detail="Course already exists")
     db_course = create_course(db=session, course=course)
     return db_course
 
 
+@router.post("/bulk", response_model=CoursesCreateResult, status_code=201)
+def create_courses_bulk(session: SessionDep, courses: CoursesCreate):
+    """
+    Create many courses with their layouts and holes in one transaction.
+    Courses whose name already exists are skipped and listed as conflicts.
+    """
+    try:
+        course_ids, conflicts = bulk_create_courses(db=session, courses=courses.courses)
+    except IntegrityError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=409, detail="Course batch conflicts with existing courses"
+        ) from e
+    return {
+        "created": len(course_ids),
+        "course_ids": course_ids,
+        "conflicts": conflicts,
+    }
+
+
+@router.post("/sync", response_model=CourseSyncResult)
+def sync_scraped_courses(session: SessionDep, courses: CoursesSync):
+    """
+    Upsert a batch of scraped courses, matched by link or name, writing only
+    the fields that changed. The batch is applied in a single transaction.
+    """
+    try:
+        return sync_courses(db=session, courses=courses.courses)
+    except IntegrityError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=409, detail="Course batch conflicts with existing courses"
+        ) from e
+
+
 @router.get("/id/{course_id}", response_model=CoursePublic)
 def read_course(session: SessionDep, course_id: int):
     """
@@ -74,13 +134,35 @@ def update_existing_course(session: SessionDep, course_id: int, course: CourseUp
     """
     Update an existing course by ID.
     """
-    existing_course = get_course(db=session, course_id=course_id)
-    if existing_course is None:
+    if not course_exists(db=session, course_id=course_id):
         raise HTTPException(status_code=404, detail="Course not found")
     updated_course = update_course(db=session, course_id=course_id, course=course)
     return updated_course
 
 
+@router.patch("/id/{course_id}", response_model=CoursePublic)
+def patch_existing_course(session: SessionDep, course_id: int, course: CoursePatch):
+    """
+    Partially update a course by ID. Only the fields sent are changed. When
+    layouts are sent they replace the course's layouts, matched by id: new
+    layouts and holes are created, missing ones deleted and changed ones
+    updated, all in one transaction.
+    """
+    try:
+        db_course = patch_course(db=session, course_id=course_id, course=course)
+    except ValueError as e:
+        session.rollback()
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    except IntegrityError as e:
+        session.rollback()
+        raise HTTPException(
+            status_code=409, detail="Course update conflicts with existing data"
+        ) from e
+    if db_course is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    return db_course
+
+
 @router.delete("/id/{course_id}", response_model=None, status_code=204)
 def delete_existing_course(session: SessionDep, course_id: int):
     """
@@ -100,3 +182,28 @@ def read_course_by_name(session: SessionDep, course_name: str):
     if db_course is None:
         raise HTTPException(status_code=404, detail="Course not found")
     return db_course
+
+
+@router.get("/nearby", response_model=CoursesNearbyPublic)
+def read_nearby_courses(
+    session: SessionDep,
+    lat: Annotated[float, Query(ge=-90, le=90)],
+    lon: Annotated[float, Query(ge=-180, le=180)],
+    radius_km: Annotated[float, Query(gt=0, le=500)] = 25.0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    """
+    Retrieve the courses nearest to a point within a radius, nearest first.
+    """
+    nearby = get_nearby_courses(
+        db=session, lat=lat, lon=lon, radius_km=radius_km, limit=limit
+    )
+    courses = []
+    for course, distance in nearby:
+        course_data = {
+            field: getattr(course, field)
+            for field in CourseNearby.model_fields
+            if field != "distance_km"
+        }
+        courses.append({**course_data, "distance_km": round(distance, 3)})
+    return {"courses": courses}
@@ -8,10 +8,22 @@ Routes (grouped by endpoint path, ordered by HTTP method):
 - Collection endpoints (/disc-events):
     - GET /disc-events: Retrieve all disc events with pagination
     - POST /disc-events: Create a new disc event
+- Lookup endpoints (/disc-events/containing):
+    - GET /disc-events/containing?date=: Retrieve the disc event whose date
+      range contains the given date
+- Search endpoints (/disc-events/name/{name}):
+    - GET /disc-events/name/{disc_event_name}: Retrieve a disc event by name
 - Item endpoints (/disc-events/id/{id}):
     - GET /disc-events/id/{disc_event_id}: Retrieve a single disc event by ID
     - PUT /disc-events/id/{disc_event_id}: Update an existing disc event
     - DELETE /disc-events/id/{disc_event_id}: Delete a disc event
+    - POST /disc-events/id/{disc_event_id}/recompute: Queue a recompute of the
+      disc event's round points and leaderboard
+- Live endpoints (/disc-events/id/{id}/live):
+    - GET /disc-events/id/{disc_event_id}/live: Stream new and updated results
+      and division standings as server-sent events
+    - WebSocket /disc-events/id/{disc_event_id}/scoreboard: Send a standings
+      snapshot, then position and score deltas
 
 Dependencies:
 - SessionDep: Database session dependency injection
@@ -19,18 +31,34 @@ Dependencies:
 - CRUD operations with proper error handling
 """
 
-from fastapi import APIRouter, HTTPException
+import datetime
 
-from src.api.deps import SessionDep
+from fastapi import APIRouter, HTTPException, WebSocket
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.api.deps import SessionDep, WebSocketSessionDep
+from src.api.live import live_channel, live_stream, standings_events
+from src.api.scoreboard import (
+    NOT_FOUND_CLOSE_CODE,
+    Rows,
+    scoreboard_rows,
+    serve_scoreboard,
+)
+from src.core import live_broker, settings
 from src.crud import (
     create_disc_event,
     delete_disc_event,
     get_disc_event,
     get_disc_event_by_name,
+    get_disc_event_for_date,
     get_disc_events,
     update_disc_event,
 )
-from src.schemas import DiscEventCreate, DiscEventPublic, DiscEventUpdate
+from src.crud.leaderboard import get_standings
+from src.jobs import enqueue_recompute
+from src.schemas import DiscEventCreate, DiscEventPublic, DiscEventUpdate, JobPublic
 
 router = APIRouter(prefix="/disc-events", tags=["Disc Events"])
 
@@ -65,6 +93,38 @@ def create_disc_event_route(
     return create_disc_event(session, disc_event)
 
 
+@router.get("/containing", response_model=DiscEventPublic)
+def get_disc_event_containing_route(
+    session: SessionDep,
+    date: datetime.datetime,
+):
+    """
+    Get the disc event whose start/end range contains the given date.
+
+    When ranges overlap, the event with the latest start date wins.
+    """
+    disc_event = get_disc_event_for_date(session, date)
+    if not disc_event:
+        raise HTTPException(
+            status_code=404, detail=f"No disc event found containing {date}"
+        )
+    return disc_event
+
+
+@router.get("/name/{disc_event_name}", response_model=DiscEventPublic)
+def get_disc_event_by_name_route(
+    session: SessionDep,
+    disc_event_name: str,
+):
+    """
+    Get a disc event by name.
+    """
+    disc_event = get_disc_event_by_name(session, disc_event_name)
+    if not disc_event:
+        raise HTTPException(status_code=404, detail="Disc event not found")
+    return disc_event
+
+
 @router.get("/id/{disc_event_id}", response_model=DiscEventPublic)
 def get_disc_event_route(
     session: SessionDep,
@@ -110,3 +170,72 @@ def delete_disc_event_route(session: SessionDep, disc_event_id: int):
     disc_event = delete_disc_event(session, disc_event_id)
     if not disc_event:
         raise HTTPException(status_code=404, detail="Disc event not found")
+
+
+@router.post("/id/{disc_event_id}/recompute", response_model=JobPublic, status_code=202)
+def recompute_disc_event_route(session: SessionDep, disc_event_id: int):
+    """
+    Queue a recompute of a disc event's round points and leaderboard. While
+    one is queued or running, that job is returned instead of a new one;
+    follow it at GET /jobs/{id}.
+    """
+    if not get_disc_event(session, disc_event_id):
+        raise HTTPException(status_code=404, detail="Disc event not found")
+    return enqueue_recompute(disc_event_id)
+
+
+def live_snapshot(session: Session, disc_event_id: int) -> list[str] | None:
+    if not get_disc_event(session, disc_event_id):
+        return None
+    snapshot = standings_events(
+        disc_event_id,
+        get_standings(session, disc_event_id, settings.LIVE_STANDINGS_LIMIT),
+    )
+    # Release the connection: the stream can stay open for hours.
+    session.close()
+    return snapshot
+
+
+@router.get("/id/{disc_event_id}/live", response_class=StreamingResponse)
+async def live_disc_event_route(session: SessionDep, disc_event_id: int):
+    """
+    Stream a disc event's results as server-sent events: the standings of
+    every division first, then each created or updated result and the
+    standings of the divisions it changed.
+    """
+    # Subscribe before reading the snapshot so no write falls in between.
+    subscription = live_broker.subscribe(live_channel(disc_event_id))
+    snapshot = None
+    try:
+        snapshot = await run_in_threadpool(live_snapshot, session, disc_event_id)
+    finally:
+        if snapshot is None:
+            subscription.close()
+    if snapshot is None:
+        raise HTTPException(status_code=404, detail="Disc event not found")
+    return StreamingResponse(
+        live_stream(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.websocket("/id/{disc_event_id}/scoreboard")
+async def scoreboard_route(
+    websocket: WebSocket, session: WebSocketSessionDep, disc_event_id: int
+):
+    """
+    Send a disc event's standings, then only the position and score changes
+    of each write, in the compact format of src.api.scoreboard.
+    """
+
+    def load_rows() -> Rows | None:
+        if not get_disc_event(session, disc_event_id):
+            return None
+        standings = get_standings(session, disc_event_id, settings.LIVE_STANDINGS_LIMIT)
+        session.close()
+        return scoreboard_rows(standings)
+
+    await websocket.accept()
+    if not await serve_scoreboard(websocket, disc_event_id, load_rows):
+        await websocket.close(code=NOT_FOUND_CLOSE_CODE, reason="Disc event not found")
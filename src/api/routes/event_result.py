@@ -3,6 +3,7 @@
 from fastapi import APIRouter, HTTPException
 
 from src.api.deps import SessionDep
+from src.api.live import publish_results
 from src.crud import (
     create_event_result,
     delete_event_result,
@@ -14,16 +15,20 @@ from src.crud import (
     get_event_results_with_division_stats,
     get_multiple_disc_event_summaries,
     get_round_score_statistics,
+    sync_event_results,
     update_event_result,
 )
 from src.crud.event_result import get_event_results_by_username
+from src.crud.leaderboard import get_division_pages, get_leaderboard
 from src.schemas.event_results import (
     EventResultCreate,
     EventResultPublic,
     EventResultsGroupedPublic,
     EventResultsGroupedWithStatsPublic,
     EventResultsPublic,
+    EventResultsSync,
     EventResultStats,
+    EventResultSyncResult,
 )
 
 router = APIRouter(
@@ -47,7 +52,12 @@ def get_event_results_route(
     sort_by_position_raw: bool = False,
     include_stats: bool = False,
 ):
-    """Retrieve event results with optional pagination, filtering, and grouping."""
+    """Retrieve event results with optional pagination, filtering, and grouping.
+
+    Grouped results are paginated per division: each division returns its
+    results ranked skip + 1 to skip + limit by position_raw, so
+    sort_by_position_raw only applies to the ungrouped results of an event.
+    """
     if disc_event_id:
         disc_event = get_disc_event(session, disc_event_id)
         if not disc_event:
@@ -72,46 +82,42 @@ def get_event_results_route(
                 )
             return {"disc_event_id": disc_event_id, "grouped": grouped_with_stats}
 
-        # Original grouping logic
-        raw_results = get_event_results_by_disc_event(
-            db=session, disc_event_id=disc_event_id, skip=skip, limit=limit
-        )
         if group_by_division:
-            divisions: dict[str, list] = {}
-            for r in raw_results:
-                divisions.setdefault(r.division, []).append(r)
-            grouped = []
-            for division, items in sorted(divisions.items()):
-                if sort_by_position_raw:
-                    items_sorted = sorted(
-                        items, key=lambda x: (x.position_raw is None, x.position_raw)
-                    )
-                else:
-                    items_sorted = items
-                grouped.append({"division": division, "results": items_sorted})
-            return {"grouped": grouped}
+            # The leaderboard stores each division's rank by position_raw.
+            leaderboard = get_leaderboard(
+                db=session, disc_event_id=disc_event_id, skip=skip, limit=limit
+            )
+            return {
+                "grouped": [
+                    {"division": division, "results": results}
+                    for division, results in leaderboard
+                ]
+            }
 
+        raw_results = get_event_results_by_disc_event(
+            db=session,
+            disc_event_id=disc_event_id,
+            skip=skip,
+            limit=limit,
+            sort_by_position_raw=sort_by_position_raw,
+        )
         return {"event_results": raw_results or []}
     else:
         # Handle case where no specific disc_event_id is provided
+        if group_by_division:
+            pages = get_division_pages(db=session, skip=skip, limit=limit)
+            if not pages:
+                raise HTTPException(status_code=404, detail="No EventResults found")
+            return {
+                "grouped": [
+                    {"division": division, "results": results}
+                    for division, results in pages
+                ]
+            }
+
         raw_results = get_event_results(db=session, skip=skip, limit=limit)
         if not raw_results:
             raise HTTPException(status_code=404, detail="No EventResults found")
-
-        if group_by_division:
-            divisions: dict[str, list] = {}
-            for r in raw_results:
-                divisions.setdefault(r.division, []).append(r)
-            grouped = []
-            for division, items in sorted(divisions.items()):
-                if sort_by_position_raw:
-                    items_sorted = sorted(
-                        items, key=lambda x: (x.position_raw is None, x.position_raw)
-                    )
-                else:
-                    items_sorted = items
-                grouped.append({"division": division, "results": items_sorted})
-            return {"grouped": grouped}
         return {"event_results": raw_results}
 
 
@@ -139,7 +145,23 @@ def create_event_result_route(
                     detail=f"Event result for username '{event_result.username}' "
                     f"on date '{event_result.date.date()}' already exists",
                 )
-    return create_event_result(db=session, event_result=event_result)
+    db_event_result = create_event_result(db=session, event_result=event_result)
+    publish_results(session, [db_event_result])
+    return db_event_result
+
+
+@router.post("/sync", response_model=EventResultSyncResult)
+def sync_event_results_route(session: SessionDep, batch: EventResultsSync):
+    """
+    Upsert a batch of event results in one transaction, matched by username
+    and day and writing only the fields that changed. Results of unknown disc
+    events are skipped and listed by index.
+    """
+    counts, written, previous_scopes = sync_event_results(
+        db=session, event_results=batch.event_results
+    )
+    publish_results(session, written, previous_scopes=previous_scopes)
+    return counts
 
 
 @router.get("/aggregated", response_model=EventResultStats)
@@ -173,6 +195,10 @@ def update_event_result_route(
     updated_event_result: EventResultCreate,
 ):
     """Update an EventResult by ID."""
+    existing = get_event_result(db=session, event_result_id=event_result_id)
+    if not existing:
+        raise HTTPException(status_code=404, detail="EventResult not found")
+    previous_scope = (existing.disc_event_id, existing.division)
     db_event_result = update_event_result(
         db=session,
         event_result_id=event_result_id,
@@ -180,6 +206,7 @@ def update_event_result_route(
     )
     if not db_event_result:
         raise HTTPException(status_code=404, detail="EventResult not found")
+    publish_results(session, [db_event_result], previous_scopes=[previous_scope])
     return db_event_result
 
 
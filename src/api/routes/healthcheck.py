@@ -4,6 +4,9 @@ All components from modules to make REST API routes for healthchecks
 
 from fastapi import APIRouter
 
+from src.core import engine, replica_router
+from src.core.pool import pool_stats
+
 router = APIRouter(prefix="/healthcheck", tags=["Healthcheck"])
 
 
@@ -13,3 +16,15 @@ def healthcheck():
     Ping style health check
     """
     return {"status": "ok"}
+
+
+@router.get("/pool")
+def connection_pool_stats():
+    """
+    Connection pool metrics of this worker: pool size, connections in use,
+    idle and overflow, and checkout count, timeouts and wait times.
+    """
+    return {
+        "primary": pool_stats(engine),
+        "replicas": [pool_stats(replica) for replica in replica_router.engines],
+    }
@@ -0,0 +1,84 @@
+"""
+API routes for managing Hole resources.
+
+This module provides RESTful endpoints for reading and editing individual
+holes. Holes are created through their layout
+(POST /course-layouts/id/{id}/holes); every write refreshes the layout's
+stored metrics.
+
+Routes (grouped by endpoint path, ordered by HTTP method):
+- Collection endpoints (/holes):
+  - GET /holes: Retrieve all holes with pagination
+  - PATCH /holes: Update many holes in one transaction
+- Item endpoints (/holes/id/{id}):
+  - GET /holes/id/{hole_id}: Retrieve a single hole by ID
+  - PUT /holes/id/{hole_id}: Update an existing hole
+  - DELETE /holes/id/{hole_id}: Delete a hole
+
+Dependencies:
+- SessionDep: Database session dependency injection
+- Pydantic schemas for request/response validation
+- CRUD operations with proper error handling
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from src.api.deps import SessionDep
+from src.crud.hole import delete_hole, get_hole, get_holes, patch_holes, update_hole
+from src.schemas.holes import HolePublic, HolesPatch, HolesPublic, HoleUpdate
+
+router = APIRouter(prefix="/holes", tags=["Holes"])
+
+
+@router.get("/", response_model=HolesPublic)
+def read_holes(session: SessionDep, skip: int = 0, limit: int = 100):
+    """
+    Retrieve all holes with optional pagination.
+    """
+    holes = get_holes(db=session, skip=skip, limit=limit)
+    return {"holes": holes, "count": len(holes)}
+
+
+@router.patch("/", response_model=HolesPublic)
+def patch_many_holes(session: SessionDep, holes_patch: HolesPatch):
+    """
+    Apply partial updates to many holes, possibly on different layouts, with
+    a single UPDATE in one transaction. Fields left out of a patch keep their
+    value; nothing is changed if any hole does not exist.
+    """
+    holes = patch_holes(db=session, patches=holes_patch.holes)
+    if holes is None:
+        raise HTTPException(status_code=404, detail="Hole not found")
+    return {"holes": holes, "count": len(holes)}
+
+
+@router.get("/id/{hole_id}", response_model=HolePublic)
+def read_hole(session: SessionDep, hole_id: int):
+    """
+    Retrieve a single hole by ID.
+    """
+    db_hole = get_hole(db=session, hole_id=hole_id)
+    if db_hole is None:
+        raise HTTPException(status_code=404, detail="Hole not found")
+    return db_hole
+
+
+@router.put("/id/{hole_id}", response_model=HolePublic)
+def update_existing_hole(session: SessionDep, hole_id: int, hole: HoleUpdate):
+    """
+    Update an existing hole by ID.
+    """
+    db_hole = update_hole(db=session, hole_id=hole_id, hole=hole)
+    if db_hole is None:
+        raise HTTPException(status_code=404, detail="Hole not found")
+    return db_hole
+
+
+@router.delete("/id/{hole_id}", status_code=204)
+def delete_existing_hole(session: SessionDep, hole_id: int):
+    """
+    Delete a hole by ID.
+    """
+    db_hole = delete_hole(db=session, hole_id=hole_id)
+    if db_hole is None:
+        raise HTTPException(status_code=404, detail="Hole not found")
@@ -0,0 +1,24 @@
+"""
+API routes for background jobs.
+
+Routes:
+- GET /jobs/{job_id}: Retrieve the status and result of a background job
+"""
+
+from fastapi import APIRouter, HTTPException
+
+from src.core import job_queue
+from src.schemas import JobPublic
+
+router = APIRouter(prefix="/jobs", tags=["Jobs"])
+
+
+@router.get("/{job_id}", response_model=JobPublic)
+def get_job_route(job_id: str):
+    """
+    Get a background job by ID. Finished jobs are kept for JOB_TTL_SECONDS.
+    """
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
@@ -0,0 +1,33 @@
+"""
+API routes for searching courses, disc events and players.
+
+Routes:
+- GET /search?q=: Ranked, typo-tolerant search across course names, cities
+  and states, disc event names, and player usernames and names
+
+Dependencies:
+- SessionDep: Database session dependency injection
+- Trigram indexes (pg_trgm on Postgres, FTS5 on SQLite) from src.models.search
+"""
+
+from typing import Annotated
+
+from fastapi import APIRouter, Query
+
+from src.api.deps import SessionDep
+from src.crud.search import search
+from src.schemas.search import SearchResults
+
+router = APIRouter(prefix="/search", tags=["Search"])
+
+
+@router.get("/", response_model=SearchResults)
+def search_route(
+    session: SessionDep,
+    q: Annotated[str, Query(min_length=3, max_length=100)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+):
+    """
+    Search courses, disc events and players, best matches first.
+    """
+    return {"query": q, "results": search(db=session, query=q, limit=limit)}
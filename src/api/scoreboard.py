@@ -0,0 +1,266 @@
+"""
+WebSocket scoreboards of disc events: a snapshot, then only what changed.
+
+Messages are compact JSON with short keys:
+- ``{"k": "s", "d": {division: [row, ...]}}``: snapshot of every division's
+  top LIVE_STANDINGS_LIMIT results in leaderboard order, sent on connect
+- ``{"k": "d", "d": {division: {"u": [row, ...], "x": [id, ...]}}}``: delta.
+  "u" holds rows new to the standings in full and, for rows already shown,
+  "i" with only the fields that changed; "x" the ids that left the standings.
+
+A row is ``{"i": event result id, "r": rank, "n": name, "p": position,
+"s": event score relative to par, "t": event total score}``.
+
+Each worker keeps one ScoreboardHub per disc event with connected clients.
+Writes publish the standings of the divisions they changed once, on the
+disc event's scoreboard channel of live_broker; the hub diffs them against
+the standings its clients have and queues the delta for each client. Every
+client is sent to from its own task out of a bounded queue, and a client
+whose queue fills up is disconnected instead of holding up the others.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+
+from fastapi import WebSocket
+from fastapi.concurrency import run_in_threadpool
+
+from src.core import live_broker, settings
+from src.core.broker import Subscription
+from src.models import EventResult
+
+SLOW_CLIENT_CLOSE_CODE = 1013  # Try again later
+NOT_FOUND_CLOSE_CODE = 4404
+
+Rows = dict[str, list[dict]]
+
+
+def scoreboard_channel(disc_event_id: int) -> str:
+    return f"scoreboard:{disc_event_id}"
+
+
+def encode(message: dict) -> str:
+    return json.dumps(message, separators=(",", ":"))
+
+
+def scoreboard_rows(standings: dict[str, list[EventResult]]) -> Rows:
+    """
+    Short-key rows of divisions' standings, ranked by their order.
+    """
+    return {
+        division: [
+            {
+                "i": result.id,
+                "r": rank,
+                "n": result.name,
+                "p": result.position,
+                "s": result.event_relative_score,
+                "t": result.event_total_score,
+            }
+            for rank, result in enumerate(results, start=1)
+        ]
+        for division, results in standings.items()
+    }
+
+
+def diff_rows(previous: list[dict], current: list[dict]) -> dict:
+    """
+    The delta turning a division's previous rows into its current rows.
+    """
+    shown = {row["i"]: row for row in previous}
+    updates = []
+    for row in current:
+        old = shown.pop(row["i"], None)
+        if old is None:
+            updates.append(row)
+            continue
+        changed = {key: value for key, value in row.items() if old[key] != value}
+        if changed:
+            updates.append({"i": row["i"], **changed})
+    delta = {}
+    if updates:
+        delta["u"] = updates
+    if shown:
+        delta["x"] = list(shown)
+    return delta
+
+
+class ScoreboardClient:
+    """
+    A connected scoreboard and its bounded queue of messages to send.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int):
+        self.websocket = websocket
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.too_slow = asyncio.Event()
+
+    def offer(self, message: str) -> bool:
+        """
+        Queue a message without waiting; False, and too_slow set, when the
+        client has fallen a full queue behind.
+        """
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.too_slow.set()
+            return False
+        return True
+
+    async def send(self) -> None:
+        while True:
+            await self.websocket.send_text(await self.queue.get())
+
+
+class ScoreboardHub:
+    """
+    The standings a disc event's scoreboards in this worker show, and the
+    clients to send their deltas to.
+    """
+
+    def __init__(self, disc_event_id: int, subscription: Subscription):
+        self.disc_event_id = disc_event_id
+        self.subscription = subscription
+        self.rows: Rows | None = None
+        self.clients: set[ScoreboardClient] = set()
+        self.ready = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+    def start(self, rows: Rows | None) -> None:
+        """
+        Set the snapshot standings and start applying published updates;
+        None when the disc event does not exist.
+        """
+        self.rows = rows
+        if rows is not None:
+            self.task = asyncio.create_task(self.run())
+        self.ready.set()
+
+    def snapshot(self) -> str:
+        return encode({"k": "s", "d": self.rows})
+
+    def apply(self, standings: Rows) -> str | None:
+        """
+        Update the shown standings of some divisions, returning the delta
+        message, or None when nothing changed.
+        """
+        delta = {}
+        for division, rows in standings.items():
+            changes = diff_rows(self.rows.get(division, []), rows)
+            if changes:
+                delta[division] = changes
+            if rows:
+                self.rows[division] = rows
+            else:
+                self.rows.pop(division, None)
+        return encode({"k": "d", "d": delta}) if delta else None
+
+    def broadcast(self, message: str) -> None:
+        for client in list(self.clients):
+            if not client.offer(message):
+                self.clients.discard(client)
+
+    async def run(self) -> None:
+        while True:
+            message = self.apply(json.loads(await self.subscription.get()))
+            if message is not None:
+                self.broadcast(message)
+
+    def close(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+        self.subscription.close()
+
+
+class ScoreboardHubs:
+    """
+    The hubs of this worker by disc event, created for a disc event's first
+    client and closed when its last client leaves.
+    """
+
+    def __init__(self):
+        self.hubs: dict[int, ScoreboardHub] = {}
+
+    async def join(
+        self,
+        disc_event_id: int,
+        client: ScoreboardClient,
+        load_rows: Callable[[], Rows | None],
+    ) -> ScoreboardHub | None:
+        """
+        Add a client to a disc event's hub and queue its snapshot. The first
+        client's hub loads the standings with load_rows (in a thread); later
+        clients share them.
+        :return: The hub, or None when the disc event does not exist.
+        """
+        hub = self.hubs.get(disc_event_id)
+        if hub is None:
+            # Subscribe before loading so no update falls in between.
+            subscription = live_broker.subscribe(scoreboard_channel(disc_event_id))
+            hub = self.hubs[disc_event_id] = ScoreboardHub(disc_event_id, subscription)
+            rows = None
+            try:
+                rows = await run_in_threadpool(load_rows)
+            finally:
+                hub.start(rows)
+                if rows is None:
+                    self._close(hub)
+        else:
+            await hub.ready.wait()
+        if hub.rows is None:
+            return None
+        hub.clients.add(client)
+        client.offer(hub.snapshot())
+        return hub
+
+    def leave(self, hub: ScoreboardHub, client: ScoreboardClient) -> None:
+        hub.clients.discard(client)
+        if not hub.clients:
+            self._close(hub)
+
+    def _close(self, hub: ScoreboardHub) -> None:
+        if self.hubs.get(hub.disc_event_id) is hub:
+            del self.hubs[hub.disc_event_id]
+        hub.close()
+
+
+scoreboard_hubs = ScoreboardHubs()
+
+
+async def _receive_until_disconnect(websocket: WebSocket) -> None:
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+async def serve_scoreboard(
+    websocket: WebSocket,
+    disc_event_id: int,
+    load_rows: Callable[[], Rows | None],
+) -> bool:
+    """
+    Send a scoreboard its snapshot and deltas until it disconnects or falls
+    behind, in which case it is closed with SLOW_CLIENT_CLOSE_CODE.
+    :return: False when the disc event does not exist.
+    """
+    client = ScoreboardClient(websocket, settings.SCOREBOARD_QUEUE_SIZE)
+    hub = await scoreboard_hubs.join(disc_event_id, client, load_rows)
+    if hub is None:
+        return False
+    tasks = [
+        asyncio.create_task(client.send()),
+        asyncio.create_task(_receive_until_disconnect(websocket)),
+        asyncio.create_task(client.too_slow.wait()),
+    ]
+    try:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in tasks:
+            task.cancel()
+        scoreboard_hubs.leave(hub, client)
+    for task in done:
+        # A client that goes away mid-send just ends its scoreboard.
+        task.exception()
+    if client.too_slow.is_set():
+        await websocket.close(code=SLOW_CLIENT_CLOSE_CODE, reason="Too far behind")
+    return True
@@ -2,13 +2,18 @@
 Export core modules for use in other modules.
 """
 
+from src.core.broker import live_broker
 from src.core.config import settings
-from src.core.db import Base, engine, init_db
+from src.core.db import Base, engine, init_db, replica_router
+from src.core.jobs import job_queue
 from src.core.security import create_access_token, get_password_hash
 
 __all__ = [
     "settings",
     "engine",
+    "replica_router",
+    "live_broker",
+    "job_queue",
     "init_db",
     "Base",
     "create_access_token",
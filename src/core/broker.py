@@ -0,0 +1,234 @@
+"""
+Publish/subscribe fan-out for live event results.
+
+Writes publish preformatted messages to a channel once; every subscriber of
+the channel gets them on its own asyncio queue. `LocalBroker` delivers only
+within this process. `RedisBroker` publishes through Redis pub/sub, and each
+worker runs one listener that hands incoming messages to its local
+subscribers, so a write reaches the viewers of every gunicorn worker with a
+single Redis connection per worker. The listener subscribes to a channel
+while the worker has subscribers on it, so PUBSUB NUMSUB tells publishers
+whether any worker does.
+
+Publishing is thread safe (sync routes run in a thread pool). A subscriber
+that falls behind by more than its queue size loses its oldest messages
+rather than holding up the publisher.
+"""
+
+import asyncio
+import importlib
+import threading
+from collections import defaultdict
+
+from src.core.config import settings
+from src.core.lazy import lazy_import
+
+icecream = lazy_import("icecream")
+redis = lazy_import("redis")  # Only needed with LIVE_BROKER=redis.
+
+
+class Subscription:
+    """
+    One subscriber's queue of messages on a channel, bound to the event loop
+    it was created on.
+    """
+
+    def __init__(self, broker: "LocalBroker", channel: str, queue_size: int):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=queue_size)
+        self.dropped = 0
+
+    def offer(self, message: str) -> None:
+        """
+        Queue a message, dropping the oldest one when the queue is full.
+        Must run on the subscription's loop.
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+        self.queue.put_nowait(message)
+
+    async def get(self) -> str:
+        return await self.queue.get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+
+class LocalBroker:
+    """
+    In-process fan-out of channel messages to asyncio subscribers.
+    """
+
+    def __init__(self, queue_size: int = 100):
+        self.queue_size = queue_size
+        self._subscriptions: dict[str, set[Subscription]] = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, channel: str) -> Subscription:
+        """
+        Start receiving a channel's messages. Must be called on the event
+        loop that will read them; close the subscription when done.
+        """
+        subscription = Subscription(self, channel, self.queue_size)
+        with self._lock:
+            self._subscriptions[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._subscriptions.get(channel, ()))
+
+    def has_subscribers(self, channel: str) -> bool:
+        """
+        Whether publishing to a channel can reach anyone, so publishers can
+        skip building messages nobody reads.
+        """
+        return self.subscriber_count(channel) > 0
+
+    def deliver(self, channel: str, message: str) -> None:
+        """
+        Hand a message to this process's subscribers of a channel, from any
+        thread.
+        """
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(channel, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, message)
+            except RuntimeError:
+                # The subscriber's event loop has shut down.
+                self.unsubscribe(subscription)
+
+    def publish(self, channel: str, message: str) -> None:
+        self.deliver(channel, message)
+
+
+class RedisBroker(LocalBroker):
+    """
+    Fan-out across processes through Redis pub/sub channels named
+    ``prefix + channel``.
+    """
+
+    def __init__(self, url: str, queue_size: int = 100, prefix: str = "live:"):
+        if redis is None:
+            raise RuntimeError("LIVE_BROKER=redis requires the redis package")
+        super().__init__(queue_size)
+        self.prefix = prefix
+        self._client = redis.Redis.from_url(url)
+        redis_asyncio = importlib.import_module("redis.asyncio")
+        self._async_client = redis_asyncio.Redis.from_url(url)
+        self._listener: asyncio.Task | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pubsub = None
+        self._channel_lock: asyncio.Lock | None = None
+        self._redis_channels: set[str] = set()
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = super().subscribe(channel)
+        if self._listener is None or self._listener.done():
+            self._loop = asyncio.get_running_loop()
+            self._pubsub = self._async_client.pubsub(ignore_subscribe_messages=True)
+            self._channel_lock = asyncio.Lock()
+            self._redis_channels = set()
+            self._listener = self._loop.create_task(self._listen())
+            with self._lock:
+                channels = list(self._subscriptions)
+            for local_channel in channels:
+                self._update_channel(local_channel)
+        else:
+            self._update_channel(channel)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        super().unsubscribe(subscription)
+        self._update_channel(subscription.channel)
+
+    def has_subscribers(self, channel: str) -> bool:
+        if self.subscriber_count(channel):
+            return True
+        try:
+            counts = self._client.pubsub_numsub(self.prefix + channel)
+        except (redis.RedisError, OSError) as exc:
+            icecream.ic(f"Live subscriber check failed, publishing anyway: {exc}")
+            return True
+        return any(count for _, count in counts)
+
+    def publish(self, channel: str, message: str) -> None:
+        try:
+            self._client.publish(self.prefix + channel, message)
+        except (redis.RedisError, OSError) as exc:
+            icecream.ic(f"Live publish to Redis failed, delivering locally: {exc}")
+            self.deliver(channel, message)
+
+    def close(self) -> None:
+        """
+        Stop the listener, which leaves every Redis channel it is on. Must be
+        called on the listener's event loop.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+
+    def _update_channel(self, channel: str) -> None:
+        """
+        Have the listener subscribe to or leave a channel in Redis to match
+        whether this worker has subscribers on it. Callable from any thread.
+        """
+        if self._loop is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._sync_channel(channel), self._loop)
+        except RuntimeError:
+            # The listener's event loop has shut down.
+            pass
+
+    async def _sync_channel(self, channel: str) -> None:
+        redis_channel = self.prefix + channel
+        async with self._channel_lock:
+            subscribed = redis_channel in self._redis_channels
+            wanted = self.subscriber_count(channel) > 0
+            try:
+                if wanted and not subscribed:
+                    await self._pubsub.subscribe(redis_channel)
+                    self._redis_channels.add(redis_channel)
+                elif subscribed and not wanted:
+                    await self._pubsub.unsubscribe(redis_channel)
+                    self._redis_channels.discard(redis_channel)
+            except (redis.RedisError, OSError) as exc:
+                icecream.ic(f"Live subscription update for {channel} failed: {exc}")
+
+    async def _listen(self) -> None:
+        pubsub = self._pubsub
+        try:
+            while True:
+                if not pubsub.subscribed:
+                    await asyncio.sleep(0.1)
+                    continue
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+                if message is None or message["type"] != "message":
+                    continue
+                channel = message["channel"].decode()[len(self.prefix) :]
+                self.deliver(channel, message["data"].decode())
+        finally:
+            await pubsub.aclose()
+
+
+def make_broker() -> LocalBroker:
+    if settings.LIVE_BROKER == "redis":
+        return RedisBroker(settings.REDIS_URL, settings.LIVE_QUEUE_SIZE)
+    return LocalBroker(settings.LIVE_QUEUE_SIZE)
+
+
+live_broker = make_broker()
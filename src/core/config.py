@@ -19,6 +19,8 @@ from pydantic_core import MultiHostUrl
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing_extensions import Self
 
+from src.core.pool import pool_limits
+
 
 def parse_cors(v: Any) -> list[str] | str:
     """
@@ -48,6 +50,27 @@ class Settings(BaseSettings):
 
     # Redis configuration
     REDIS_URL: str = "redis://localhost:6379"
+    # Live results: "redis" fans writes out to the live viewers of every
+    # worker through Redis pub/sub, "memory" only to this process's viewers.
+    LIVE_BROKER: Literal["memory", "redis"] = "memory"
+    LIVE_QUEUE_SIZE: int = 100
+    LIVE_KEEPALIVE_SECONDS: float = 15.0
+    LIVE_STANDINGS_LIMIT: int = 100
+    # Messages a scoreboard WebSocket may fall behind before it is dropped.
+    SCOREBOARD_QUEUE_SIZE: int = 32
+    # Background jobs: "redis" queues them for `python -m data.jobs` worker
+    # processes, "memory" runs them in JOB_WORKERS threads of the API process
+    # and only works with a single API worker (GUNICORN_WORKERS=1).
+    JOB_BACKEND: Literal["memory", "redis"] = "memory"
+    JOB_WORKERS: int = 1
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_RETRY_DELAY_SECONDS: float = 5.0
+    JOB_TTL_SECONDS: int = 86400
+    # Redis jobs: a job whose worker stops renewing its lease for this long
+    # is queued again; dedupe keys of jobs no longer alive expire after
+    # JOB_DEDUPE_TTL_SECONDS.
+    JOB_LEASE_SECONDS: int = 300
+    JOB_DEDUPE_TTL_SECONDS: int = 3600
 
     @computed_field
     @property
@@ -86,6 +109,20 @@ class Settings(BaseSettings):
     POSTGRES_OWNER: str = "postgres"
     POSTGRES_DB: str = "postgres"
     SQLITE_URI: str = "sqlite:///./test.db"
+    # Read replicas: database URIs, comma separated. GET requests are spread
+    # across them; writes, and reads shortly after a write from the same
+    # client, use the primary.
+    REPLICA_URIS: Annotated[list[str] | str, BeforeValidator(parse_cors)] = []
+    REPLICA_HEALTH_CHECK_SECONDS: float = 10.0
+    READ_AFTER_WRITE_SECONDS: float = 5.0
+    # Connection pools: DB_MAX_CONNECTIONS is the budget of connections to
+    # each database for all workers together. PGBOUNCER disables server-side
+    # prepared statements, which PgBouncer's transaction pooling breaks.
+    GUNICORN_WORKERS: int = 4
+    DB_MAX_CONNECTIONS: int = 100
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    PGBOUNCER: bool = False
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
 
     @computed_field
@@ -107,25 +144,38 @@ class Settings(BaseSettings):
 
     @computed_field
     @property
-    def sql_conn_args(self) -> dict[str, bool]:
+    def sql_conn_args(self) -> dict[str, bool | None]:
         """
         Set the database connection arguments based on environment.
         Needed for SQLite in local development.
         """
         if self.ENVIRONMENT == "local":
             return {"check_same_thread": False}
+        if self.PGBOUNCER:
+            return {"prepare_threshold": None}
         return {}
 
     @computed_field
     @property
-    def engine_kwargs(self) -> dict[str, int]:
+    def engine_kwargs(self) -> dict[str, int | bool]:
         """
         Set the database engine arguments based on environment.
-        Needed for SQLite in local development.
+        Needed for SQLite in local development. Each worker's pool gets its
+        share of DB_MAX_CONNECTIONS, and connections are pinged on checkout
+        so ones dropped by Postgres or PgBouncer are replaced.
         """
         if self.ENVIRONMENT == "local":
             return {}
-        return {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30}
+        pool_size, max_overflow = pool_limits(
+            self.DB_MAX_CONNECTIONS, self.GUNICORN_WORKERS
+        )
+        return {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": True,
+        }
 
     FIRST_SUPERUSER: EmailStr
     FIRST_SUPERUSER_PASSWORD: str
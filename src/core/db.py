@@ -1,25 +1,94 @@
 """
 Database connection and session handling.
+
+`engine` is the primary database. Outside local development every engine
+uses a MeteredQueuePool sized by Settings.engine_kwargs. When REPLICA_URIS is
+set, `replica_router` hands out read replica engines round-robin, skipping
+replicas whose last health check (a ``SELECT 1``, repeated every
+REPLICA_HEALTH_CHECK_SECONDS) failed.
 """
 
-from icecream import ic
-from sqlalchemy import create_engine
+import itertools
+import threading
+import time
+
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.core import settings
+from src.core.lazy import lazy_import
+from src.core.pool import MeteredQueuePool
 from src.crud import create_user
 from src.models import Base, User
 from src.schemas import UserCreate
 
-engine = create_engine(
-    str(settings.sql_alchemy_db_uri),
-    connect_args=settings.sql_conn_args,
-    **settings.engine_kwargs,
+icecream = lazy_import("icecream")
+
+
+def make_engine(uri: str) -> Engine:
+    return create_engine(
+        uri,
+        connect_args=settings.sql_conn_args,
+        poolclass=MeteredQueuePool if settings.engine_kwargs else None,
+        **settings.engine_kwargs,
+    )
+
+
+engine = make_engine(str(settings.sql_alchemy_db_uri))
+
+
+class ReplicaRouter:
+    """
+    Round-robin choice among read replica engines with cached health checks.
+    """
+
+    def __init__(self, engines: list[Engine], check_interval: float):
+        self.engines = engines
+        self.check_interval = check_interval
+        self._order = itertools.cycle(range(len(engines)))
+        self._lock = threading.Lock()
+        self._health: dict[int, tuple[float, bool]] = {}
+
+    def is_healthy(self, index: int) -> bool:
+        """
+        Whether a replica answered its last health check, re-checking it once
+        the previous result is older than check_interval.
+        """
+        now = time.monotonic()
+        checked = self._health.get(index)
+        if checked is not None and now - checked[0] < self.check_interval:
+            return checked[1]
+        try:
+            with self.engines[index].connect() as conn:
+                conn.execute(text("SELECT 1"))
+            healthy = True
+        except SQLAlchemyError as e:
+            icecream.ic(f"Read replica {index} failed its health check: {e}")
+            healthy = False
+        self._health[index] = (now, healthy)
+        return healthy
+
+    def choose(self) -> Engine | None:
+        """
+        The next healthy replica, or None if there is none.
+        """
+        for _ in self.engines:
+            with self._lock:
+                index = next(self._order)
+            if self.is_healthy(index):
+                return self.engines[index]
+        return None
+
+
+replica_router = ReplicaRouter(
+    [make_engine(uri) for uri in settings.REPLICA_URIS],
+    check_interval=settings.REPLICA_HEALTH_CHECK_SECONDS,
 )
 
 
 def init_db(session: Session) -> None:
-    ic(session)
+    icecream.ic(session)
     Base.metadata.create_all(bind=engine)
     user = session.query(User).filter(User.email == settings.FIRST_SUPERUSER).first()
     if not user:
@@ -29,4 +98,4 @@ def init_db(session: Session) -> None:
             password=settings.FIRST_SUPERUSER_PASSWORD,
         )
         create_user(db=session, user_create=user)
-        ic("Superuser created")
+        icecream.ic("Superuser created")
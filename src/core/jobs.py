@@ -0,0 +1,460 @@
+"""
+Background jobs.
+
+Expensive work is enqueued by task name with a JSON payload and run by
+workers outside the request path. Tasks are functions registered with
+``job_queue.task(name)`` and called as ``task(**payload)``; what they return
+(JSON-ready) becomes the job's result. Tasks that use the database open
+their session with ``job_queue.session_factory``.
+
+- A job is "queued", "running", "succeeded" or "failed". A task that raises
+  is queued again after JOB_RETRY_DELAY_SECONDS, doubled on each retry,
+  until it has run max_attempts times.
+- A dedupe key keeps one job per key in flight: enqueueing while a job with
+  the same key is queued or running returns that job instead.
+- Finished jobs are kept for JOB_TTL_SECONDS.
+
+`MemoryJobQueue` runs jobs in JOB_WORKERS threads of the process that
+enqueues them. Its jobs and dedupe keys live in that process alone, so it
+only suits a single API process: gunicorn refuses to start it with more than
+one worker (see check_job_backend). With JOB_BACKEND=redis, `RedisJobQueue`
+keeps jobs in Redis: API workers only enqueue them and
+``python -m data.jobs`` worker processes run them, each holding a lease of
+JOB_LEASE_SECONDS on its job so that the job of a dead worker runs again.
+"""
+
+import abc
+import collections
+import heapq
+import json
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.core.config import settings
+from src.core.db import engine
+from src.core.lazy import lazy_import
+
+icecream = lazy_import("icecream")
+redis = lazy_import("redis")  # Only needed with JOB_BACKEND=redis.
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+FINISHED = {SUCCEEDED, FAILED}
+# Tasks run arbitrary code: whatever they raise is retried, then recorded.
+TASK_ERRORS = (Exception,)
+
+Task = Callable[..., Any]
+
+
+class JobQueue(abc.ABC):
+    """
+    Task registry and job life cycle; backends store and hand out the jobs.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        max_attempts: int = 3,
+        retry_delay: float = 5.0,
+        ttl: int = 86400,
+    ):
+        self.session_factory = session_factory
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.ttl = ttl
+        self.tasks: dict[str, Task] = {}
+
+    def task(self, name: str) -> Callable[[Task], Task]:
+        """
+        Register a function as the task run for jobs named name.
+        """
+
+        def register(function: Task) -> Task:
+            self.tasks[name] = function
+            return function
+
+        return register
+
+    def enqueue(
+        self,
+        name: str,
+        payload: dict | None = None,
+        dedupe_key: str | None = None,
+        max_attempts: int | None = None,
+    ) -> dict:
+        """
+        Queue a job, or return the job in flight with the same dedupe key.
+        :raises ValueError: No task is registered under name.
+        """
+        if name not in self.tasks:
+            raise ValueError(f"Unknown task {name}")
+        now = time.time()
+        job = {
+            "id": uuid.uuid4().hex,
+            "name": name,
+            "payload": payload or {},
+            "status": QUEUED,
+            "attempts": 0,
+            "max_attempts": max_attempts or self.max_attempts,
+            "dedupe_key": dedupe_key,
+            "result": None,
+            "error": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        return self._push(job)
+
+    @abc.abstractmethod
+    def get(self, job_id: str) -> dict | None:
+        """
+        The job with the given id, or None if it is unknown or expired.
+        """
+
+    def run_next(self, timeout: float = 1.0) -> bool:
+        """
+        Run the next due job, waiting up to timeout seconds for one.
+        :return: Whether a job ran.
+        """
+        job = self._pop(timeout)
+        if job is None:
+            return False
+        self.execute(job)
+        return True
+
+    def execute(self, job: dict) -> None:
+        job.update(status=RUNNING, attempts=job["attempts"] + 1, updated_at=time.time())
+        self._save(job)
+        try:
+            result = self.tasks[job["name"]](**job["payload"])
+        except TASK_ERRORS as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            job.update(error=error, updated_at=time.time())
+            job_id, name = job["id"], job["name"]
+            label = f"Job {job_id} ({name})"
+            if job["attempts"] < job["max_attempts"]:
+                icecream.ic(f"{label} failed, retrying: {error}")
+                job["status"] = QUEUED
+                self._retry(job, self.retry_delay * 2 ** (job["attempts"] - 1))
+                return
+            icecream.ic(f"{label} failed: {error}")
+            job["status"] = FAILED
+        else:
+            job.update(status=SUCCEEDED, result=result, error=None)
+        job["updated_at"] = time.time()
+        self._finish(job)
+
+    def work(self, stop: threading.Event | None = None) -> None:
+        """
+        Run jobs until stop is set.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            self.run_next()
+
+    @abc.abstractmethod
+    def _push(self, job: dict) -> dict:
+        """
+        Store and queue a new job, or return the job in flight with the same
+        dedupe key.
+        """
+
+    @abc.abstractmethod
+    def _pop(self, timeout: float) -> dict | None:
+        """
+        Take the next due job, waiting up to timeout seconds for one.
+        """
+
+    @abc.abstractmethod
+    def _save(self, job: dict) -> None:
+        """
+        Store a job's current state.
+        """
+
+    @abc.abstractmethod
+    def _retry(self, job: dict, delay: float) -> None:
+        """
+        Store a failed job and queue it again after delay seconds.
+        """
+
+    @abc.abstractmethod
+    def _finish(self, job: dict) -> None:
+        """
+        Store a finished job and release its dedupe key.
+        """
+
+
+class MemoryJobQueue(JobQueue):
+    """
+    Jobs kept in this process and run by its worker threads, started with the
+    first job.
+    """
+
+    def __init__(self, *args, workers: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.workers = workers
+        self._jobs: dict[str, dict] = {}
+        self._dedupe: dict[str, str] = {}
+        self._ready: collections.deque[str] = collections.deque()
+        self._delayed: list[tuple[float, str]] = []
+        self._condition = threading.Condition()
+        self._threads: list[threading.Thread] = []
+
+    def get(self, job_id: str) -> dict | None:
+        with self._condition:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+
+    def _push(self, job: dict) -> dict:
+        with self._condition:
+            self._expire()
+            key = job["dedupe_key"]
+            if key is not None and key in self._dedupe:
+                return dict(self._jobs[self._dedupe[key]])
+            if key is not None:
+                self._dedupe[key] = job["id"]
+            self._jobs[job["id"]] = dict(job)
+            self._ready.append(job["id"])
+            self._condition.notify()
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self.work, daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        return job
+
+    def _pop(self, timeout: float) -> dict | None:
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                while self._delayed and self._delayed[0][0] <= now:
+                    self._ready.append(heapq.heappop(self._delayed)[1])
+                if self._ready:
+                    return dict(self._jobs[self._ready.popleft()])
+                wait = deadline - now
+                if self._delayed:
+                    wait = min(wait, self._delayed[0][0] - now)
+                if wait <= 0:
+                    return None
+                self._condition.wait(wait)
+
+    def _save(self, job: dict) -> None:
+        with self._condition:
+            self._jobs[job["id"]] = dict(job)
+
+    def _retry(self, job: dict, delay: float) -> None:
+        with self._condition:
+            self._jobs[job["id"]] = dict(job)
+            heapq.heappush(self._delayed, (time.monotonic() + delay, job["id"]))
+            self._condition.notify()
+
+    def _finish(self, job: dict) -> None:
+        with self._condition:
+            self._jobs[job["id"]] = dict(job)
+            if self._dedupe.get(job["dedupe_key"]) == job["id"]:
+                del self._dedupe[job["dedupe_key"]]
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.ttl
+        expired = [
+            job_id
+            for job_id, job in self._jobs.items()
+            if job["status"] in FINISHED and job["updated_at"] < cutoff
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+class RedisJobQueue(JobQueue):
+    """
+    Jobs kept in Redis under ``prefix``: a JSON string per job, a list of
+    ready job ids, a sorted set of retries by due time and a key per dedupe
+    key in flight.
+
+    A worker moves the job it takes onto a processing list and holds a lease
+    on it, renewed every third of lease seconds while the job runs. Should
+    the worker die, the lease runs out and the next worker to look for a job
+    queues it again, or fails it once it has used up its attempts. Dedupe
+    keys expire after dedupe_ttl seconds unless their job keeps them alive.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        *args,
+        prefix: str = "jobs:",
+        lease: float = 300,
+        dedupe_ttl: int = 3600,
+        **kwargs,
+    ):
+        if redis is None:
+            raise RuntimeError("JOB_BACKEND=redis requires the redis package")
+        super().__init__(*args, **kwargs)
+        self.prefix = prefix
+        self.lease = lease
+        self.dedupe_ttl = dedupe_ttl
+        self._client = redis.Redis.from_url(url)
+        self._ready = f"{prefix}ready"
+        self._delayed = f"{prefix}delayed"
+        self._processing = f"{prefix}processing"
+        self._leases = f"{prefix}leases"
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self.prefix}job:{job_id}"
+
+    def _dedupe_key(self, key: str) -> str:
+        return f"{self.prefix}dedupe:{key}"
+
+    def get(self, job_id: str) -> dict | None:
+        stored = self._client.get(self._job_key(job_id))
+        return json.loads(stored) if stored else None
+
+    def execute(self, job: dict) -> None:
+        stop = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._renew_lease, args=(job, stop), daemon=True
+        )
+        heartbeat.start()
+        try:
+            super().execute(job)
+        finally:
+            stop.set()
+            heartbeat.join()
+
+    def _renew_lease(self, job: dict, stop: threading.Event) -> None:
+        while not stop.wait(self.lease / 3):
+            try:
+                self._client.zadd(
+                    self._leases, {job["id"]: time.time() + self.lease}, xx=True
+                )
+                if job["dedupe_key"] is not None:
+                    dedupe_key = self._dedupe_key(job["dedupe_key"])
+                    self._client.expire(dedupe_key, self.dedupe_ttl)
+            except (redis.RedisError, OSError) as exc:
+                job_id = job["id"]
+                icecream.ic(f"Could not renew the lease of job {job_id}: {exc}")
+
+    def _push(self, job: dict) -> dict:
+        key = job["dedupe_key"]
+        if key is not None:
+            dedupe_key = self._dedupe_key(key)
+            while not self._client.set(
+                dedupe_key, job["id"], nx=True, ex=self.dedupe_ttl
+            ):
+                in_flight = self._client.get(dedupe_key)
+                existing = self.get(in_flight.decode()) if in_flight else None
+                if existing and existing["status"] not in FINISHED:
+                    return existing
+                self._client.delete(dedupe_key)
+        self._save(job)
+        self._client.lpush(self._ready, job["id"])
+        return job
+
+    def _pop(self, timeout: float) -> dict | None:
+        now = time.time()
+        for job_id in self._client.zrangebyscore(self._delayed, 0, now):
+            # Only the worker that removes a due retry queues it.
+            if self._client.zrem(self._delayed, job_id):
+                self._client.lpush(self._ready, job_id)
+        self._recover_lost_jobs(now)
+        if timeout > 0:
+            job_id = self._client.blmove(
+                self._ready, self._processing, timeout, "RIGHT", "LEFT"
+            )
+        else:
+            job_id = self._client.lmove(self._ready, self._processing, "RIGHT", "LEFT")
+        if job_id is None:
+            return None
+        self._client.zadd(self._leases, {job_id: time.time() + self.lease})
+        job = self.get(job_id.decode())
+        if job is None:
+            # The job expired while it was queued.
+            self._release(job_id.decode())
+        return job
+
+    def _recover_lost_jobs(self, now: float) -> None:
+        """
+        Queue again, or fail, the jobs whose worker stopped renewing their
+        lease.
+        """
+        # A job just moved onto the processing list may not have its lease
+        # yet; give it one, so it is recovered should that worker be gone.
+        for job_id in self._client.lrange(self._processing, 0, -1):
+            self._client.zadd(self._leases, {job_id: now + self.lease}, nx=True)
+        for job_id in self._client.zrangebyscore(self._leases, 0, now):
+            # Only the worker that removes an expired lease recovers the job.
+            if not self._client.zrem(self._leases, job_id):
+                continue
+            self._client.lrem(self._processing, 0, job_id)
+            job = self.get(job_id.decode())
+            if job is None:
+                continue
+            if job["attempts"] >= job["max_attempts"]:
+                job.update(status=FAILED, error="Worker lost", updated_at=time.time())
+                self._finish(job)
+            else:
+                job.update(status=QUEUED, updated_at=time.time())
+                self._save(job)
+                self._client.lpush(self._ready, job_id)
+
+    def _release(self, job_id: str) -> None:
+        self._client.lrem(self._processing, 0, job_id)
+        self._client.zrem(self._leases, job_id)
+
+    def _save(self, job: dict) -> None:
+        self._client.set(self._job_key(job["id"]), json.dumps(job))
+
+    def _retry(self, job: dict, delay: float) -> None:
+        self._save(job)
+        self._client.zadd(self._delayed, {job["id"]: time.time() + delay})
+        self._release(job["id"])
+
+    def _finish(self, job: dict) -> None:
+        self._client.set(self._job_key(job["id"]), json.dumps(job), ex=self.ttl)
+        self._release(job["id"])
+        if job["dedupe_key"] is not None:
+            dedupe_key = self._dedupe_key(job["dedupe_key"])
+            if self._client.get(dedupe_key) == job["id"].encode():
+                self._client.delete(dedupe_key)
+
+
+def check_job_backend(workers: int) -> None:
+    """
+    Refuse the in-process queue for a server with several worker processes:
+    each would keep its own jobs, so GET /jobs/{id} would miss the jobs of
+    the other workers and dedupe keys would only hold within one worker.
+    :param workers: Number of API worker processes.
+    :raises RuntimeError: JOB_BACKEND is memory and workers is above 1.
+    """
+    if settings.JOB_BACKEND == "memory" and workers > 1:
+        raise RuntimeError(
+            f"JOB_BACKEND=memory only supports one API worker, not {workers}: "
+            "set JOB_BACKEND=redis and run python -m data.jobs, or run a "
+            "single worker with GUNICORN_WORKERS=1"
+        )
+
+
+def make_job_queue() -> JobQueue:
+    options = {
+        "session_factory": sessionmaker(bind=engine, autoflush=False),
+        "max_attempts": settings.JOB_MAX_ATTEMPTS,
+        "retry_delay": settings.JOB_RETRY_DELAY_SECONDS,
+        "ttl": settings.JOB_TTL_SECONDS,
+    }
+    if settings.JOB_BACKEND == "redis":
+        return RedisJobQueue(
+            settings.REDIS_URL,
+            lease=settings.JOB_LEASE_SECONDS,
+            dedupe_ttl=settings.JOB_DEDUPE_TTL_SECONDS,
+            **options,
+        )
+    return MemoryJobQueue(workers=settings.JOB_WORKERS, **options)
+
+
+job_queue = make_job_queue()
@@ -0,0 +1,46 @@
+"""
+Modules imported on first use.
+
+`lazy_import` returns a module whose code only runs when one of its
+attributes is first read, so importing the app does not pay for packages
+that only some code paths use (logging helpers, optional backends).
+
+Under gunicorn --preload, `load_lazy_modules` runs them in the master before
+workers are forked, so the workers share them copy-on-write instead of each
+importing them on first use.
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+_lazy_modules: list[ModuleType] = []
+
+
+def lazy_import(name: str) -> ModuleType | None:
+    """
+    Import a module lazily.
+    :param name: Absolute name of the module.
+    :return: The module, or None when it is not installed.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        return None
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    _lazy_modules.append(module)
+    return module
+
+
+def load_lazy_modules() -> None:
+    """
+    Run every lazily imported module that has not run yet.
+    """
+    for module in _lazy_modules:
+        # Reading any attribute of a lazy module runs it.
+        getattr(module, "__dict__")
@@ -0,0 +1,106 @@
+"""
+Connection pool sizing and metrics.
+
+Every gunicorn worker has its own pool per database, so pools are sized from a
+connection budget shared by all workers (see Settings.engine_kwargs).
+`MeteredQueuePool` records how long checkouts wait for a connection;
+`pool_stats` combines that with the pool's current in-use and overflow
+counts.
+"""
+
+import threading
+import time
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+def pool_limits(max_connections: int, workers: int) -> tuple[int, int]:
+    """
+    Split a connection budget between worker pools.
+    :param max_connections: Connections all workers may open together.
+    :param workers: Number of worker processes.
+    :return: pool_size and max_overflow for each worker, keeping a third of
+        a worker's share as overflow for bursts.
+    """
+    per_worker = max(2, max_connections // max(1, workers))
+    pool_size = max(1, per_worker * 2 // 3)
+    return pool_size, per_worker - pool_size
+
+
+class PoolMetrics:
+    """
+    Running totals of pool checkouts and the time spent waiting for them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.wait_seconds += seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def snapshot(self) -> dict[str, float]:
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "average_wait_ms": (
+                    self.wait_seconds / self.checkouts * 1000 if self.checkouts else 0.0
+                ),
+                "max_wait_ms": self.max_wait_seconds * 1000,
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """
+    QueuePool that records the wait time of every checkout. The metrics carry
+    over when the pool is recreated (for example by Engine.dispose).
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return super().connect()
+        except PoolTimeoutError:
+            timed_out = True
+            raise
+        finally:
+            self.metrics.record(time.perf_counter() - start, timed_out)
+
+    def recreate(self) -> "MeteredQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def pool_stats(engine: Engine) -> dict[str, float]:
+    """
+    Current size, in-use and overflow counts of an engine's pool, plus the
+    checkout wait metrics when the pool records them.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+    stats = {
+        "size": pool.size(),
+        "in_use": pool.checkedout(),
+        "idle": pool.checkedin(),
+        "overflow": max(0, pool.overflow()),
+    }
+    if isinstance(pool, MeteredQueuePool):
+        stats.update(pool.metrics.snapshot())
+    return stats
@@ -3,11 +3,15 @@ Expose CRUD operations for the User model.
 """
 
 from src.crud.course import (
+    bulk_create_courses,
     create_course,
     delete_course,
     get_course,
     get_course_by_name,
     get_courses,
+    get_existing_course_names,
+    get_nearby_courses,
+    sync_courses,
 )
 from src.crud.course_layout import (
     create_course_layout,
@@ -20,6 +24,7 @@ from src.crud.disc_event import (
     delete_disc_event,
     get_disc_event,
     get_disc_event_by_name,
+    get_disc_event_for_date,
     get_disc_events,
     update_disc_event,
 )
@@ -35,8 +40,12 @@ from src.crud.event_result import (
     get_event_results_with_division_stats,
     get_multiple_disc_event_summaries,
     get_round_score_statistics,
+    recompute_points,
+    sync_event_results,
     update_event_result,
 )
+from src.crud.hole_score import get_layout_hole_stats
+from src.crud.search import search
 from src.crud.user import authenticate, create_user, get_user_by_email, update_user
 
 __all__ = [
@@ -49,10 +58,15 @@ __all__ = [
     "get_courses",
     "delete_course",
     "get_course_by_name",
+    "sync_courses",
+    "bulk_create_courses",
+    "get_existing_course_names",
+    "get_nearby_courses",
     "create_course_layout",
     "get_course_layout",
     "get_course_layouts",
     "delete_course_layout",
+    "get_layout_hole_stats",
     "create_event_result",
     "get_event_result",
     "update_event_result",
@@ -67,8 +81,12 @@ __all__ = [
     "create_disc_event",
     "get_disc_event",
     "get_disc_event_by_name",
+    "get_disc_event_for_date",
     "get_disc_events",
     "update_disc_event",
     "delete_disc_event",
     "get_round_score_statistics",
+    "recompute_points",
+    "sync_event_results",
+    "search",
 ]
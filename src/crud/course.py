@@ -7,13 +7,36 @@ commit. This relies on SQLAlchemy relationship cascades to set foreign keys
 and persist child objects automatically.
 
 The single-commit pattern reduces DB round-trips and keeps creation atomic.
+`get_nearby_courses` picks a few times limit candidates nearest first in SQL,
+within an indexed bounding box, before computing exact great-circle distances.
+
+`bulk_create_courses` scales it to many courses: name conflicts are found with
+one IN query and each level of the graph is written with one multi-row
+``INSERT ... RETURNING`` (ids in parameter order) so the generated ids can be
+assigned to the next level, rather than flushing every object through the unit
+of work. SQLite cannot order a batched RETURNING, so there SQLAlchemy sends
+those inserts row by row.
+
+`sync_courses` applies the same idea to scraped refreshes: a batch of courses
+is matched against existing rows with one query and written in one commit.
+
+`patch_course` diffs nested layouts and holes by id against their stored
+columns (no ORM graph is loaded) and writes only the rows that changed with
+bulk INSERT, UPDATE and DELETE statements in one transaction.
 """
 
+import math
+from collections.abc import Iterable
+
+from sqlalchemy import delete, func, insert, literal, or_, select, update
 from sqlalchemy.orm import Session, joinedload
 
+from src.crud.course_layout import layout_metrics, refresh_layout_metrics
 from src.models import Course, CourseLayout
 from src.models.hole import Hole
-from src.schemas.courses import CourseCreate, CourseUpdate
+from src.schemas.course_layouts import CourseLayoutPatch
+from src.schemas.courses import CourseCreate, CoursePatch, CourseSync, CourseUpdate
+from src.schemas.holes import LayoutHolePatch
 
 
 def get_course(db: Session, course_id: int) -> Course | None:
@@ -25,6 +48,14 @@ def get_course(db: Session, course_id: int) -> Course | None:
     )
 
 
+def course_exists(db: Session, course_id: int) -> bool:
+    return db.scalar(select(literal(1)).where(Course.id == course_id)) is not None
+
+
+def get_existing_course_names(db: Session, names: Iterable[str]) -> set[str]:
+    return set(db.scalars(select(Course.name).where(Course.name.in_(set(names)))))
+
+
 def get_courses(db: Session, skip: int = 0, limit: int = 100) -> list[Course]:
     courses = (
         db.query(Course)
@@ -45,6 +76,101 @@ def get_course_by_name(db: Session, name: str) -> Course | None:
     )
 
 
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_DEGREE_LAT = 111.32
+
+
+def _haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _longitude_ranges(lon: float, lon_delta: float) -> list[tuple[float, float, float]]:
+    """
+    Split lon +/- lon_delta into ranges within [-180, 180].
+
+    :return: (min_lon, max_lon, ref_lon) per range, where ref_lon is lon moved
+        by 360 degrees onto the side of a range across the antimeridian, so
+        that plain degree differences measure distances within it.
+    """
+    if lon_delta >= 180.0:
+        return [(-180.0, 180.0, lon)]
+    min_lon, max_lon = lon - lon_delta, lon + lon_delta
+    if min_lon < -180.0:
+        return [(-180.0, max_lon, lon), (min_lon + 360.0, 180.0, lon + 360.0)]
+    if max_lon > 180.0:
+        return [(min_lon, 180.0, lon), (-180.0, max_lon - 360.0, lon - 360.0)]
+    return [(min_lon, max_lon, lon)]
+
+
+# Candidates fetched per result, before dividing by the cosine of the
+# latitude: SQL ranks them by degree distance, which overstates longitude
+# differences by 1 / cos(latitude) compared to haversine.
+NEARBY_OVERFETCH = 2
+
+
+def get_nearby_courses(
+    db: Session, lat: float, lon: float, radius_km: float, limit: int = 20
+) -> list[tuple[Course, float]]:
+    """
+    Return courses within radius_km of a point, nearest first, with their
+    distance in kilometres.
+
+    Candidates are picked in SQL from a bounding box around the point, split
+    in two where it crosses the antimeridian, nearest first by degree
+    distance and with a LIMIT: on Postgres the GiST index on
+    point(longitude, latitude) serves both the box and the ``<->`` ordering,
+    elsewhere the (latitude, longitude) B-tree serves the box. Only the ids
+    and coordinates of a few times limit candidates are read; they are
+    ranked again by haversine distance and the winners loaded.
+    """
+    lat_delta = radius_km / KM_PER_DEGREE_LAT
+    min_lat, max_lat = max(lat - lat_delta, -90.0), min(lat + lat_delta, 90.0)
+    # Longitude degrees are shortest at the box edge nearest a pole.
+    cos_edge = math.cos(math.radians(max(abs(min_lat), abs(max_lat))))
+    lon_delta = 180.0 if cos_edge < 1e-6 else radius_km / (KM_PER_DEGREE_LAT * cos_edge)
+    fetch = math.ceil(limit * NEARBY_OVERFETCH / max(cos_edge, 0.1))
+    postgres = db.get_bind().dialect.name == "postgresql"
+    location = func.point(Course.longitude, Course.latitude)
+
+    candidates = []
+    for min_lon, max_lon, ref_lon in _longitude_ranges(lon, lon_delta):
+        query = select(Course.id, Course.latitude, Course.longitude)
+        if postgres:
+            query = query.where(
+                location.op("<@")(
+                    func.box(func.point(min_lon, min_lat), func.point(max_lon, max_lat))
+                )
+            ).order_by(location.op("<->")(func.point(ref_lon, lat)))
+        else:
+            d_lat, d_lon = Course.latitude - lat, Course.longitude - ref_lon
+            query = query.where(
+                Course.latitude.between(min_lat, max_lat),
+                Course.longitude.between(min_lon, max_lon),
+            ).order_by(d_lat * d_lat + d_lon * d_lon)
+        candidates.extend(db.execute(query.limit(fetch)))
+
+    nearest = {}
+    for course_id, course_lat, course_lon in candidates:
+        distance = _haversine_km(lat, lon, course_lat, course_lon)
+        if distance <= radius_km:
+            nearest[course_id] = distance
+    ranked = sorted(nearest.items(), key=lambda item: item[1])[:limit]
+    courses = {
+        course.id: course
+        for course in db.scalars(
+            select(Course).where(Course.id.in_([course_id for course_id, _ in ranked]))
+        )
+    }
+    return [(courses[course_id], distance) for course_id, distance in ranked]
+
+
 def create_course(db: Session, course: CourseCreate) -> Course:
     # Build Course model instance (exclude nested layouts)
     course_data = course.model_dump(exclude={"layouts"})
@@ -66,6 +192,7 @@ def create_course(db: Session, course: CourseCreate) -> Course:
                     hole_data = hole.model_dump()
                     hole_objs.append(Hole(**hole_data))
                 db_layout.holes = hole_objs
+            refresh_layout_metrics(db_layout)
 
             layout_objs.append(db_layout)
 
@@ -78,6 +205,63 @@ def create_course(db: Session, course: CourseCreate) -> Course:
     return db_course
 
 
+def bulk_create_courses(
+    db: Session, courses: list[CourseCreate]
+) -> tuple[list[int], list[str]]:
+    """
+    Create many courses with their layouts and holes in one transaction.
+    Courses whose name already exists, or repeats an earlier course in the
+    batch, are skipped.
+    :return: The ids of the created courses, in input order, and the names
+        that were skipped.
+    """
+    taken = get_existing_course_names(db, (course.name for course in courses))
+    new_courses, conflicts = [], []
+    for course in courses:
+        if course.name in taken:
+            conflicts.append(course.name)
+        else:
+            taken.add(course.name)
+            new_courses.append(course)
+    if not new_courses:
+        return [], conflicts
+
+    course_ids = db.scalars(
+        insert(Course.__table__).returning(Course.id, sort_by_parameter_order=True),
+        [course.model_dump(exclude={"layouts"}) for course in new_courses],
+    ).all()
+    layouts = [
+        (course_id, layout)
+        for course_id, course in zip(course_ids, new_courses)
+        for layout in course.layouts
+    ]
+    if layouts:
+        layout_ids = db.scalars(
+            insert(CourseLayout.__table__).returning(
+                CourseLayout.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    **layout.model_dump(exclude={"holes"}),
+                    **layout_metrics(
+                        (hole.par, hole.distance) for hole in layout.holes
+                    ),
+                    "course_id": course_id,
+                }
+                for course_id, layout in layouts
+            ],
+        ).all()
+        holes = [
+            {**hole.model_dump(), "layout_id": layout_id}
+            for layout_id, (_, layout) in zip(layout_ids, layouts)
+            for hole in layout.holes
+        ]
+        if holes:
+            db.execute(insert(Hole.__table__), holes)
+    db.commit()
+    return course_ids, conflicts
+
+
 def delete_course(db: Session, course_id: int) -> Course | None:
     db_course = db.query(Course).filter(Course.id == course_id).first()
     if db_course:
@@ -97,3 +281,209 @@ def update_course(db: Session, course_id: int, course: CourseUpdate) -> Course |
         db.refresh(db_course)
         return db_course
     return None
+
+
+def _changed_fields(stored, patch: dict) -> dict:
+    return {
+        field: value
+        for field, value in patch.items()
+        if getattr(stored, field) != value
+    }
+
+
+def _diff_holes(
+    layout_id: int, stored: dict, holes: Iterable[LayoutHolePatch]
+) -> tuple[list[dict], list[dict], set[int], dict]:
+    """
+    Diff a layout's sent holes against its stored hole rows.
+    :param stored: Stored hole rows of the layout by id.
+    :return: Update rows, insert rows, ids to delete and the layout's metrics
+        computed from the resulting holes.
+    """
+    updates, inserts, final = [], [], []
+    for hole in holes:
+        if hole.id is None:
+            inserts.append({**hole.model_dump(exclude={"id"}), "layout_id": layout_id})
+            final.append((hole.par, hole.distance))
+            continue
+        changes = _changed_fields(
+            stored[hole.id], hole.model_dump(exclude_unset=True, exclude={"id"})
+        )
+        if changes:
+            updates.append({"id": hole.id, **changes})
+        merged = {"par": stored[hole.id].par, "distance": stored[hole.id].distance}
+        merged.update((k, v) for k, v in changes.items() if k in merged)
+        final.append((merged["par"], merged["distance"]))
+    deleted = stored.keys() - {hole.id for hole in holes}
+    return updates, inserts, deleted, layout_metrics(final)
+
+
+def _check_layout_ids(
+    course_id: int,
+    layouts: list[CourseLayoutPatch],
+    stored_layouts: dict,
+    stored_holes: dict,
+) -> None:
+    for layout in layouts:
+        if layout.id is not None and layout.id not in stored_layouts:
+            raise ValueError(f"Course layout {layout.id} is not on course {course_id}")
+        layout_holes = stored_holes.get(layout.id, {})
+        for hole in layout.holes or []:
+            if hole.id is not None and hole.id not in layout_holes:
+                layout_name = layout.id if layout.id is not None else layout.name
+                raise ValueError(
+                    f"Hole {hole.id} is not on course layout {layout_name}"
+                )
+
+
+def _patch_layouts(
+    db: Session, course_id: int, layouts: list[CourseLayoutPatch]
+) -> None:
+    """
+    Replace a course's layouts (and the holes of layouts that send holes) by
+    diffing the patch against the stored rows.
+    :raises ValueError: If a layout or hole id is not on the course.
+    """
+    stored_layouts = {
+        row.id: row
+        for row in db.execute(
+            select(
+                CourseLayout.id,
+                CourseLayout.name,
+                CourseLayout.par,
+                CourseLayout.length,
+                CourseLayout.difficulty,
+            ).where(CourseLayout.course_id == course_id)
+        )
+    }
+    stored_holes: dict[int, dict] = {}
+    hole_layout_ids = [
+        layout.id
+        for layout in layouts
+        if layout.id is not None and layout.holes is not None
+    ]
+    for row in db.execute(
+        select(Hole.id, Hole.layout_id, Hole.par, Hole.distance, Hole.hole_name).where(
+            Hole.layout_id.in_(hole_layout_ids)
+        )
+    ):
+        stored_holes.setdefault(row.layout_id, {})[row.id] = row
+    _check_layout_ids(course_id, layouts, stored_layouts, stored_holes)
+
+    layout_updates, hole_updates, hole_inserts = [], [], []
+    deleted_holes: set[int] = set()
+    new_layouts = [layout for layout in layouts if layout.id is None]
+    for layout in layouts:
+        if layout.id is None:
+            continue
+        changes = _changed_fields(
+            stored_layouts[layout.id],
+            layout.model_dump(exclude_unset=True, exclude={"id", "holes"}),
+        )
+        if layout.holes is not None:
+            updates, inserts, deleted, metrics = _diff_holes(
+                layout.id, stored_holes.get(layout.id, {}), layout.holes
+            )
+            hole_updates += updates
+            hole_inserts += inserts
+            deleted_holes |= deleted
+            if updates or inserts or deleted:
+                changes.update(metrics)
+        if changes:
+            layout_updates.append({"id": layout.id, **changes})
+
+    deleted_layouts = stored_layouts.keys() - {layout.id for layout in layouts}
+    if deleted_layouts:
+        db.execute(delete(Hole).where(Hole.layout_id.in_(deleted_layouts)))
+        db.execute(delete(CourseLayout).where(CourseLayout.id.in_(deleted_layouts)))
+    if deleted_holes:
+        db.execute(delete(Hole).where(Hole.id.in_(deleted_holes)))
+    if layout_updates:
+        db.execute(update(CourseLayout), layout_updates)
+    if hole_updates:
+        db.execute(update(Hole), hole_updates)
+    if new_layouts:
+        new_ids = db.scalars(
+            insert(CourseLayout.__table__).returning(
+                CourseLayout.id, sort_by_parameter_order=True
+            ),
+            [
+                {
+                    **layout.model_dump(exclude={"id", "holes"}),
+                    **layout_metrics(
+                        (hole.par, hole.distance) for hole in layout.holes or []
+                    ),
+                    "course_id": course_id,
+                }
+                for layout in new_layouts
+            ],
+        ).all()
+        for layout_id, layout in zip(new_ids, new_layouts):
+            hole_inserts += [
+                {**hole.model_dump(exclude={"id"}), "layout_id": layout_id}
+                for hole in layout.holes or []
+            ]
+    if hole_inserts:
+        # Core inserts keep None values, so all rows go in one executemany.
+        db.execute(insert(Hole.__table__), hole_inserts)
+
+
+def patch_course(db: Session, course_id: int, course: CoursePatch) -> Course | None:
+    """
+    Apply a partial update to a course and, when layouts are sent, to its
+    layouts and holes, in one transaction. Only rows that changed are
+    written.
+    :return: The updated course, or None if it does not exist.
+    :raises ValueError: If a layout or hole id is not on the course.
+    """
+    if not course_exists(db, course_id):
+        return None
+    if course.layouts is not None:
+        _patch_layouts(db, course_id, course.layouts)
+    course_data = course.model_dump(exclude_unset=True, exclude={"layouts"})
+    if course_data:
+        db.execute(update(Course).where(Course.id == course_id).values(**course_data))
+    db.commit()
+    return get_course(db, course_id)
+
+
+def sync_courses(db: Session, courses: list[CourseSync]) -> dict[str, int]:
+    """
+    Upsert a batch of scraped courses in one transaction. Each course is
+    matched to an existing row by link, then by name; only fields that were
+    set and differ from the stored values are written, so unchanged rows
+    produce no UPDATE.
+    """
+    names = [course.name for course in courses]
+    links = [course.link for course in courses if course.link]
+    existing = (
+        db.query(Course)
+        .filter(or_(Course.name.in_(names), Course.link.in_(links)))
+        .all()
+    )
+    by_name = {db_course.name: db_course for db_course in existing}
+    by_link = {db_course.link: db_course for db_course in existing if db_course.link}
+
+    counts = {"created": 0, "updated": 0, "unchanged": 0}
+    for course in courses:
+        course_data = course.model_dump(exclude_unset=True)
+        db_course = by_link.get(course.link) if course.link else None
+        db_course = db_course or by_name.get(course.name)
+        if db_course is None:
+            db_course = Course(**course_data)
+            db.add(db_course)
+            counts["created"] += 1
+        else:
+            changed = {
+                field: value
+                for field, value in course_data.items()
+                if getattr(db_course, field) != value
+            }
+            for field, value in changed.items():
+                setattr(db_course, field, value)
+            counts["updated" if changed else "unchanged"] += 1
+        by_name[db_course.name] = db_course
+        if db_course.link:
+            by_link[db_course.link] = db_course
+    db.commit()
+    return counts
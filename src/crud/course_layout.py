@@ -5,8 +5,16 @@ the layout. If `holes` are present on the input schema, Hole model instances
 are constructed and attached to the `CourseLayout.holes` relationship before
 committing — SQLAlchemy will persist child holes in the same transaction when
 the relationship is configured with cascade (``all, delete-orphan``).
+
+Derived layout metrics (hole count, total par and distance, average hole
+length, par distribution) are stored on the layout. `refresh_layout_metrics`
+recomputes them from the layout's holes and is called by every write that
+changes holes, so reads such as the layout summary never load the holes.
 """
 
+from collections import Counter
+from collections.abc import Iterable
+
 from sqlalchemy.orm import Session
 
 from src.models import CourseLayout
@@ -14,6 +22,36 @@ from src.models.hole import Hole
 from src.schemas import CourseLayoutCreate
 
 
+def layout_metrics(holes: Iterable[tuple[int | None, int | None]]) -> dict:
+    """
+    Derived metrics for a layout from its holes' (par, distance) pairs.
+    Holes without a par or distance are left out of the totals.
+    """
+    holes = list(holes)
+    pars = [par for par, _ in holes if par is not None]
+    distances = [distance for _, distance in holes if distance is not None]
+    return {
+        "hole_count": len(holes),
+        "total_par": sum(pars) if pars else None,
+        "total_distance": sum(distances) if distances else None,
+        "average_hole_length": (sum(distances) / len(distances) if distances else None),
+        "par_distribution": {
+            str(par): count for par, count in sorted(Counter(pars).items())
+        },
+    }
+
+
+def refresh_layout_metrics(db_course_layout: CourseLayout) -> None:
+    """
+    Recompute the stored metrics of a layout from its (in-memory) holes.
+    """
+    metrics = layout_metrics(
+        (hole.par, hole.distance) for hole in db_course_layout.holes
+    )
+    for key, value in metrics.items():
+        setattr(db_course_layout, key, value)
+
+
 def get_course_layout(db: Session, course_layout_id: int) -> CourseLayout | None:
     return db.query(CourseLayout).filter(CourseLayout.id == course_layout_id).first()
 
@@ -39,6 +77,7 @@ def create_course_layout(
             hole_data = hole.model_dump()
             hole_objs.append(Hole(**hole_data))
         db_course_layout.holes = hole_objs
+    refresh_layout_metrics(db_course_layout)
 
     db.add(db_course_layout)
     db.commit()
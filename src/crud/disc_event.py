@@ -3,13 +3,19 @@
 Provides helpers to create, read, update and delete DiscEvent records.
 Notable behavior:
 - `create_disc_event` persists a new DiscEvent.
+- `get_disc_event_for_date` resolves the event whose date range contains a
+    given datetime using the `(start_date, end_date)` index.
 - `update_disc_event` intentionally ignores `None` values in the provided
     `DiscEventUpdate` schema to support partial-update semantics (fields not
     provided will not overwrite existing values).
+- `delete_disc_event` also clears the event's leaderboard.
 """
 
+import datetime
+
 from sqlalchemy.orm import Session
 
+from src.crud.leaderboard import refresh_leaderboard
 from src.models import DiscEvent
 from src.schemas import DiscEventCreate, DiscEventUpdate
 
@@ -30,6 +36,18 @@ def get_disc_event_by_name(db: Session, name: str) -> DiscEvent | None:
     return db.query(DiscEvent).filter(DiscEvent.name == name).first()
 
 
+def get_disc_event_for_date(db: Session, date: datetime.datetime) -> DiscEvent | None:
+    # Stored datetimes are naive; compare against a naive value
+    if date.tzinfo is not None:
+        date = date.astimezone(datetime.timezone.utc).replace(tzinfo=None)
+    return (
+        db.query(DiscEvent)
+        .filter(DiscEvent.start_date <= date, DiscEvent.end_date >= date)
+        .order_by(DiscEvent.start_date.desc(), DiscEvent.id)
+        .first()
+    )
+
+
 def get_disc_events(db: Session, skip: int = 0, limit: int = 100) -> list[DiscEvent]:
     return db.query(DiscEvent).offset(skip).limit(limit).all()
 
@@ -38,6 +56,8 @@ def delete_disc_event(db: Session, disc_event_id: int) -> DiscEvent | None:
     db_disc_event = db.query(DiscEvent).filter(DiscEvent.id == disc_event_id).first()
     if db_disc_event:
         db.delete(db_disc_event)
+        db.flush()
+        refresh_leaderboard(db, disc_event_id)
         db.commit()
     return db_disc_event
 
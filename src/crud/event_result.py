@@ -5,13 +5,22 @@ This module provides functions to perform Create, Read, Update, and Delete (CRUD
 operations on EventResult resources in the database. These functions interact
 with the SQLAlchemy ORM models and are used by the FastAPI routes to manage
 EventResult data.
+
+Every write refreshes the leaderboard of the affected disc event divisions in
+the same transaction.
 """
 
 from typing import Any, Dict
 
+from sqlalchemy import func, select, update
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql import functions
 
+from src.crud.leaderboard import (
+    get_leaderboard,
+    get_leaderboard_divisions,
+    refresh_leaderboard,
+)
 from src.models.disc_event import DiscEvent as DiscEventModel
 from src.models.event_result import EventResult as EventResultModel
 from src.schemas.event_results import (
@@ -53,16 +62,21 @@ def get_event_results_by_username(db: Session, username: str) -> list[EventResul
 
 
 def get_event_results_by_disc_event(
-    db: Session, disc_event_id: int, skip: int = 0, limit: int = 100
+    db: Session,
+    disc_event_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    sort_by_position_raw: bool = False,
 ) -> list[EventResultModel]:
     """Retrieve all event results for a specific disc event with pagination."""
-    return (
-        db.query(EventResultModel)
-        .filter(EventResultModel.disc_event_id == disc_event_id)
-        .offset(skip)
-        .limit(limit)
-        .all()
+    query = db.query(EventResultModel).filter(
+        EventResultModel.disc_event_id == disc_event_id
     )
+    if sort_by_position_raw:
+        query = query.order_by(
+            EventResultModel.position_raw.asc().nulls_last(), EventResultModel.id
+        )
+    return query.offset(skip).limit(limit).all()
 
 
 def get_round_score_statistics(
@@ -112,6 +126,8 @@ def create_event_result(
     """Create a new EventResult in the database."""
     db_event_result = EventResultModel(**event_result.model_dump())
     db.add(db_event_result)
+    db.flush()
+    refresh_leaderboard(db, db_event_result.disc_event_id, [db_event_result.division])
     db.commit()
     db.refresh(db_event_result)
     return db_event_result
@@ -128,13 +144,90 @@ def update_event_result(
     )
     if not db_event_result:
         return None
+    previous = (db_event_result.disc_event_id, db_event_result.division)
     for key, value in updated_event_result.model_dump().items():
         setattr(db_event_result, key, value)
+    db.flush()
+    refresh_leaderboard(db, previous[0], [previous[1]])
+    if previous != (db_event_result.disc_event_id, db_event_result.division):
+        refresh_leaderboard(
+            db, db_event_result.disc_event_id, [db_event_result.division]
+        )
     db.commit()
     db.refresh(db_event_result)
     return db_event_result
 
 
+def sync_event_results(
+    db: Session, event_results: list[EventResultCreate]
+) -> tuple[dict[str, Any], list[EventResultModel], set[tuple[int, str]]]:
+    """
+    Upsert a batch of event results in one transaction. Each result is
+    matched to the stored result of the same username on the same day, and
+    only fields that differ are written. Results whose disc event does not
+    exist are rejected.
+    :return: Counts per outcome with the indexes of the rejected results,
+        the results created or updated, and the (disc_event_id, division)
+        scopes that updated results moved out of.
+    """
+    disc_event_ids = set(
+        db.scalars(
+            select(DiscEventModel.id).where(
+                DiscEventModel.id.in_(
+                    {result.disc_event_id for result in event_results}
+                )
+            )
+        )
+    )
+    existing = db.scalars(
+        select(EventResultModel).where(
+            EventResultModel.username.in_({result.username for result in event_results})
+        )
+    )
+    by_key = {(result.username, result.date.date()): result for result in existing}
+
+    counts: dict[str, Any] = {"created": 0, "updated": 0, "unchanged": 0}
+    rejected, written = [], []
+    scopes, previous_scopes = set(), set()
+    for index, event_result in enumerate(event_results):
+        if event_result.disc_event_id not in disc_event_ids:
+            rejected.append(index)
+            continue
+        data = event_result.model_dump()
+        key = (event_result.username, event_result.date.date())
+        db_event_result = by_key.get(key)
+        if db_event_result is None:
+            db_event_result = by_key[key] = EventResultModel(**data)
+            db.add(db_event_result)
+            counts["created"] += 1
+        else:
+            changed = {
+                field: value
+                for field, value in data.items()
+                if getattr(db_event_result, field) != value
+            }
+            if not changed:
+                counts["unchanged"] += 1
+                continue
+            previous_scopes.add(
+                (db_event_result.disc_event_id, db_event_result.division)
+            )
+            for field, value in changed.items():
+                setattr(db_event_result, field, value)
+            counts["updated"] += 1
+        written.append(db_event_result)
+        scopes.add((db_event_result.disc_event_id, db_event_result.division))
+    db.flush()
+    divisions: dict[int, set[str]] = {}
+    for disc_event_id, division in scopes | previous_scopes:
+        divisions.setdefault(disc_event_id, set()).add(division)
+    for disc_event_id, changed_divisions in divisions.items():
+        refresh_leaderboard(db, disc_event_id, changed_divisions)
+    db.commit()
+    counts["rejected"] = rejected
+    return counts, written, previous_scopes
+
+
 def delete_event_result(db: Session, event_result_id: int) -> bool:
     """Delete an EventResult by its ID."""
     db_event_result = (
@@ -145,73 +238,110 @@ def delete_event_result(db: Session, event_result_id: int) -> bool:
     if not db_event_result:
         return False
     db.delete(db_event_result)
+    db.flush()
+    refresh_leaderboard(db, db_event_result.disc_event_id, [db_event_result.division])
     db.commit()
     return True
 
 
+def recompute_points(db: Session, disc_event_id: int) -> int:
+    """
+    Recompute the round_points of a disc event's results from their
+    positions, as data.round_processing.assign_points does on import: the top
+    30 of a division earn 31 - position_raw, shared between tied players, and
+    everyone else 0. Does not commit.
+    :return: Number of results updated.
+    """
+    tied = (
+        func.count()
+        .over(partition_by=(EventResultModel.division, EventResultModel.position_raw))
+        .label("tied")
+    )
+    rows = db.execute(
+        select(EventResultModel.id, EventResultModel.position_raw, tied).where(
+            EventResultModel.disc_event_id == disc_event_id
+        )
+    ).all()
+    updates = []
+    for result_id, position_raw, players in rows:
+        points = 0.0
+        if position_raw is not None:
+            value = 31 - position_raw if 1 <= position_raw <= 30 else 0
+            points = (value + value + 1 - players) / 2
+        updates.append({"id": result_id, "round_points": points})
+    if updates:
+        db.execute(update(EventResultModel), updates)
+    return len(updates)
+
+
+def _median(db: Session, column, scope: tuple, count: int):
+    """The middle value (upper middle for even counts) of a column."""
+    return db.scalar(
+        select(column).where(*scope).order_by(column).offset(count // 2).limit(1)
+    )
+
+
 def get_division_stats(
     db: Session, disc_event_id: int, division: str
 ) -> DivisionStats | None:
     """Calculate comprehensive statistics for a specific division
-    within a disc event."""
-    query = db.query(EventResultModel).filter(
+    within a disc event, with aggregates computed by the database."""
+    scope = (
         EventResultModel.disc_event_id == disc_event_id,
         EventResultModel.division == division,
     )
-    results = query.all()
-    if not results:
-        return None
-    round_scores = [
-        r.round_total_score for r in results if r.round_total_score is not None
-    ]
-    event_scores = [
-        r.event_total_score for r in results if r.event_total_score is not None
-    ]
-    if not round_scores:
+    round_score = EventResultModel.round_total_score
+    event_score = EventResultModel.event_total_score
+    totals = db.execute(
+        select(
+            functions.count(),
+            functions.count(round_score),
+            func.avg(round_score),
+            functions.min(round_score),
+            functions.max(round_score),
+            functions.count(event_score),
+            func.avg(event_score),
+            functions.min(event_score),
+            functions.max(event_score),
+        ).where(*scope)
+    ).one()
+    count, round_count, round_average, best_round, worst_round = totals[:5]
+    event_count, event_average, best_event, worst_event = totals[5:]
+    if not count or not round_count:
         return None
     return DivisionStats(
         division=division,
-        count=len(results),
-        average_round_score=sum(round_scores) / len(round_scores),
-        median_round_score=sorted(round_scores)[len(round_scores) // 2],
-        average_event_score=(
-            sum(event_scores) / len(event_scores) if event_scores else None
+        count=count,
+        average_round_score=float(round_average),
+        median_round_score=_median(
+            db, round_score, (*scope, round_score.isnot(None)), round_count
         ),
+        average_event_score=float(event_average) if event_count else None,
         median_event_score=(
-            sorted(event_scores)[len(event_scores) // 2] if event_scores else None
+            _median(db, event_score, (*scope, event_score.isnot(None)), event_count)
+            if event_count
+            else None
         ),
-        best_round_score=min(round_scores),
-        worst_round_score=max(round_scores),
-        best_event_score=min(event_scores) if event_scores else None,
-        worst_event_score=max(event_scores) if event_scores else None,
+        best_round_score=best_round,
+        worst_round_score=worst_round,
+        best_event_score=best_event,
+        worst_event_score=worst_event,
     )
 
 
 def get_event_results_with_division_stats(
     db: Session, disc_event_id: int, skip: int = 0, limit: int = 100
 ) -> Dict[str, Dict[str, Any]]:
-    """Get event results grouped by division with statistics for each division."""
-    all_results = (
-        db.query(EventResultModel)
-        .filter(EventResultModel.disc_event_id == disc_event_id)
-        .all()
-    )
-    if not all_results:
-        return {}
-    divisions = {}
-    for result in all_results:
-        if result.division not in divisions:
-            divisions[result.division] = []
-        divisions[result.division].append(result)
-    division_data = {}
-    for division, results in divisions.items():
-        sorted_results = sorted(
-            results, key=lambda x: (x.position_raw is None, x.position_raw)
-        )
-        paginated_results = sorted_results[skip : skip + limit]
-        stats = get_division_stats(db, disc_event_id, division)
-        division_data[division] = {"stats": stats, "results": paginated_results}
-    return division_data
+    """Get a page of each division's results (ranked skip + 1 to skip +
+    limit) with statistics for each division."""
+    pages = dict(get_leaderboard(db, disc_event_id, skip=skip, limit=limit))
+    return {
+        division: {
+            "stats": get_division_stats(db, disc_event_id, division),
+            "results": pages.get(division, []),
+        }
+        for division in get_leaderboard_divisions(db, disc_event_id)
+    }
 
 
 def get_disc_event_summary(db: Session, disc_event_id: int) -> DiscEventSummary | None:
@@ -1,11 +1,22 @@
 """
 CRUD for Hole
+
+Every write goes through the hole's layout so the layout's stored metrics
+are refreshed in the same commit.
+
+`patch_holes` edits many holes with one statement: the patches are sent as
+a VALUES list (a CTE, which SQLite and Postgres both accept with column
+names) and joined to the holes in a single ``UPDATE ... FROM``.
 """
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Boolean, case, cast, column, select, update, values
+from sqlalchemy.orm import Session, selectinload
+
+from src.crud.course_layout import refresh_layout_metrics
+from src.models import CourseLayout, Hole
+from src.schemas import HoleCreate, HolePatch, HoleUpdate
 
-from src.models import Hole
-from src.schemas import HoleCreate, HoleUpdate
+PATCHABLE_FIELDS = ("hole_name", "par", "distance")
 
 
 def get_hole(db: Session, hole_id: int) -> Hole | None:
@@ -16,9 +27,17 @@ def get_holes(db: Session, skip: int = 0, limit: int = 100):
     return db.query(Hole).offset(skip).limit(limit).all()
 
 
-def create_hole(db: Session, hole: HoleCreate) -> Hole:
+def get_layout_holes(db: Session, layout_id: int) -> list[Hole]:
+    return db.query(Hole).filter(Hole.layout_id == layout_id).order_by(Hole.id).all()
+
+
+def create_hole(db: Session, layout_id: int, hole: HoleCreate) -> Hole | None:
+    db_layout = db.get(CourseLayout, layout_id)
+    if db_layout is None:
+        return None
     db_hole = Hole(**hole.model_dump())
-    db.add(db_hole)
+    db_layout.holes.append(db_hole)
+    refresh_layout_metrics(db_layout)
     db.commit()
     db.refresh(db_hole)
     return db_hole
@@ -29,6 +48,7 @@ def update_hole(db: Session, hole_id: int, hole: HoleUpdate) -> Hole | None:
     if db_hole:
         for key, value in hole.model_dump(exclude_unset=True).items():
             setattr(db_hole, key, value)
+        refresh_layout_metrics(db_hole.layout)
         db.commit()
         db.refresh(db_hole)
     return db_hole
@@ -37,6 +57,79 @@ def update_hole(db: Session, hole_id: int, hole: HoleUpdate) -> Hole | None:
 def delete_hole(db: Session, hole_id: int) -> Hole | None:
     db_hole = db.query(Hole).filter(Hole.id == hole_id).first()
     if db_hole:
-        db.delete(db_hole)
+        db_layout = db_hole.layout
+        db_layout.holes.remove(db_hole)
+        refresh_layout_metrics(db_layout)
         db.commit()
     return db_hole
+
+
+def patch_holes(
+    db: Session, patches: list[HolePatch], layout_id: int | None = None
+) -> list[Hole] | None:
+    """
+    Apply partial updates to many holes in one transaction and one UPDATE.
+    :param patches: One patch per hole; unset fields keep their value.
+    :param layout_id: If given, every hole must belong to this layout.
+    :return: The updated holes, or None if a hole does not exist (or is not
+        on the layout).
+    """
+    ids = [patch.id for patch in patches]
+    owners = dict(
+        db.execute(select(Hole.id, Hole.layout_id).where(Hole.id.in_(ids))).all()
+    )
+    if len(owners) != len(ids):
+        return None
+    if layout_id is not None and set(owners.values()) != {layout_id}:
+        return None
+
+    fields = [
+        field
+        for field in PATCHABLE_FIELDS
+        if any(field in patch.model_fields_set for patch in patches)
+    ]
+    if fields:
+        # Fields set on only some patches carry a flag saying whether to use
+        # the patched value or keep the current one.
+        partial = [
+            field
+            for field in fields
+            if not all(field in patch.model_fields_set for patch in patches)
+        ]
+        columns = [column("id", Hole.id.type)]
+        columns += [column(field, getattr(Hole, field).type) for field in fields]
+        columns += [column(f"{field}_set", Boolean) for field in partial]
+        rows = [
+            (
+                patch.id,
+                *(getattr(patch, field) for field in fields),
+                *(field in patch.model_fields_set for field in partial),
+            )
+            for patch in patches
+        ]
+        patch_values = values(*columns, name="hole_patch").data(rows).cte()
+        assignments = {}
+        for field in fields:
+            current = getattr(Hole, field)
+            # Cast so an all-NULL VALUES column still has the column's type.
+            patched = cast(patch_values.c[field], current.type)
+            if field in partial:
+                patched = case((patch_values.c[f"{field}_set"], patched), else_=current)
+            assignments[field] = patched
+        db.execute(
+            update(Hole)
+            .where(Hole.id == patch_values.c.id)
+            .values(assignments)
+            .execution_options(synchronize_session=False)
+        )
+
+    layouts = db.scalars(
+        select(CourseLayout)
+        .where(CourseLayout.id.in_(set(owners.values())))
+        .options(selectinload(CourseLayout.holes))
+        .execution_options(populate_existing=True)
+    )
+    for db_layout in layouts:
+        refresh_layout_metrics(db_layout)
+    db.commit()
+    return db.scalars(select(Hole).where(Hole.id.in_(ids)).order_by(Hole.id)).all()
@@ -0,0 +1,106 @@
+"""
+Per-hole scoring analytics for course layouts.
+
+The packed hole scores of every matching round are fetched in one query and
+stacked into a (rounds, holes) matrix with ``hole_score_matrix``. Per-hole
+counts, stroke sums and birdie/par/bogey tallies are then column reductions
+over that matrix, without a Python loop over scores.
+"""
+
+import numpy as np
+from sqlalchemy import select, type_coerce
+from sqlalchemy.orm import Session
+
+from src.models import CourseLayout, EventResult, Hole
+from src.models.hole_score import MISSING_STROKES, HoleScores, hole_score_matrix
+from src.schemas.holes import HoleStats, LayoutHoleStats
+
+
+def _share(tally: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    tally / counts per hole, NaN for holes without scores.
+    """
+    return np.divide(tally, counts, out=np.full(len(counts), np.nan), where=counts > 0)
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+def get_layout_hole_stats(
+    db: Session,
+    course_layout_id: int,
+    disc_event_id: int | None = None,
+    division: str | None = None,
+) -> LayoutHoleStats | None:
+    """
+    Scoring average, birdie/par/bogey rates and difficulty rank of each hole
+    of a layout, optionally limited to one disc event and division.
+    :return: The statistics, or None if the layout does not exist.
+    """
+    layout = db.get(CourseLayout, course_layout_id)
+    if layout is None:
+        return None
+    holes = db.scalars(
+        select(Hole).where(Hole.layout_id == course_layout_id).order_by(Hole.id)
+    ).all()
+
+    filters = [
+        EventResult.course_layout_id == course_layout_id,
+        EventResult.hole_strokes.is_not(None),
+    ]
+    if disc_event_id is not None:
+        filters.append(EventResult.disc_event_id == disc_event_id)
+    if division is not None:
+        filters.append(EventResult.division == division)
+    packed = type_coerce(EventResult.hole_strokes, HoleScores(raw=True))
+    matrix = hole_score_matrix(db.scalars(select(packed).where(*filters)))
+    if matrix.shape[1] < len(holes):
+        matrix = hole_score_matrix(matrix, len(holes))
+    hole_count = matrix.shape[1]
+
+    par = np.full(hole_count, np.nan)
+    par[: len(holes)] = [np.nan if hole.par is None else hole.par for hole in holes]
+    scored = matrix != MISSING_STROKES
+    to_par = np.where(scored, matrix - par, np.nan)
+    counts = scored.sum(axis=0)
+    averages = _share(matrix.sum(axis=0, dtype=np.int64), counts)
+    averages_to_par = averages - par
+    # Rates are only meaningful for holes with a known par.
+    no_par = np.isnan(par)
+    birdie_rates = np.where(no_par, np.nan, _share((to_par <= -1).sum(axis=0), counts))
+    par_rates = np.where(no_par, np.nan, _share((to_par == 0).sum(axis=0), counts))
+    bogey_rates = np.where(no_par, np.nan, _share((to_par >= 1).sum(axis=0), counts))
+    # Rank holes by scoring relative to par, or by raw average without par.
+    difficulty = np.where(no_par, averages, averages_to_par)
+    ranked = [
+        int(index)
+        for index in np.argsort(-difficulty, kind="stable")
+        if not np.isnan(difficulty[index])
+    ]
+    ranks = {index: rank for rank, index in enumerate(ranked, start=1)}
+
+    hole_stats = []
+    for index in range(hole_count):
+        hole = holes[index] if index < len(holes) else None
+        hole_stats.append(
+            HoleStats(
+                hole_number=index + 1,
+                hole_name=hole.hole_name if hole else None,
+                par=hole.par if hole else None,
+                rounds=int(counts[index]),
+                scoring_average=_optional(averages[index]),
+                average_to_par=_optional(averages_to_par[index]),
+                birdie_rate=_optional(birdie_rates[index]),
+                par_rate=_optional(par_rates[index]),
+                bogey_rate=_optional(bogey_rates[index]),
+                difficulty_rank=ranks.get(index),
+            )
+        )
+    return LayoutHoleStats(
+        course_layout_id=course_layout_id,
+        disc_event_id=disc_event_id,
+        division=division,
+        rounds=int(scored.any(axis=1).sum()),
+        holes=hole_stats,
+    )
@@ -0,0 +1,152 @@
+"""
+Per-division leaderboards of disc events.
+
+`refresh_leaderboard` rebuilds the event_leaderboard rows of the divisions
+whose results changed with one DELETE and one ``INSERT ... SELECT`` ranking
+the results with ``ROW_NUMBER()``. Every write to event results calls it
+before committing, so `get_leaderboard` reads a page of every division of an
+event (ranks skip + 1 to skip + limit) as one range scan of the table's
+primary key. `get_division_pages` pages divisions across all events, ranking
+with ``ROW_NUMBER()`` at query time. Either way a division is never split
+across pages, and only the page's rows are loaded.
+
+Both functions take a Session or a Connection, so the bulk loader can
+refresh leaderboards inside its own transaction.
+"""
+
+from collections.abc import Iterable
+from itertools import groupby
+
+from sqlalchemy import Connection, delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from src.models import EventResult, LeaderboardEntry
+
+entries_table = LeaderboardEntry.__table__
+results_table = EventResult.__table__
+
+
+def refresh_leaderboard(
+    db: Session | Connection,
+    disc_event_id: int,
+    divisions: Iterable[str] | None = None,
+) -> None:
+    """
+    Rebuild the leaderboard of a disc event from its results.
+    :param disc_event_id: Disc event whose results changed.
+    :param divisions: Divisions whose results changed; all when None.
+    """
+    entry_scope = [entries_table.c.disc_event_id == disc_event_id]
+    result_scope = [results_table.c.disc_event_id == disc_event_id]
+    if divisions is not None:
+        divisions = set(divisions)
+        entry_scope.append(entries_table.c.division.in_(divisions))
+        result_scope.append(results_table.c.division.in_(divisions))
+    db.execute(delete(entries_table).where(*entry_scope))
+    rank = func.row_number().over(
+        partition_by=results_table.c.division,
+        order_by=(results_table.c.position_raw.asc().nulls_last(), results_table.c.id),
+    )
+    db.execute(
+        insert(entries_table).from_select(
+            ["disc_event_id", "division", "rank", "event_result_id"],
+            select(
+                results_table.c.disc_event_id,
+                results_table.c.division,
+                rank,
+                results_table.c.id,
+            ).where(*result_scope),
+        )
+    )
+
+
+def _group_by_division(rows) -> list[tuple[str, list[EventResult]]]:
+    return [
+        (division, [result for result, _ in group])
+        for division, group in groupby(rows, key=lambda row: row[1])
+    ]
+
+
+def get_leaderboard(
+    db: Session,
+    disc_event_id: int,
+    skip: int = 0,
+    limit: int = 100,
+    divisions: Iterable[str] | None = None,
+) -> list[tuple[str, list[EventResult]]]:
+    """
+    A page of each division of a disc event: the results ranked skip + 1 to
+    skip + limit, by division. Divisions with no results on the page are
+    left out.
+    :param divisions: Only these divisions; all of them when None.
+    """
+    query = (
+        select(EventResult, LeaderboardEntry.division)
+        .join(LeaderboardEntry, LeaderboardEntry.event_result_id == EventResult.id)
+        .where(
+            LeaderboardEntry.disc_event_id == disc_event_id,
+            LeaderboardEntry.rank > skip,
+            LeaderboardEntry.rank <= skip + limit,
+        )
+        .order_by(LeaderboardEntry.division, LeaderboardEntry.rank)
+    )
+    if divisions is not None:
+        query = query.where(LeaderboardEntry.division.in_(list(divisions)))
+    return _group_by_division(db.execute(query))
+
+
+def get_standings(
+    db: Session,
+    disc_event_id: int,
+    limit: int,
+    divisions: Iterable[str] | None = None,
+) -> dict[str, list[EventResult]]:
+    """
+    The top results of a disc event's divisions in leaderboard order, by
+    division.
+    :param divisions: Only these divisions, with an empty list for one that
+        has no results; all divisions with results when None.
+    """
+    leaderboard = dict(
+        get_leaderboard(db, disc_event_id, limit=limit, divisions=divisions)
+    )
+    if divisions is None:
+        return leaderboard
+    return {division: leaderboard.get(division, []) for division in sorted(divisions)}
+
+
+def get_leaderboard_divisions(db: Session, disc_event_id: int) -> list[str]:
+    return list(
+        db.scalars(
+            select(LeaderboardEntry.division)
+            .where(LeaderboardEntry.disc_event_id == disc_event_id)
+            .distinct()
+            .order_by(LeaderboardEntry.division)
+        )
+    )
+
+
+def get_division_pages(
+    db: Session, skip: int = 0, limit: int = 100
+) -> list[tuple[str, list[EventResult]]]:
+    """
+    A page of each division across all disc events: the results ranked
+    skip + 1 to skip + limit by position_raw (without one last), by division.
+    """
+    ranked = select(
+        EventResult.id,
+        EventResult.division,
+        func.row_number()
+        .over(
+            partition_by=EventResult.division,
+            order_by=(EventResult.position_raw.asc().nulls_last(), EventResult.id),
+        )
+        .label("rank"),
+    ).subquery()
+    rows = db.execute(
+        select(EventResult, ranked.c.division)
+        .join(ranked, ranked.c.id == EventResult.id)
+        .where(ranked.c.rank > skip, ranked.c.rank <= skip + limit)
+        .order_by(ranked.c.division, ranked.c.rank)
+    )
+    return _group_by_division(rows)
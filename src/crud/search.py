@@ -0,0 +1,279 @@
+"""Search across courses, disc events and players.
+
+Results are ranked by trigram word similarity: the share of the query's
+trigrams that appear in the matched text. A misspelled query still shares
+most trigrams with the intended name, so typos rank close to exact matches.
+
+On Postgres the candidates and scores come from pg_trgm (``<%`` and
+``word_similarity``), served by GIN trigram indexes. On SQLite the FTS5
+trigram indexes first return rows containing every query word. If that finds
+too few rows, a typo-tolerant pass returns rows sharing any of the query's
+selective trigrams, ranked by bm25. Trigrams found in a large share of rows
+(such as "par" in "park") are skipped; their counts are read in one query
+from the index's fts5vocab table.
+Candidates from both passes are then scored in Python with the same
+word-similarity measure.
+"""
+
+import re
+from functools import lru_cache
+
+from sqlalchemy import bindparam, func, literal, or_, select, text
+from sqlalchemy.orm import Session
+
+from src.models import Course, DiscEvent, EventResult
+
+MIN_SIMILARITY = 0.3
+CANDIDATES_PER_RESULT = 5
+MAX_TRIGRAM_DOC_SHARE = 0.02
+MIN_SELECTIVE_TRIGRAMS = 3
+_WORD = re.compile(r"[^\W_]+")
+
+
+@lru_cache(maxsize=4096)
+def _trigrams(value: str) -> frozenset[str]:
+    """
+    pg_trgm-style trigrams: each word lower-cased and padded with two spaces
+    in front and one behind.
+    """
+    grams = set()
+    for word in _WORD.findall(value.lower()):
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return frozenset(grams)
+
+
+def word_similarity(query: str | frozenset[str], value: str | None) -> float:
+    """
+    Share of the query's trigrams that occur in value, between 0 and 1.
+    :param query: Query text, or its precomputed trigrams.
+    :param value: Text to compare against.
+    """
+    query_grams = _trigrams(query) if isinstance(query, str) else query
+    if not query_grams or not value:
+        return 0.0
+    return len(query_grams & _trigrams(value)) / len(query_grams)
+
+
+def _fts_phrase(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _selective_trigrams(
+    db: Session, fts_table: str, source: str, grams: set[str]
+) -> list[str]:
+    """
+    Drop trigrams that occur in more than MAX_TRIGRAM_DOC_SHARE of the indexed
+    rows, keeping at least the MIN_SELECTIVE_TRIGRAMS rarest ones. The number
+    of rows holding each trigram is read from the index's vocabulary table.
+    """
+    total = db.execute(text(f"SELECT max(id) FROM {source}")).scalar() or 0
+    cap = max(int(total * MAX_TRIGRAM_DOC_SHARE), 1)
+    counts = text(
+        f"SELECT term, doc FROM {fts_table}_vocab WHERE term IN :grams"
+    ).bindparams(bindparam("grams", expanding=True))
+    doc_counts = dict(db.execute(counts, {"grams": sorted(grams)}).all())
+    by_rarity = sorted(doc_counts, key=lambda gram: (doc_counts[gram], gram))
+    selective = [gram for gram in by_rarity if doc_counts[gram] <= cap]
+    if len(selective) >= MIN_SELECTIVE_TRIGRAMS:
+        return selective
+    return by_rarity[:MIN_SELECTIVE_TRIGRAMS]
+
+
+def _fts_candidates(
+    db: Session, fts_table: str, source: str, query: str, limit: int, enough: int
+) -> list:
+    """
+    Row ids of likely matches: rows containing every query word, then, unless
+    that found enough rows, rows sharing selective trigrams with the query.
+    """
+    words = [word for word in _WORD.findall(query.lower()) if len(word) >= 3]
+    if not words:
+        return []
+    # Every row of the exact pass contains all words, so skip bm25 ranking.
+    exact = text(
+        f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :match LIMIT :limit"
+    )
+    match = " AND ".join(_fts_phrase(word) for word in words)
+    ids = [row[0] for row in db.execute(exact, {"match": match, "limit": limit})]
+    if len(ids) >= enough:
+        return ids
+
+    grams = {word[i : i + 3] for word in words for i in range(len(word) - 2)}
+    selective = _selective_trigrams(db, fts_table, source, grams)
+    if not selective:
+        return ids
+    fuzzy = text(
+        f"SELECT rowid FROM {fts_table} WHERE {fts_table} MATCH :match "
+        "ORDER BY rank LIMIT :limit"
+    )
+    match = " OR ".join(_fts_phrase(gram) for gram in selective)
+    for row in db.execute(fuzzy, {"match": match, "limit": limit}):
+        if row[0] not in ids:
+            ids.append(row[0])
+    return ids
+
+
+def _ranked(results: list[dict], limit: int) -> list[dict]:
+    results = [result for result in results if result["score"] >= MIN_SIMILARITY]
+    results.sort(key=lambda result: (-result["score"], result["label"]))
+    return results[:limit]
+
+
+def _search_sqlite(db: Session, query: str, limit: int) -> list[dict]:
+    candidates = limit * CANDIDATES_PER_RESULT
+    query_grams = _trigrams(query)
+    results = []
+
+    course_ids = _fts_candidates(db, "courses_fts", "courses", query, candidates, limit)
+    for course in db.scalars(select(Course).where(Course.id.in_(course_ids))):
+        score = max(
+            word_similarity(query_grams, course.name),
+            word_similarity(query_grams, course.city),
+            word_similarity(query_grams, course.state),
+        )
+        detail = ", ".join(part for part in (course.city, course.state) if part)
+        results.append(
+            {
+                "kind": "course",
+                "id": course.id,
+                "label": course.name,
+                "detail": detail or None,
+                "score": score,
+            }
+        )
+
+    event_ids = _fts_candidates(
+        db, "disc_events_fts", "disc_events", query, candidates, limit
+    )
+    for disc_event in db.scalars(select(DiscEvent).where(DiscEvent.id.in_(event_ids))):
+        results.append(
+            {
+                "kind": "disc_event",
+                "id": disc_event.id,
+                "label": disc_event.name,
+                "detail": None,
+                "score": word_similarity(query_grams, disc_event.name),
+            }
+        )
+
+    # One row per round result: over-fetch, then keep one hit per username.
+    result_ids = _fts_candidates(
+        db, "players_fts", "event_results", query, candidates * 4, limit
+    )
+    players: dict[str, dict] = {}
+    rows = db.execute(
+        select(EventResult.username, EventResult.name)
+        .where(EventResult.id.in_(result_ids))
+        .distinct()
+    )
+    for username, name in rows:
+        score = max(
+            word_similarity(query_grams, username), word_similarity(query_grams, name)
+        )
+        best = players.get(username)
+        if best is None or score > best["score"]:
+            players[username] = {
+                "kind": "player",
+                "id": None,
+                "label": username,
+                "detail": name,
+                "score": score,
+            }
+    results.extend(players.values())
+    return _ranked(results, limit)
+
+
+def _search_postgres(db: Session, query: str, limit: int) -> list[dict]:
+    # Let <% match down to the same similarity the results are filtered at.
+    db.execute(
+        select(
+            func.set_config(
+                "pg_trgm.word_similarity_threshold", str(MIN_SIMILARITY), True
+            )
+        )
+    )
+    q = literal(query)
+    results = []
+
+    course_score = func.greatest(
+        func.word_similarity(q, Course.name),
+        func.word_similarity(q, func.coalesce(Course.city, "")),
+        func.word_similarity(q, func.coalesce(Course.state, "")),
+    ).label("score")
+    rows = db.execute(
+        select(Course.id, Course.name, Course.city, Course.state, course_score)
+        .where(
+            or_(
+                q.op("<%")(Course.name),
+                q.op("<%")(Course.city),
+                q.op("<%")(Course.state),
+            )
+        )
+        .order_by(course_score.desc())
+        .limit(limit)
+    )
+    for course_id, name, city, state, score in rows:
+        detail = ", ".join(part for part in (city, state) if part)
+        results.append(
+            {
+                "kind": "course",
+                "id": course_id,
+                "label": name,
+                "detail": detail or None,
+                "score": score,
+            }
+        )
+
+    event_score = func.word_similarity(q, DiscEvent.name).label("score")
+    rows = db.execute(
+        select(DiscEvent.id, DiscEvent.name, event_score)
+        .where(q.op("<%")(DiscEvent.name))
+        .order_by(event_score.desc())
+        .limit(limit)
+    )
+    for disc_event_id, name, score in rows:
+        results.append(
+            {
+                "kind": "disc_event",
+                "id": disc_event_id,
+                "label": name,
+                "detail": None,
+                "score": score,
+            }
+        )
+
+    player_score = func.max(
+        func.greatest(
+            func.word_similarity(q, EventResult.username),
+            func.word_similarity(q, EventResult.name),
+        )
+    ).label("score")
+    rows = db.execute(
+        select(EventResult.username, func.max(EventResult.name), player_score)
+        .where(or_(q.op("<%")(EventResult.username), q.op("<%")(EventResult.name)))
+        .group_by(EventResult.username)
+        .order_by(player_score.desc())
+        .limit(limit)
+    )
+    for username, name, score in rows:
+        results.append(
+            {
+                "kind": "player",
+                "id": None,
+                "label": username,
+                "detail": name,
+                "score": score,
+            }
+        )
+    return _ranked(results, limit)
+
+
+def search(db: Session, query: str, limit: int = 20) -> list[dict]:
+    """
+    Ranked, typo-tolerant search over course names, cities and states, disc
+    event names, and player usernames and names.
+    """
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, query, limit)
+    return _search_sqlite(db, query, limit)
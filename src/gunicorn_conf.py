@@ -0,0 +1,39 @@
+"""
+Gunicorn server hooks, loaded by start_app.py along with --preload.
+
+With --preload the master imports the app once and forks the workers from
+it, so workers share the imported modules copy-on-write and start without
+importing anything themselves.
+"""
+
+import gc
+
+from src.core.db import engine, replica_router
+from src.core.jobs import check_job_backend
+from src.core.lazy import load_lazy_modules
+
+
+def on_starting(server):
+    """
+    Refuse a job backend that cannot be shared by the configured workers.
+    """
+    check_job_backend(server.cfg.workers)
+
+
+def when_ready(unused_server):
+    """
+    Finish importing in the master, just before the workers are forked.
+    """
+    load_lazy_modules()
+    # Keep the garbage collector from writing to (and so copying) the pages
+    # of objects that exist at fork time.
+    gc.freeze()
+
+
+def post_fork(unused_server, unused_worker):
+    """
+    Give each worker its own connection pools: a connection opened by the
+    master must not be used from several processes.
+    """
+    for db_engine in [engine, *replica_router.engines]:
+        db_engine.dispose(close=False)
@@ -0,0 +1,31 @@
+"""
+Background jobs of the API, run by src.core.jobs.job_queue.
+"""
+
+from src.core import job_queue
+from src.crud import recompute_points
+from src.crud.leaderboard import refresh_leaderboard
+
+
+@job_queue.task("recompute_disc_event")
+def recompute_disc_event(disc_event_id: int) -> dict[str, int]:
+    """
+    Recompute the round points and rebuild the leaderboard of a disc event.
+    :return: Number of results recomputed.
+    """
+    with job_queue.session_factory() as db:
+        updated = recompute_points(db, disc_event_id)
+        refresh_leaderboard(db, disc_event_id)
+        db.commit()
+    return {"event_results": updated}
+
+
+def enqueue_recompute(disc_event_id: int) -> dict:
+    """
+    Queue a recompute of a disc event, or return the one already in flight.
+    """
+    return job_queue.enqueue(
+        "recompute_disc_event",
+        {"disc_event_id": disc_event_id},
+        dedupe_key=f"recompute_disc_event:{disc_event_id}",
+    )
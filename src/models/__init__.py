@@ -8,8 +8,12 @@ from src.models.course_layout import CourseLayout
 from src.models.disc_event import DiscEvent
 from src.models.event_result import EventResult
 from src.models.hole import Hole
+from src.models.leaderboard import LeaderboardEntry
+from src.models.search import register_search_ddl
 from src.models.user import User
 
+register_search_ddl(Base.metadata)
+
 __all__ = [
     "Base",
     "User",
@@ -18,4 +22,5 @@ __all__ = [
     "Hole",
     "EventResult",
     "DiscEvent",
+    "LeaderboardEntry",
 ]
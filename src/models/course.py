@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, Integer, String
+from sqlalchemy import Float, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -21,6 +21,16 @@ class Course(Base):
     """
 
     __tablename__ = "courses"
+    __table_args__ = (
+        Index("ix_courses_latitude_longitude", "latitude", "longitude"),
+        # Core Postgres GiST over a point (no PostGIS needed); backs the
+        # bounding box and nearest-first ordering of get_nearby_courses.
+        Index(
+            "ix_courses_location_gist",
+            text("point(longitude, latitude)"),
+            postgresql_using="gist",
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, index=True, nullable=False, autoincrement=True
@@ -34,9 +44,11 @@ class Course(Base):
     holes: Mapped[int | None] = mapped_column(Integer, nullable=True)
     rating: Mapped[float | None] = mapped_column(Float, nullable=True)
     reviews_count: Mapped[int | None] = mapped_column(Integer, nullable=True)
-    link: Mapped[str | None] = mapped_column(String, nullable=True)
+    link: Mapped[str | None] = mapped_column(String, nullable=True, index=True)
     conditions: Mapped[str | None] = mapped_column(String, nullable=True)
     conditions_updated: Mapped[str | None] = mapped_column(String, nullable=True)
+    latitude: Mapped[float | None] = mapped_column(Float, nullable=True)
+    longitude: Mapped[float | None] = mapped_column(Float, nullable=True)
 
     layouts: Mapped[list["CourseLayout"]] = relationship(
         "CourseLayout", back_populates="course", cascade="all, delete-orphan"
@@ -6,7 +6,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Float, ForeignKey, Integer, String
+from sqlalchemy import JSON, Float, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -20,6 +20,11 @@ if TYPE_CHECKING:
 class CourseLayout(Base):
     """
     SQL model for disc golf course layouts
+
+    par and length are the values given for the layout. hole_count,
+    total_par, total_distance, average_hole_length and par_distribution
+    (number of holes per par, keyed by par) are derived from the holes and
+    refreshed whenever the layout's holes are written.
     """
 
     __tablename__ = "course_layouts"
@@ -31,6 +36,13 @@ class CourseLayout(Base):
     par: Mapped[int | None] = mapped_column(Integer, nullable=True)
     length: Mapped[float | None] = mapped_column(Float, nullable=True)
     difficulty: Mapped[str | None] = mapped_column(String, nullable=True)
+    hole_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    total_par: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    total_distance: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    average_hole_length: Mapped[float | None] = mapped_column(Float, nullable=True)
+    par_distribution: Mapped[dict[str, int] | None] = mapped_column(JSON, nullable=True)
 
     course_id: Mapped[int] = mapped_column(ForeignKey("courses.id"), nullable=False)
 
@@ -10,7 +10,7 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Integer, String
+from sqlalchemy import DateTime, Index, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
@@ -34,6 +34,9 @@ class DiscEvent(Base):
     """
 
     __tablename__ = "disc_events"
+    __table_args__ = (
+        Index("ix_disc_events_start_date_end_date", "start_date", "end_date"),
+    )
 
     id: Mapped[int] = mapped_column(
         Integer,
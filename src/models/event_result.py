@@ -11,10 +11,24 @@ from __future__ import annotations
 import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String, UniqueConstraint
+import numpy as np
+from sqlalchemy import (
+    DateTime,
+    Float,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from src.models.base import Base
+from src.models.hole_score import (
+    HoleScores,
+    encode_hole_scores,
+    hole_score_list,
+)
 
 if TYPE_CHECKING:
     from src.models.course_layout import CourseLayout
@@ -40,11 +54,18 @@ class EventResult(Base):
         course_layout_id (int): The foreign key referencing the CourseLayout model.
         course_layout (CourseLayout): The CourseLayout associated with the event
         round_points (float): The points earned by the player for the round.
+        hole_strokes (np.ndarray | None): Packed strokes per hole in playing
+        order, 0 for holes without a score, stored in the hole_scores column.
+        hole_scores (list[int | None]): hole_strokes as a list, None for holes
+        without a score.
     """
 
     __tablename__ = "event_results"
     __table_args__ = (
         UniqueConstraint("date", "username", name="uq_eventresult_date_username"),
+        Index(
+            "ix_event_results_division_position_raw", "division", "position_raw", "id"
+        ),
     )
     id: Mapped[int] = mapped_column(
         Integer, primary_key=True, index=True, autoincrement=True, nullable=False
@@ -61,6 +82,9 @@ class EventResult(Base):
     round_relative_score: Mapped[int] = mapped_column(Integer, nullable=False)
     round_total_score: Mapped[int] = mapped_column(Integer, nullable=False)
     round_points: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    hole_strokes: Mapped[np.ndarray | None] = mapped_column(
+        "hole_scores", HoleScores, nullable=True
+    )
 
     course_layout_id: Mapped[int] = mapped_column(
         ForeignKey("course_layouts.id"), nullable=False
@@ -75,3 +99,13 @@ class EventResult(Base):
     course_layout: Mapped["CourseLayout"] = relationship(
         "CourseLayout", back_populates="event_results"
     )
+
+    @property
+    def hole_scores(self) -> list[int | None]:
+        if self.hole_strokes is None:
+            return []
+        return hole_score_list(self.hole_strokes)
+
+    @hole_scores.setter
+    def hole_scores(self, strokes: list[int | None] | None) -> None:
+        self.hole_strokes = encode_hole_scores(strokes) if strokes else None
@@ -0,0 +1,129 @@
+"""
+Packed per-hole round scores.
+
+The strokes of a round are stored in a single ``hole_scores`` column on
+``event_results`` instead of one row per hole: a ``smallint[]`` on Postgres
+and, elsewhere (SQLite), a blob of one signed byte per hole. Holes are
+numbered from 1 in playing order and 0 marks a hole without a score.
+
+Blobs decode with ``np.frombuffer``, so reading a round's scores does not
+copy them, and ``hole_score_matrix`` stacks many rounds into one array for
+vectorized aggregation.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+from sqlalchemy import LargeBinary, SmallInteger
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.types import TypeDecorator
+
+MISSING_STROKES = 0
+HOLE_SCORE_DTYPE = np.int8
+
+
+def encode_hole_scores(strokes: Iterable[int | None]) -> np.ndarray:
+    """
+    Pack strokes in playing order into an int8 array, with None as 0.
+    """
+    return np.array(
+        [MISSING_STROKES if value is None else value for value in strokes],
+        dtype=HOLE_SCORE_DTYPE,
+    )
+
+
+def decode_hole_scores(value: bytes | memoryview | list | np.ndarray) -> np.ndarray:
+    """
+    Unpack stored hole scores. Blobs are wrapped without copying, so the
+    result is a read-only view of the column value.
+    """
+    if isinstance(value, (bytes, memoryview)):
+        return np.frombuffer(value, dtype=HOLE_SCORE_DTYPE)
+    return np.asarray(value, dtype=HOLE_SCORE_DTYPE)
+
+
+def hole_score_list(strokes: np.ndarray) -> list[int | None]:
+    """
+    Strokes as a list of ints, with None for holes without a score.
+    """
+    return [None if value == MISSING_STROKES else value for value in strokes.tolist()]
+
+
+def hole_score_matrix(
+    rounds: Iterable[np.ndarray | bytes], holes: int | None = None
+) -> np.ndarray:
+    """
+    Stack the hole scores of many rounds into a (rounds, holes) int8 array,
+    padding shorter rounds with MISSING_STROKES.
+    :param rounds: Decoded or stored hole scores, one entry per round.
+    :param holes: Number of columns; defaults to the longest round.
+    """
+    rounds = list(rounds)
+    lengths = np.fromiter(map(len, rounds), dtype=np.intp, count=len(rounds))
+    width = int(lengths.max(initial=0)) if holes is None else holes
+    if not rounds:
+        return np.full((0, width), MISSING_STROKES, dtype=HOLE_SCORE_DTYPE)
+    if all(isinstance(strokes, bytes) for strokes in rounds):
+        # Undecoded blobs: one join and a single frombuffer for all rounds.
+        flat = np.frombuffer(b"".join(rounds), dtype=HOLE_SCORE_DTYPE)
+    else:
+        flat = np.concatenate([decode_hole_scores(strokes) for strokes in rounds])
+    if (lengths == width).all():
+        return flat.reshape(len(rounds), width)
+    # Scatter all rounds at once: row and column index of every stored stroke.
+    matrix = np.full((len(rounds), width), MISSING_STROKES, dtype=HOLE_SCORE_DTYPE)
+    rows = np.repeat(np.arange(len(rounds)), lengths)
+    columns = np.arange(len(flat)) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    kept = columns < width
+    matrix[rows[kept], columns[kept]] = flat[kept]
+    return matrix
+
+
+class HoleScores(TypeDecorator):
+    """
+    Column type holding a round's hole scores as an int8 NumPy array:
+    ``smallint[]`` on Postgres, a blob of int8 values on other backends.
+    Lists of strokes (with None for unscored holes) are accepted on write.
+
+    ``HoleScores(raw=True)`` returns stored values undecoded, for bulk reads
+    passed straight to hole_score_matrix.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, raw: bool = False):
+        super().__init__()
+        self.raw = raw
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(ARRAY(SmallInteger))
+        return dialect.type_descriptor(LargeBinary())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        strokes = (
+            value.astype(HOLE_SCORE_DTYPE, copy=False)
+            if isinstance(value, np.ndarray)
+            else encode_hole_scores(value)
+        )
+        if dialect.name == "postgresql":
+            return strokes.tolist()
+        return strokes.tobytes()
+
+    def result_processor(self, dialect, coltype):
+        if self.raw:
+            return None
+        return super().result_processor(dialect, coltype)
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return decode_hole_scores(value)
+
+    def compare_values(self, x, y):
+        if x is None or y is None:
+            return x is y
+        return np.array_equal(x, y)
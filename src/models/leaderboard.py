@@ -0,0 +1,31 @@
+"""
+LeaderboardEntry model for the per-division leaderboards of disc events
+"""
+
+from sqlalchemy import ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.models.base import Base
+
+
+class LeaderboardEntry(Base):
+    """
+    One result's place on a disc event's division leaderboard.
+
+    The table is a projection of event_results in leaderboard order: rank
+    numbers a division's results from 1 by position_raw, results without a
+    position_raw last and ties by id. Rows are rebuilt per (disc event,
+    division) whenever that division's results change, and the primary key
+    serves grouped reads as a single range scan.
+    """
+
+    __tablename__ = "event_leaderboard"
+
+    disc_event_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("disc_events.id", ondelete="CASCADE"), primary_key=True
+    )
+    division: Mapped[str] = mapped_column(String, primary_key=True)
+    rank: Mapped[int] = mapped_column(Integer, primary_key=True)
+    event_result_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("event_results.id", ondelete="CASCADE"), nullable=False
+    )
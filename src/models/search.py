@@ -0,0 +1,113 @@
+"""
+Search indexes for courses, disc events and players.
+
+Postgres uses the pg_trgm extension with GIN trigram indexes on the searched
+columns. SQLite uses FTS5 tables with the trigram tokenizer, stored as
+external-content indexes over the source tables (so text is not duplicated)
+and kept in sync by triggers that only fire when an indexed column changes.
+An fts5vocab table over each index reads the document count of trigrams
+straight from the index.
+
+The DDL is attached to the metadata so ``create_all`` builds the indexes for
+whichever backend is in use; migration e1f5a9c3d7b2 creates them for existing
+databases and migration b5e2c7d9f4a1 adds the vocabulary tables and
+narrows the update triggers.
+"""
+
+from sqlalchemy import DDL, MetaData, event
+
+# (index table, source table, columns) for the SQLite FTS5 indexes.
+SQLITE_FTS_TABLES = [
+    ("courses_fts", "courses", ("name", "city", "state")),
+    ("disc_events_fts", "disc_events", ("name",)),
+    ("players_fts", "event_results", ("username", "name")),
+]
+
+# (index name, table, column) for the Postgres trigram indexes.
+POSTGRES_TRGM_INDEXES = [
+    ("ix_courses_name_trgm", "courses", "name"),
+    ("ix_courses_city_trgm", "courses", "city"),
+    ("ix_courses_state_trgm", "courses", "state"),
+    ("ix_disc_events_name_trgm", "disc_events", "name"),
+    ("ix_event_results_username_trgm", "event_results", "username"),
+    ("ix_event_results_name_trgm", "event_results", "name"),
+]
+
+
+def sqlite_fts_ddl(fts_table: str, source: str, columns: tuple[str, ...]) -> list:
+    """
+    Statements creating an external-content FTS5 trigram index over a table,
+    its sync triggers and vocabulary table, and populating it from existing
+    rows.
+    """
+    cols = ", ".join(columns)
+    new_values = ", ".join(f"new.{column}" for column in columns)
+    old_values = ", ".join(f"old.{column}" for column in columns)
+    insert_new = (
+        f"INSERT INTO {fts_table}(rowid, {cols}) VALUES (new.id, {new_values});"
+    )
+    delete_old = (
+        f"INSERT INTO {fts_table}({fts_table}, rowid, {cols}) "
+        f"VALUES ('delete', old.id, {old_values});"
+    )
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5({cols}, "
+        f"content='{source}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ai AFTER INSERT ON {source} "
+        f"BEGIN {insert_new} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_ad AFTER DELETE ON {source} "
+        f"BEGIN {delete_old} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_table}_au "
+        f"AFTER UPDATE OF {cols} ON {source} BEGIN {delete_old} {insert_new} END",
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table}_vocab "
+        f"USING fts5vocab({fts_table}, 'row')",
+        f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')",
+    ]
+
+
+def postgres_trgm_ddl(index: str, table: str, column: str) -> str:
+    """
+    Statement creating a GIN trigram index on a text column.
+    """
+    return (
+        f"CREATE INDEX IF NOT EXISTS {index} ON {table} "
+        f"USING gin ({column} gin_trgm_ops)"
+    )
+
+
+def _create_search_indexes(unused_metadata, connection, tables=(), **_) -> None:
+    """
+    after_create listener: index the searched tables that were just created,
+    so repeated create_all calls do not rebuild existing indexes.
+    """
+    created = {table.name for table in tables}
+    dialect = connection.dialect.name
+    if dialect == "postgresql":
+        for index, table, column in POSTGRES_TRGM_INDEXES:
+            if table in created:
+                connection.exec_driver_sql(postgres_trgm_ddl(index, table, column))
+    elif dialect == "sqlite":
+        for fts_table, source, columns in SQLITE_FTS_TABLES:
+            if source in created:
+                for statement in sqlite_fts_ddl(fts_table, source, columns):
+                    connection.exec_driver_sql(statement)
+
+
+def register_search_ddl(metadata: MetaData) -> None:
+    """
+    Create the search indexes when the searched tables are created, and drop
+    the SQLite FTS tables with them.
+    """
+    event.listen(
+        metadata,
+        "before_create",
+        DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+    )
+    event.listen(metadata, "after_create", _create_search_indexes)
+    for fts_table, *_ in SQLITE_FTS_TABLES:
+        for table in (f"{fts_table}_vocab", fts_table):
+            event.listen(
+                metadata,
+                "before_drop",
+                DDL(f"DROP TABLE IF EXISTS {table}").execute_if(dialect="sqlite"),
+            )
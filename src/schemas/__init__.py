@@ -4,10 +4,25 @@ Export Pydantic schemas for use in other modules.
 
 from src.schemas.course_layouts import (
     CourseLayoutCreate,
+    CourseLayoutPatch,
     CourseLayoutPublic,
     CourseLayoutsPublic,
+    CourseLayoutSummary,
+)
+from src.schemas.courses import (
+    CourseCreate,
+    CourseNearby,
+    CoursePatch,
+    CoursePublic,
+    CoursesCreate,
+    CoursesCreateResult,
+    CoursesNearbyPublic,
+    CoursesPublic,
+    CoursesSync,
+    CourseSync,
+    CourseSyncResult,
+    CourseUpdate,
 )
-from src.schemas.courses import CourseCreate, CoursePublic, CoursesPublic, CourseUpdate
 from src.schemas.disc_events import (
     DiscEventCreate,
     DiscEventPublic,
@@ -18,9 +33,23 @@ from src.schemas.event_results import (
     EventResultCreate,
     EventResultPublic,
     EventResultsPublic,
+    EventResultsSync,
     EventResultStats,
+    EventResultSyncResult,
+)
+from src.schemas.holes import (
+    HoleCreate,
+    HolePatch,
+    HolePublic,
+    HolesPatch,
+    HolesPublic,
+    HoleStats,
+    HoleUpdate,
+    LayoutHolePatch,
+    LayoutHoleStats,
 )
-from src.schemas.holes import HoleCreate, HolePublic, HoleUpdate
+from src.schemas.jobs import JobPublic
+from src.schemas.search import SearchResult, SearchResults
 from src.schemas.users import (
     Message,
     NewPassword,
@@ -36,6 +65,7 @@ from src.schemas.users import (
 )
 
 __all__ = [
+    "JobPublic",
     "UserCreate",
     "UserPublic",
     "Token",
@@ -51,10 +81,18 @@ __all__ = [
     "CourseLayoutPublic",
     "CourseLayoutCreate",
     "CourseLayoutsPublic",
+    "CourseLayoutSummary",
+    "CourseLayoutPatch",
     "CoursesPublic",
     "HoleCreate",
     "HoleUpdate",
     "HolePublic",
+    "HolesPublic",
+    "HolePatch",
+    "HolesPatch",
+    "HoleStats",
+    "LayoutHoleStats",
+    "LayoutHolePatch",
     "CoursePublic",
     "CourseLayoutsPublic",
     "EventResultBase",
@@ -65,5 +103,17 @@ __all__ = [
     "DiscEventCreate",
     "DiscEventUpdate",
     "CourseUpdate",
+    "CoursePatch",
+    "CourseSync",
+    "CoursesSync",
+    "CourseSyncResult",
+    "CoursesCreate",
+    "CoursesCreateResult",
+    "CourseNearby",
+    "CoursesNearbyPublic",
     "EventResultStats",
+    "EventResultsSync",
+    "EventResultSyncResult",
+    "SearchResult",
+    "SearchResults",
 ]
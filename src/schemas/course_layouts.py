@@ -2,9 +2,9 @@
 This file contains the Pydantic models for the CourseLayout model.
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from src.schemas.holes import HoleCreate, HolePublic
+from src.schemas.holes import HoleCreate, HolePublic, LayoutHolePatch
 
 
 class CourseLayoutBase(BaseModel):
@@ -20,6 +20,33 @@ class CourseLayoutCreate(CourseLayoutBase):
     holes: list[HoleCreate] = []
 
 
+class CourseLayoutPatch(BaseModel):
+    """
+    One layout in a course patch: with an id the layout is updated with the
+    fields sent, without one a new layout is created. When holes are sent
+    they replace the layout's holes: holes with an id are updated, holes
+    without one are created and holes left out are deleted.
+    """
+
+    id: int | None = None
+    name: str | None = None
+    par: int | None = None
+    length: float | None = None
+    difficulty: str | None = None
+    holes: list[LayoutHolePatch] | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def check_layout(self):
+        if self.name is None and (self.id is None or "name" in self.model_fields_set):
+            raise ValueError("name cannot be null")
+        hole_ids = [hole.id for hole in self.holes or [] if hole.id is not None]
+        if len(hole_ids) != len(set(hole_ids)):
+            raise ValueError("hole ids must be unique")
+        return self
+
+
 class CourseLayoutInDBBase(CourseLayoutBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -34,3 +61,17 @@ class CourseLayoutPublic(CourseLayoutInDBBase):
 class CourseLayoutsPublic(BaseModel):
     course_layouts: list[CourseLayoutPublic] = []
     count: int
+
+
+class CourseLayoutSummary(CourseLayoutInDBBase):
+    """Layout metrics derived from its holes, stored when the holes change."""
+
+    hole_count: int = Field(..., description="Number of holes")
+    total_par: int | None = Field(None, description="Sum of the holes' par")
+    total_distance: int | None = Field(None, description="Sum of the holes' distance")
+    average_hole_length: float | None = Field(
+        None, description="Mean distance of the holes with a distance"
+    )
+    par_distribution: dict[int, int] | None = Field(
+        None, description="Number of holes per par"
+    )
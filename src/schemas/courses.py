@@ -2,9 +2,13 @@
 This file contains the Pydantic models for the Course model.
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
-from src.schemas.course_layouts import CourseLayoutCreate, CourseLayoutPublic
+from src.schemas.course_layouts import (
+    CourseLayoutCreate,
+    CourseLayoutPatch,
+    CourseLayoutPublic,
+)
 
 
 class CourseBase(BaseModel):
@@ -24,6 +28,8 @@ class CourseBase(BaseModel):
     link: str | None = None
     conditions: str | None = None
     conditions_updated: str | None = None
+    latitude: float | None = None
+    longitude: float | None = None
 
     model_config = ConfigDict(extra="forbid")
 
@@ -36,6 +42,29 @@ class CourseUpdate(CourseBase):
     layouts: list[CourseLayoutCreate] = []
 
 
+class CoursePatch(CourseBase):
+    """
+    Partial course update. Only the fields sent are written. When layouts
+    are sent they replace the course's layouts: layouts with an id are
+    updated, layouts without one are created and layouts left out are
+    deleted with their holes.
+    """
+
+    name: str | None = None
+    layouts: list[CourseLayoutPatch] | None = None
+
+    @model_validator(mode="after")
+    def check_course(self):
+        if "name" in self.model_fields_set and self.name is None:
+            raise ValueError("name cannot be null")
+        layout_ids = [
+            layout.id for layout in self.layouts or [] if layout.id is not None
+        ]
+        if len(layout_ids) != len(set(layout_ids)):
+            raise ValueError("layout ids must be unique")
+        return self
+
+
 class CourseInDBBase(CourseBase):
     model_config = ConfigDict(from_attributes=True)
 
@@ -48,3 +77,60 @@ class CoursePublic(CourseInDBBase):
 
 class CoursesPublic(BaseModel):
     courses: list[CoursePublic] = []
+
+
+class CourseNearby(BaseModel):
+    """
+    Course summary with its distance from the search point
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    location: str | None = None
+    city: str | None = None
+    state: str | None = None
+    rating: float | None = None
+    reviews_count: int | None = None
+    link: str | None = None
+    latitude: float
+    longitude: float
+    distance_km: float
+
+
+class CoursesNearbyPublic(BaseModel):
+    courses: list[CourseNearby] = []
+
+
+class CoursesCreate(BaseModel):
+    courses: list[CourseCreate] = []
+
+
+class CoursesCreateResult(BaseModel):
+    """
+    Outcome of a bulk course import
+    """
+
+    created: int = 0
+    course_ids: list[int] = Field([], description="Ids of the created courses")
+    conflicts: list[str] = Field(
+        [], description="Names skipped because the course already exists"
+    )
+
+
+class CourseSync(CourseBase):
+    """
+    Scraped course fields. Only fields that are set are compared with, and
+    written to, the stored course.
+    """
+
+
+class CoursesSync(BaseModel):
+    courses: list[CourseSync] = []
+
+
+class CourseSyncResult(BaseModel):
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
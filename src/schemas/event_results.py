@@ -1,9 +1,14 @@
 """Pydantic schemas for disc golf event results."""
 
 import datetime
+from typing import Annotated
 
 from pydantic import BaseModel, ConfigDict, Field
 
+MAX_HOLES = 36
+
+HoleStrokes = Annotated[int, Field(ge=1, le=99)]
+
 
 class EventResultBase(BaseModel):
     """Base schema for EventResult containing shared attributes."""
@@ -28,6 +33,11 @@ class EventResultBase(BaseModel):
     round_points: float = Field(
         default=0.0, description="Points awarded for this round"
     )
+    hole_scores: list[HoleStrokes | None] = Field(
+        default=[],
+        max_length=MAX_HOLES,
+        description="Strokes per hole in playing order, null for unscored holes",
+    )
 
     model_config = ConfigDict(extra="forbid")
 
@@ -71,6 +81,26 @@ class EventResultsPublic(BaseModel):
     )
 
 
+class EventResultsSync(BaseModel):
+    """A batch of event results to upsert."""
+
+    event_results: list[EventResultCreate] = Field(
+        default=[], description="Event results, matched by username and day"
+    )
+
+
+class EventResultSyncResult(BaseModel):
+    """Outcome of an event result batch upsert."""
+
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rejected: list[int] = Field(
+        default=[],
+        description="Indexes of the results whose disc event does not exist",
+    )
+
+
 class DivisionResults(BaseModel):
     """Event results grouped for a single division, sorted by position_raw."""
 
@@ -81,6 +111,12 @@ class DivisionResults(BaseModel):
     )
 
 
+class DivisionStandings(DivisionResults):
+    """A division's live standings: its top results in leaderboard order."""
+
+    disc_event_id: int = Field(..., description="Disc event ID")
+
+
 class DivisionStats(BaseModel):
     """Statistics for a single division within an event."""
 
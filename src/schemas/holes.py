@@ -2,7 +2,7 @@
 This file contains the Pydantic models for the Hole model.
 """
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 
 class HoleBase(BaseModel):
@@ -30,3 +30,95 @@ class HoleInDBBase(HoleBase):
 
 class HolePublic(HoleInDBBase):
     pass
+
+
+class HolesPublic(BaseModel):
+    holes: list[HolePublic] = []
+    count: int
+
+
+class HolePatch(BaseModel):
+    """Partial update of one hole; only the fields sent are changed."""
+
+    id: int
+    hole_name: str | None = None
+    par: int | None = None
+    distance: int | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def check_required_fields(self):
+        for field in ("hole_name", "par"):
+            if field in self.model_fields_set and getattr(self, field) is None:
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class HolesPatch(BaseModel):
+    """Partial updates of many holes, applied in one transaction."""
+
+    holes: list[HolePatch] = Field(..., min_length=1, max_length=100)
+
+    @model_validator(mode="after")
+    def check_unique_ids(self):
+        ids = [hole.id for hole in self.holes]
+        if len(ids) != len(set(ids)):
+            raise ValueError("hole ids must be unique")
+        return self
+
+
+class LayoutHolePatch(BaseModel):
+    """
+    One hole in a nested layout patch: with an id the hole is updated with
+    the fields sent, without one a new hole is created.
+    """
+
+    id: int | None = None
+    hole_name: str | None = None
+    par: int | None = None
+    distance: int | None = None
+
+    model_config = ConfigDict(extra="forbid")
+
+    @model_validator(mode="after")
+    def check_required_fields(self):
+        for field in ("hole_name", "par"):
+            if getattr(self, field) is None and (
+                self.id is None or field in self.model_fields_set
+            ):
+                raise ValueError(f"{field} cannot be null")
+        return self
+
+
+class HoleStats(BaseModel):
+    """Scoring statistics for one hole of a layout."""
+
+    hole_number: int = Field(..., description="Hole number in playing order")
+    hole_name: str | None = Field(None, description="Name of the layout's hole")
+    par: int | None = Field(None, description="Par of the layout's hole")
+    rounds: int = Field(..., description="Number of scores recorded on the hole")
+    scoring_average: float | None = Field(None, description="Mean strokes")
+    average_to_par: float | None = Field(
+        None, description="Mean strokes relative to par"
+    )
+    birdie_rate: float | None = Field(
+        None, description="Share of scores at birdie or better"
+    )
+    par_rate: float | None = Field(None, description="Share of scores at par")
+    bogey_rate: float | None = Field(
+        None, description="Share of scores at bogey or worse"
+    )
+    difficulty_rank: int | None = Field(
+        None, description="1 for the hole playing hardest relative to par"
+    )
+
+
+class LayoutHoleStats(BaseModel):
+    """Per-hole scoring statistics for a course layout."""
+
+    course_layout_id: int
+    disc_event_id: int | None = Field(None, description="Disc event filter, if any")
+    division: str | None = Field(None, description="Division filter, if any")
+    rounds: int = Field(..., description="Number of rounds with hole scores")
+    holes: list[HoleStats] = []
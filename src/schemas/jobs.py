@@ -0,0 +1,25 @@
+"""
+Pydantic models for background jobs.
+"""
+
+import datetime
+from typing import Any, Literal
+
+from pydantic import BaseModel, Field
+
+
+class JobPublic(BaseModel):
+    """A background job and, once it has finished, its outcome."""
+
+    id: str
+    name: str = Field(..., description="Task the job runs")
+    status: Literal["queued", "running", "succeeded", "failed"]
+    attempts: int = Field(..., description="Times the task has been started")
+    max_attempts: int
+    dedupe_key: str | None = Field(
+        None, description="Only one job per key is queued or running at a time"
+    )
+    result: Any = Field(None, description="What the task returned")
+    error: str | None = Field(None, description="Error of the latest attempt")
+    created_at: datetime.datetime
+    updated_at: datetime.datetime
@@ -0,0 +1,25 @@
+"""
+Pydantic models for search results.
+"""
+
+from typing import Literal
+
+from pydantic import BaseModel
+
+
+class SearchResult(BaseModel):
+    """
+    A course, disc event or player matching a search query. Players have no
+    id; their label is the username and their detail the player's name.
+    """
+
+    kind: Literal["course", "disc_event", "player"]
+    id: int | None = None
+    label: str
+    detail: str | None = None
+    score: float
+
+
+class SearchResults(BaseModel):
+    query: str
+    results: list[SearchResult] = []
@@ -5,14 +5,16 @@ Utility functions for sending emails and generating tokens.
 from datetime import datetime, timedelta, timezone
 
 import jwt
-from icecream import ic
 from jwt.exceptions import InvalidTokenError
 
 from src.core import security, settings
+from src.core.lazy import lazy_import
+
+icecream = lazy_import("icecream")
 
 
 def generate_password_reset_token(email: str) -> str:
-    ic()
+    icecream.ic()
     delta = timedelta(hours=settings.EMAIL_RESET_TOKEN_EXPIRE_HOURS)
     now = datetime.now(timezone.utc)
     expires = now + delta
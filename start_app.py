@@ -67,6 +67,9 @@ def run_startup_sequence():
             str(workers),
             "-k",
             "uvicorn.workers.UvicornWorker",
+            "--preload",
+            "--config",
+            "python:src.gunicorn_conf",
             "--bind",
             "0.0.0.0:8000",
         ]